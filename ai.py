@@ -31,7 +31,7 @@ from models.ashby import AshbyApiResponse
 from models.gh import GreenhouseJob
 from models.lever import LeverJob
 from models.workable import WorkableJob
-from pydantic import ValidationError
+import msgspec
 
 # Import extraction functions from extract_salary_experience.py
 from extract_salary_experience import (
@@ -1745,7 +1745,7 @@ def extract_ashby_jobs(json_file: Path, company_name: str) -> List[Dict]:
         with open(json_file, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        parsed = AshbyApiResponse(**data)
+        parsed = msgspec.convert(data, AshbyApiResponse, strict=False)
 
         # Build a mapping from jobUrl/applyUrl to raw job dict so we can
         # compute posted_at consistently from source timestamps.
@@ -1756,13 +1756,10 @@ def extract_ashby_jobs(json_file: Path, company_name: str) -> List[Dict]:
                 raw_jobs_by_url[url] = raw
 
         for job in parsed.jobs:
-            # Use model_dump to get snake_case keys (by_alias=False)
+            # Back to plain dicts (camelCase keys, as in the source JSON)
             comp_dict = None
             if job.compensation:
-                if hasattr(job.compensation, "model_dump"):
-                    comp_dict = job.compensation.model_dump(by_alias=False)
-                else:
-                    comp_dict = job.compensation.dict()
+                comp_dict = msgspec.to_builtins(job.compensation)
             comp_data = extract_compensation_data(comp_dict)
 
             # Handle multiple locations separated by semicolon
@@ -1796,7 +1793,7 @@ def extract_ashby_jobs(json_file: Path, company_name: str) -> List[Dict]:
                         "posted_at": posted_at,
                     }
                 )
-    except (json.JSONDecodeError, ValidationError) as e:
+    except (json.JSONDecodeError, msgspec.ValidationError) as e:
         print(f"Error parsing {json_file}: {e}", file=sys.stderr)
 
     return jobs
@@ -1942,8 +1939,8 @@ def extract_greenhouse_jobs(json_file: Path, company_name: str) -> List[Dict]:
 
         for job_data in job_list:
             try:
-                job = GreenhouseJob(**job_data)
-            except ValidationError:
+                job = msgspec.convert(job_data, GreenhouseJob, strict=False)
+            except msgspec.ValidationError:
                 continue
 
             location_str = (
@@ -2095,8 +2092,8 @@ def extract_lever_jobs(json_file: Path, company_name: str) -> List[Dict]:
 
         for job_data in job_list:
             try:
-                job = LeverJob(**job_data)
-            except ValidationError:
+                job = msgspec.convert(job_data, LeverJob, strict=False)
+            except msgspec.ValidationError:
                 continue
 
             location_str = ""
@@ -2147,7 +2144,7 @@ def extract_lever_jobs(json_file: Path, company_name: str) -> List[Dict]:
                         "posted_at": posted_at,
                     }
                 )
-    except (json.JSONDecodeError, ValidationError) as e:
+    except (json.JSONDecodeError, msgspec.ValidationError) as e:
         print(f"Error parsing {json_file}: {e}", file=sys.stderr)
 
     return jobs
@@ -2170,8 +2167,8 @@ def extract_workable_jobs(json_file: Path, company_name: str) -> List[Dict]:
 
         for job_data in job_list:
             try:
-                job = WorkableJob(**job_data)
-            except ValidationError:
+                job = msgspec.convert(job_data, WorkableJob, strict=False)
+            except msgspec.ValidationError:
                 continue
 
             # Extract location from locations list
@@ -2227,7 +2224,7 @@ def extract_workable_jobs(json_file: Path, company_name: str) -> List[Dict]:
                         "posted_at": posted_at,
                     }
                 )
-    except (json.JSONDecodeError, ValidationError) as e:
+    except (json.JSONDecodeError, msgspec.ValidationError) as e:
         print(f"Error parsing {json_file}: {e}", file=sys.stderr)
 
     return jobs
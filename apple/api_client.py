@@ -20,7 +20,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Represents a job location."""
     postLocationId: str
@@ -34,7 +34,7 @@ class Location:
     level: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Represents a team/department."""
     teamName: str
@@ -42,7 +42,7 @@ class Team:
     teamCode: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents an Apple job posting."""
     id: str
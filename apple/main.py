@@ -12,6 +12,9 @@ import sys
 import importlib.util
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+import ijson
 
 # Import api_client from the apple directory using importlib to avoid conflicts
 script_dir = Path(__file__).resolve().parent
@@ -23,6 +26,63 @@ spec.loader.exec_module(apple_api_client)
 AppleJobsAPI = apple_api_client.AppleJobsAPI
 
 
+# Number of jobs converted between progress lines
+PROGRESS_BATCH_SIZE = 500
+
+
+def _job_to_dict(job) -> dict:
+    """Convert an AppleJobsAPI Job into the dict stored in apple.json."""
+    # Fetch detailed job information (commented out for performance; needs the client)
+    # job = client.get_job_details(job)
+
+    # Handle multiple locations
+    locations = [loc.name for loc in job.locations] if job.locations else ["N/A"]
+
+    return {
+        "url": job.url,
+        "title": job.postingTitle,
+        "locations": locations,
+        "location": locations[0]
+        if locations
+        else "N/A",  # Keep first location for backward compatibility
+        "description": job.jobSummary,  # Use jobSummary from search results (faster)
+        # "description": job.full_description,  # Use merged description with all fields (slower, requires get_job_details)
+        "postingDate": job.postingDate,
+        "positionId": job.positionId,
+        "id": job.id,
+        "reqId": job.reqId,
+    }
+
+
+def _read_cache_metadata(json_path: str) -> tuple[Optional[str], int, bool]:
+    """
+    Stream-parse apple.json for (last_scraped, num_jobs, is_list) without
+    loading the job list. Stops at the start of the "jobs" array when the
+    num_jobs field was written ahead of it; older files fall back to
+    counting the array items.
+    """
+    last_scraped = None
+    num_jobs = None
+    with open(json_path, "rb") as f:
+        events = ijson.parse(f)
+        for prefix, event, value in events:
+            if prefix == "" and event == "start_array":
+                # Old format: the whole file is the job list
+                count = sum(1 for p, e, _ in events if p == "item" and e == "start_map")
+                return None, count, True
+            if prefix == "last_scraped":
+                last_scraped = value
+            elif prefix == "num_jobs":
+                num_jobs = value
+            elif prefix == "jobs" and event == "start_array":
+                if num_jobs is not None:
+                    break
+                num_jobs = sum(
+                    1 for p, e, _ in events if p == "jobs.item" and e == "start_map"
+                )
+    return last_scraped, num_jobs or 0, False
+
+
 def scrape_apple_jobs(force: bool = False) -> tuple[str, int, bool]:
     """
     Scrape Apple jobs and store them in apple/apple.json.
@@ -41,14 +101,10 @@ def scrape_apple_jobs(force: bool = False) -> tuple[str, int, bool]:
     max_age_hours = 6.0
     if not force and os.path.exists(json_path):
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
-            if isinstance(existing, dict):
-                jobs = existing.get("jobs", [])
-                last_scraped_str = existing.get("last_scraped")
-
+            last_scraped_str, num_jobs, is_list = _read_cache_metadata(json_path)
+            if not is_list:
                 # Check freshness based on last_scraped timestamp
-                if last_scraped_str and jobs:
+                if last_scraped_str and num_jobs:
                     try:
                         last_scraped = datetime.fromisoformat(last_scraped_str)
                         # Handle timezone-aware datetimes
@@ -64,7 +120,7 @@ def scrape_apple_jobs(force: bool = False) -> tuple[str, int, bool]:
                             print(
                                 f"Existing Apple data found (scraped {hours_elapsed:.1f} hours ago). Reusing without rescraping."
                             )
-                            return json_path, len(jobs), False
+                            return json_path, num_jobs, False
                         else:
                             print(
                                 f"Existing Apple data is stale ({hours_elapsed:.1f} hours old, max {max_age_hours}h). Rescraping..."
@@ -73,12 +129,12 @@ def scrape_apple_jobs(force: bool = False) -> tuple[str, int, bool]:
                         # If timestamp parsing fails, check file modification time as fallback
                         file_mtime = Path(json_path).stat().st_mtime
                         hours_elapsed = (datetime.now().timestamp() - file_mtime) / 3600
-                        if hours_elapsed < max_age_hours and jobs:
+                        if hours_elapsed < max_age_hours and num_jobs:
                             print(
                                 f"Existing Apple data found (file modified {hours_elapsed:.1f} hours ago). Reusing without rescraping."
                             )
-                            return json_path, len(jobs), False
-                elif jobs:
+                            return json_path, num_jobs, False
+                elif num_jobs:
                     # No timestamp but has jobs - check file modification time
                     file_mtime = Path(json_path).stat().st_mtime
                     hours_elapsed = (datetime.now().timestamp() - file_mtime) / 3600
@@ -86,15 +142,15 @@ def scrape_apple_jobs(force: bool = False) -> tuple[str, int, bool]:
                         print(
                             f"Existing Apple data found (file modified {hours_elapsed:.1f} hours ago). Reusing without rescraping."
                         )
-                        return json_path, len(jobs), False
+                        return json_path, num_jobs, False
             else:
                 # Old format (list instead of dict)
-                if existing:
+                if num_jobs:
                     print(
                         "Existing Apple data found (old format). Reusing without rescraping."
                     )
-                    return json_path, len(existing), False
-        except (OSError, json.JSONDecodeError) as e:
+                    return json_path, num_jobs, False
+        except (OSError, ijson.JSONError) as e:
             print(f"Error reading existing Apple data: {e}. Will rescrape.")
 
     # Initialize client and fetch jobs
@@ -111,39 +167,22 @@ def scrape_apple_jobs(force: bool = False) -> tuple[str, int, bool]:
     # Convert Job objects to dictionaries
     jobs_data = []
     # Note: Detailed fetching is commented out for performance (takes too long with 6000+ jobs)
-    # Uncomment the lines below if you need full_description with minimumQualifications, etc.
+    # Uncomment the line in _job_to_dict if you need full_description with minimumQualifications, etc.
     # print(f"Fetching detailed information for {len(all_jobs)} jobs...")
 
-    for i, job in enumerate(all_jobs, 1):
-        # Fetch detailed job information (commented out for performance)
-        # job = client.get_job_details(job)
-
-        # Handle multiple locations
-        locations = [loc.name for loc in job.locations] if job.locations else ["N/A"]
-
-        job_dict = {
-            "url": job.url,
-            "title": job.postingTitle,
-            "locations": locations,
-            "location": locations[0]
-            if locations
-            else "N/A",  # Keep first location for backward compatibility
-            "description": job.jobSummary,  # Use jobSummary from search results (faster)
-            # "description": job.full_description,  # Use merged description with all fields (slower, requires get_job_details)
-            "postingDate": job.postingDate,
-            "positionId": job.positionId,
-            "id": job.id,
-            "reqId": job.reqId,
-        }
-        jobs_data.append(job_dict)
-
-        if i % 50 == 0:
-            print(f"Processed {i}/{len(all_jobs)} jobs...")
+    # Build in fixed-size slices so progress is printed once per slice
+    # instead of checking a counter on every job
+    for start in range(0, len(all_jobs), PROGRESS_BATCH_SIZE):
+        batch = all_jobs[start : start + PROGRESS_BATCH_SIZE]
+        jobs_data.extend(_job_to_dict(job) for job in batch)
+        print(f"Processed {start + len(batch)}/{len(all_jobs)} jobs...")
 
     # Wrap in standard format with metadata
     wrapped = {
         "last_scraped": datetime.now().isoformat(),
         "name": "Apple",
+        # Stored ahead of "jobs" so the freshness check can stop parsing early
+        "num_jobs": len(jobs_data),
         "jobs": jobs_data,
     }
 
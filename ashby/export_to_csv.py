@@ -1,8 +1,7 @@
-import json
 import sys
 from pathlib import Path
 
-from pydantic import ValidationError
+import msgspec
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
@@ -50,14 +49,17 @@ def main():
             # Try to get company name from JSON first, then from CSV mapping
             company_name = company_slug  # fallback
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                # Decoded from bytes straight into the model, with no dict in
+                # between
+                parsed = msgspec.json.decode(
+                    json_file.read_bytes(), type=AshbyApiResponse, strict=False
+                )
                 # Check if name field exists in JSON
-                if "name" in data:
+                if parsed.name is not None:
                     # Ensure name is not URL-encoded (shouldn't happen, but safety check)
                     from urllib.parse import unquote
 
-                    company_name = data["name"]
+                    company_name = parsed.name
                     # If name looks URL-encoded, prefer CSV name instead
                     if "%" in company_name:
                         decoded_slug = unquote(company_slug_lower)
@@ -74,8 +76,7 @@ def main():
                         company_name = slug_to_name[company_slug_lower]
                     elif decoded_slug in slug_to_name:
                         company_name = slug_to_name[decoded_slug]
-                parsed = AshbyApiResponse(**data)
-            except (json.JSONDecodeError, ValidationError):
+            except msgspec.DecodeError:
                 continue
 
             for job in parsed.jobs:
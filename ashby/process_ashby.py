@@ -1,26 +1,37 @@
-import json
+import asyncio
+import contextlib
+import hashlib
 import logging
+import re
+import sqlite3
 import time
+from array import array
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 import sys
 
+import msgspec
+
 sys.path.append(str(Path(__file__).parent.parent))
 
 from sqlalchemy import (
     create_engine,
     text,
+    update,
     Column,
     String,
     Boolean,
     DateTime,
     Float,
+    Index,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, insert as pg_insert
 from sqlalchemy.orm import declarative_base, sessionmaker
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from pgvector.sqlalchemy import Vector
 
 from models.ashby import AshbyApiResponse, AshbyJob
 from models.db import DatabaseJob
@@ -33,6 +44,9 @@ logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# text-embedding-3-small vectors, stored in pgvector columns
+EMBEDDING_DIMENSIONS = 1536
+
 
 class CompanyTable(Base):
     __tablename__ = "companies"
@@ -50,7 +64,7 @@ class JobTable(Base):
     description = Column(Text)
     employment_type = Column(String)
     industry = Column(String)
-    embedding = Column(Text)
+    embedding = Column(Vector(EMBEDDING_DIMENSIONS))
     posted_at = Column(DateTime)
     created_at = Column(DateTime, server_default=text("now()"))
     source = Column(String)
@@ -60,7 +74,7 @@ class JobTable(Base):
     wfh = Column(Boolean)
     application_url = Column(String)
     language = Column(String)
-    title_embedding = Column(Text)
+    title_embedding = Column(Vector(EMBEDDING_DIMENSIONS))
     verified_at = Column(DateTime)
     lon = Column(Float)
     lat = Column(Float)
@@ -73,39 +87,218 @@ class JobTable(Base):
     city = Column(String)
     ats_type = Column(String)
     company_id = Column(PGUUID(as_uuid=True))
+    description_hash = Column(String)
+
+    __table_args__ = (
+        # load_existing_jobs_by_url
+        Index("ix_jobs_company_name_ats", "company", "ats_type"),
+        # deactivate_removed_jobs
+        Index("ix_jobs_company_ats", "company_id", "ats_type"),
+        # load_embeddings_by_description_hash
+        Index("ix_jobs_description_hash", "description_hash"),
+    )
+
+
+def ensure_schema(engine):
+    """
+    Bring an existing jobs table up to JobTable (create_all only handles
+    tables it creates): add the description_hash column and create the
+    indexes. Indexes are built CONCURRENTLY so writes aren't blocked; a
+    failure is logged and the run continues without the index.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(
+            text(
+                f"ALTER TABLE {JobTable.__tablename__} "
+                "ADD COLUMN IF NOT EXISTS description_hash VARCHAR"
+            )
+        )
+        for index in JobTable.__table__.indexes:
+            columns = ", ".join(column.name for column in index.columns)
+            try:
+                conn.execute(
+                    text(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index.name} "
+                        f"ON {JobTable.__tablename__} ({columns})"
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Could not create index {index.name}: {e}")
+
+
+def load_company_ids(session) -> Dict[str, UUID]:
+    """Load every company's ID keyed by name, in one query."""
+    return dict(session.query(CompanyTable.name, CompanyTable.id).all())
 
 
-def get_or_create_company(session, company_name: str) -> UUID:
-    """Get existing company or create new one."""
+def get_or_create_company(
+    session, company_name: str, company_ids: Optional[Dict[str, UUID]] = None
+) -> UUID:
+    """
+    Get existing company or create new one. When company_ids (from
+    load_company_ids) is given it is used instead of querying, and new
+    companies are added to it.
+    """
     # Trim company name
     company_name = company_name.strip()
     logger.debug(f"Getting or creating company: {company_name}")
-    company = session.query(CompanyTable).filter_by(name=company_name).first()
-    if company:
-        logger.info(f"Found existing company: {company_name} (ID: {company.id})")
-        return company.id
+    if company_ids is not None:
+        company_id = company_ids.get(company_name)
+    else:
+        company_id = (
+            session.query(CompanyTable.id).filter_by(name=company_name).scalar()
+        )
+    if company_id:
+        logger.info(f"Found existing company: {company_name} (ID: {company_id})")
+        return company_id
 
     logger.info(f"Creating new company: {company_name}")
     new_company = CompanyTable(id=uuid4(), name=company_name)
     session.add(new_company)
     session.commit()
     logger.info(f"Created company: {company_name} (ID: {new_company.id})")
+    if company_ids is not None:
+        company_ids[company_name] = new_company.id
     return new_company.id
 
 
-def generate_embedding(
-    client: OpenAI, text: str, embedding_type: str = "general"
-) -> Optional[str]:
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Inputs per embeddings request (the API accepts up to 2048)
+EMBEDDING_BATCH_SIZE = 256
+# Rough character budget per request to stay under the per-request token limit
+EMBEDDING_BATCH_MAX_CHARS = 400_000
+# Embedding requests in flight at once
+EMBEDDING_CONCURRENCY = 8
+# Content-addressed embedding cache shared across runs
+EMBEDDING_CACHE_FILE = Path(__file__).parent / "embedding_cache.sqlite3"
+# Seconds before an embeddings request times out
+EMBEDDING_REQUEST_TIMEOUT = 60.0
+# Retries per request on 429/5xx; the SDK waits as long as Retry-After says
+EMBEDDING_MAX_RETRIES = 5
+# Hold new requests until the window resets once OpenAI reports fewer than
+# this many requests / tokens left
+RATE_LIMIT_MIN_REQUESTS = EMBEDDING_CONCURRENCY
+RATE_LIMIT_MIN_TOKENS = EMBEDDING_BATCH_MAX_CHARS // 4
+
+
+def _parse_reset_seconds(value: Optional[str]) -> float:
+    """Parse an x-ratelimit-reset-* duration such as '1s', '6m0s' or '20ms'."""
+    if not value:
+        return 0.0
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(
+        float(amount) * units[unit]
+        for amount, unit in re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", value)
+    )
+
+
+class EmbeddingRateLimiter:
+    """
+    Paces embedding requests from the x-ratelimit-* headers OpenAI returns:
+    requests go out back to back until the remaining budget runs low, then
+    new ones wait for the reported reset instead of running into 429s.
+    """
+
+    def __init__(self):
+        self.resume_at = 0.0
+
+    async def wait(self):
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            logger.info(f"    Rate limit nearly reached, waiting {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def update(self, headers):
+        pause = 0.0
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        if remaining_requests and int(remaining_requests) < RATE_LIMIT_MIN_REQUESTS:
+            pause = _parse_reset_seconds(headers.get("x-ratelimit-reset-requests"))
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        if remaining_tokens and int(remaining_tokens) < RATE_LIMIT_MIN_TOKENS:
+            pause = max(
+                pause, _parse_reset_seconds(headers.get("x-ratelimit-reset-tokens"))
+            )
+        if pause:
+            self.resume_at = max(self.resume_at, time.monotonic() + pause)
+
+
+rate_limiter = EmbeddingRateLimiter()
+
+
+async def _create_embeddings(client: AsyncOpenAI, texts):
+    """Send one embeddings request, pacing it with the shared rate limiter."""
+    await rate_limiter.wait()
+    raw = await client.embeddings.with_raw_response.create(
+        input=texts, model=EMBEDDING_MODEL
+    )
+    rate_limiter.update(raw.headers)
+    return raw.parse()
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of embeddings keyed by a hash of (model, text), so any text
+    that was embedded before (reposts, cross-listed jobs) skips the API call.
+    Vectors are stored as packed float32, the precision pgvector keeps.
+    """
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors "
+            "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.blake2b(
+            model.encode() + b"\0" + text.encode(), digest_size=32
+        ).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            batch = keys[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            for key, blob in self.conn.execute(
+                f"SELECT key, vector FROM vectors WHERE key IN ({placeholders})",
+                batch,
+            ):
+                vector = array("f")
+                vector.frombytes(blob)
+                found[key] = vector.tolist()
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, vector) VALUES (?, ?)",
+                ((key, array("f", vector).tobytes()) for key, vector in items.items()),
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+async def generate_embedding(
+    client: AsyncOpenAI,
+    text: str,
+    embedding_type: str = "general",
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Optional[List[float]]:
     """
     Generate embedding using OpenAI API and wait for response.
 
     Args:
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         text: Text to generate embedding for
         embedding_type: Type of embedding (for logging purposes)
+        semaphore: Optional semaphore bounding concurrent requests
 
     Returns:
-        String representation of embedding vector or None if failed
+        Embedding vector or None if failed
     """
     if not text or not text.strip():
         logger.warning(f"Empty text provided for {embedding_type} embedding")
@@ -116,8 +309,8 @@ def generate_embedding(
             f"Generating {embedding_type} embedding for text length: {len(text)}"
         )
 
-        # Make synchronous API call and wait for response
-        response = client.embeddings.create(input=text, model="text-embedding-3-small")
+        async with semaphore or contextlib.nullcontext():
+            response = await _create_embeddings(client, text)
 
         # Extract embedding vector from response
         embedding_values = response.data[0].embedding
@@ -126,20 +319,121 @@ def generate_embedding(
             f"Successfully generated {embedding_type} embedding with {len(embedding_values)} dimensions"
         )
 
-        # Convert to string representation for PostgreSQL
-        return str(embedding_values)
+        return embedding_values
 
     except Exception as e:
         logger.error(f"Error generating {embedding_type} embedding: {e}", exc_info=True)
         return None
 
 
+def chunk_embedding_texts(texts: List[str]) -> List[List[str]]:
+    """Split texts into request-sized chunks by count and total characters."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_chars = 0
+    for item in texts:
+        if current and (
+            len(current) >= EMBEDDING_BATCH_SIZE
+            or current_chars + len(item) > EMBEDDING_BATCH_MAX_CHARS
+        ):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(item)
+        current_chars += len(item)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def _embed_chunk(
+    client: AsyncOpenAI,
+    texts: List[str],
+    semaphore: asyncio.Semaphore,
+    embedding_type: str,
+) -> List[Optional[List[float]]]:
+    """Embed one request-sized chunk, falling back to one request per text."""
+    try:
+        logger.debug(
+            f"Generating {len(texts)} {embedding_type} embeddings in one request"
+        )
+        async with semaphore:
+            response = await _create_embeddings(client, texts)
+        # Results carry the index of their input; keep the input order
+        data = sorted(response.data, key=lambda d: d.index)
+        return [d.embedding for d in data]
+    except Exception as e:
+        # One bad input fails the whole request, so retry the chunk per text
+        logger.warning(
+            f"Batch {embedding_type} embedding request failed ({e}), "
+            f"retrying {len(texts)} texts individually"
+        )
+        return await asyncio.gather(
+            *(
+                generate_embedding(client, text, embedding_type, semaphore)
+                for text in texts
+            )
+        )
+
+
+async def generate_embeddings_batch(
+    client: AsyncOpenAI,
+    texts: List[str],
+    embedding_type: str = "general",
+    cache: Optional[EmbeddingCache] = None,
+) -> List[Optional[List[float]]]:
+    """
+    Generate embeddings for many texts with one OpenAI request per chunk,
+    sending up to EMBEDDING_CONCURRENCY chunk requests at a time.
+
+    Args:
+        client: AsyncOpenAI client instance
+        texts: Non-empty texts to generate embeddings for
+        embedding_type: Type of embedding (for logging purposes)
+        cache: Optional embedding cache; only texts missing from it (each
+            distinct text once) are sent to the API, and results are stored
+
+    Returns:
+        Embedding vectors in the same order as texts (None for any text that
+        failed)
+    """
+    keys = [EmbeddingCache.key(EMBEDDING_MODEL, content) for content in texts]
+    known = cache.get_many(list(set(keys))) if cache else {}
+
+    # Embed each distinct uncached text once
+    missing = {}
+    for key, content in zip(keys, texts):
+        if key not in known and key not in missing:
+            missing[key] = content
+    if known:
+        logger.info(f"    Reusing {len(texts) - len(missing)} cached embeddings")
+
+    if missing:
+        semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+        chunk_results = await asyncio.gather(
+            *(
+                _embed_chunk(client, chunk, semaphore, embedding_type)
+                for chunk in chunk_embedding_texts(list(missing.values()))
+            )
+        )
+        vectors = [vector for chunk in chunk_results for vector in chunk]
+        generated = {
+            key: vector for key, vector in zip(missing, vectors) if vector is not None
+        }
+        if cache and generated:
+            cache.put_many(generated)
+        known.update(generated)
+
+    return [known.get(key) for key in keys]
+
+
 def convert_ashby_to_database_job(
     ashby_job: AshbyJob,
     company_name: str,
     company_id: UUID,
-    description_embedding: Optional[str],
-    title_embedding: Optional[str],
+    description_embedding: Optional[List[float]],
+    title_embedding: Optional[List[float]],
+    description_hash: Optional[str] = None,
 ) -> DatabaseJob:
     """Convert AshbyJob to DatabaseJob."""
     logger.debug(f"Converting AshbyJob to DatabaseJob: {ashby_job.title}")
@@ -159,6 +453,7 @@ def convert_ashby_to_database_job(
         company_id=company_id,
         embedding=description_embedding,
         title_embedding=title_embedding,
+        description_hash=description_hash,
         is_active=ashby_job.is_listed,
     )
 
@@ -176,23 +471,53 @@ def load_processed_companies(checkpoint_file: Path) -> set:
     return set()
 
 
-def mark_company_processed(checkpoint_file: Path, company_name: str):
-    """Append company name to checkpoint file."""
-    with open(checkpoint_file, "a") as f:
-        f.write(f"{company_name}\n")
+def mark_company_processed(checkpoint_fh, company_name: str):
+    """
+    Append company name to the checkpoint file. checkpoint_fh is kept open
+    for the whole run and line buffered, so each name is written out
+    immediately without reopening the file.
+    """
+    checkpoint_fh.write(f"{company_name}\n")
     logger.debug(f"Marked {company_name} as processed in checkpoint file")
 
 
-def check_job_exists_by_url(
-    session, url: str, ats_type: str, company_name: str
-) -> Optional[JobTable]:
-    """Check if job exists in DB by URL, ats_type, and company_name."""
-    existing = (
-        session.query(JobTable)
-        .filter_by(url=url, ats_type=ats_type, company=company_name)
-        .first()
+def description_hash(description: str) -> str:
+    """Content hash of a job description, stored next to its embedding."""
+    return hashlib.blake2b(description.encode(), digest_size=32).hexdigest()
+
+
+def load_embeddings_by_description_hash(session, hashes: set) -> Dict[str, List[float]]:
+    """Find stored description embeddings for any of the given hashes."""
+    if not hashes:
+        return {}
+    rows = (
+        session.query(JobTable.description_hash, JobTable.embedding)
+        .filter(
+            JobTable.description_hash.in_(hashes),
+            JobTable.embedding.isnot(None),
+        )
+        .distinct(JobTable.description_hash)
+        .all()
     )
-    return existing
+    return {row.description_hash: row.embedding for row in rows}
+
+
+def load_existing_jobs_by_url(session, ats_type: str, company_name: str) -> dict:
+    """
+    Load the stored embeddings of every job for a company in one query,
+    keyed by URL (replaces a per-job existence check).
+    """
+    rows = (
+        session.query(
+            JobTable.url,
+            JobTable.embedding,
+            JobTable.title_embedding,
+            JobTable.description_hash,
+        )
+        .filter_by(ats_type=ats_type, company=company_name)
+        .all()
+    )
+    return {row.url: row for row in rows}
 
 
 def deactivate_removed_jobs(
@@ -202,24 +527,24 @@ def deactivate_removed_jobs(
     current_job_urls: set,
     company_name: str,
 ):
-    """Mark jobs as inactive if they exist in DB but not in current scrape."""
-    # Query all jobs for this company and ATS type
-    db_jobs = (
-        session.query(JobTable)
-        .filter_by(company_id=company_id, ats_type=ats_type)
-        .all()
+    """
+    Mark jobs as inactive if they exist in DB but not in current scrape.
+    The caller commits.
+    """
+    # One UPDATE for the whole company instead of loading every job row
+    result = session.execute(
+        update(JobTable)
+        .where(
+            JobTable.company_id == company_id,
+            JobTable.ats_type == ats_type,
+            JobTable.is_active.is_(True),
+            JobTable.url.notin_(current_job_urls),
+        )
+        .values(is_active=False)
     )
 
-    deactivated_count = 0
-    for db_job in db_jobs:
-        if db_job.url not in current_job_urls:
-            if db_job.is_active:
-                db_job.is_active = False
-                deactivated_count += 1
-                logger.debug(f"  Deactivating job: {db_job.title} (URL: {db_job.url})")
-
+    deactivated_count = result.rowcount
     if deactivated_count > 0:
-        session.commit()
         logger.info(
             f"  Deactivated {deactivated_count} jobs that are no longer listed for {company_name}"
         )
@@ -227,6 +552,20 @@ def deactivate_removed_jobs(
         logger.debug(f"  No jobs to deactivate for {company_name}")
 
 
+def upsert_jobs(session, job_dicts: List[dict]):
+    """
+    Insert or update jobs with a single INSERT ... ON CONFLICT (id) DO UPDATE.
+    Existing rows get every column from the new dict except id (this also
+    re-activates jobs that are listed again). The caller commits.
+    """
+    stmt = pg_insert(JobTable).values(job_dicts)
+    update_columns = {
+        name: stmt.excluded[name] for name in job_dicts[0] if name != "id"
+    }
+    stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_columns)
+    session.execute(stmt)
+
+
 def process_ashby_companies(
     database_url: str, openai_api_key: str, companies_folder: str = None
 ):
@@ -257,15 +596,40 @@ def process_ashby_companies(
 
     # Initialize database connection
     logger.info("Initializing database connection...")
-    engine = create_engine(database_url)
+    # Page executemany() calls (e.g. ORM flushes of many rows) into
+    # multi-row statements instead of one statement per row
+    engine = create_engine(
+        database_url,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
     Base.metadata.create_all(engine)
+    ensure_schema(engine)
     Session = sessionmaker(bind=engine)
     session = Session()
     logger.info("Database connection established")
 
+    company_ids = load_company_ids(session)
+    logger.info(f"Loaded {len(company_ids)} existing companies")
+
     # Initialize OpenAI client
     logger.info("Initializing OpenAI client...")
-    openai_client = OpenAI(api_key=openai_api_key)
+    # Keep-alive pool sized for the concurrent embedding requests, shared
+    # by every company in the run
+    openai_client = AsyncOpenAI(
+        api_key=openai_api_key,
+        max_retries=EMBEDDING_MAX_RETRIES,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=EMBEDDING_CONCURRENCY,
+                max_keepalive_connections=EMBEDDING_CONCURRENCY,
+            ),
+            timeout=EMBEDDING_REQUEST_TIMEOUT,
+        ),
+    )
     logger.info("OpenAI client initialized")
 
     companies_path = Path(companies_folder)
@@ -278,6 +642,13 @@ def process_ashby_companies(
     json_files = list(companies_path.glob("*.json"))
     logger.info(f"Found {len(json_files)} JSON files to process")
 
+    # One event loop for the whole run so the async client can keep its
+    # connections between companies; DB work stays synchronous
+    runner = asyncio.Runner()
+    embedding_cache = EmbeddingCache(EMBEDDING_CACHE_FILE)
+    logger.info(f"Embedding cache: {EMBEDDING_CACHE_FILE}")
+    checkpoint_fh = open(checkpoint_file, "a", buffering=1)
+
     total_jobs_processed = 0
     total_companies_processed = 0
     total_companies_skipped = 0
@@ -306,17 +677,14 @@ def process_ashby_companies(
                 continue
 
             # Get or create company
-            company_id = get_or_create_company(session, company_name)
+            company_id = get_or_create_company(session, company_name, company_ids)
 
-            # Load JSON file
+            # Load and parse the JSON file straight into the Ashby models
             logger.debug(f"Loading JSON file: {json_file}")
-            with open(json_file, "r", encoding="utf-8") as f:
-                company_data = json.load(f)
-            logger.debug(f"Loaded JSON file successfully")
-
-            # Parse using Pydantic model
-            logger.debug("Parsing JSON with Pydantic model...")
-            ashby_response = AshbyApiResponse(**company_data)
+            with open(json_file, "rb") as f:
+                ashby_response = msgspec.json.decode(
+                    f.read(), type=AshbyApiResponse, strict=False
+                )
             logger.debug("Parsed successfully")
 
             jobs_count = len(ashby_response.jobs)
@@ -325,60 +693,92 @@ def process_ashby_companies(
             # Track URLs for diff logic
             current_job_urls = set()
 
-            # Process each job
-            for idx, ashby_job in enumerate(ashby_response.jobs, 1):
-                try:
-                    logger.info(f"  [{idx}/{jobs_count}] Processing: {ashby_job.title}")
-
-                    # Check if job URL already exists in DB
-                    existing_job_by_url = check_job_exists_by_url(
-                        session, ashby_job.job_url, "ashby", company_name
+            # First pass: reuse embeddings of jobs already in the DB and queue
+            # the texts that still need embeddings for new jobs
+            existing_jobs = load_existing_jobs_by_url(session, "ashby", company_name)
+            # per job: {"description": ..., "title": ..., "description_hash": ...}
+            embeddings = []
+            pending = []  # (job index, "description" | "title", text)
+            descriptions = []  # (job index, hash, text) of new jobs
+            new_jobs = 0
+            for idx, ashby_job in enumerate(ashby_response.jobs):
+                # Check if job URL already exists in DB
+                existing_job_by_url = existing_jobs.get(ashby_job.job_url)
+                if existing_job_by_url:
+                    # Job exists - keep existing embeddings, skip generation
+                    embeddings.append(
+                        {
+                            "description": existing_job_by_url.embedding,
+                            "title": existing_job_by_url.title_embedding,
+                            "description_hash": existing_job_by_url.description_hash,
+                        }
                     )
+                    continue
 
-                    # Generate embeddings only if job doesn't exist or needs update
-                    description_embedding = None
-                    title_embedding = None
-
-                    if existing_job_by_url:
-                        # Job exists - keep existing embeddings, skip generation
-                        logger.info(
-                            f"    Job URL already exists in DB, skipping embedding generation"
-                        )
-                        description_embedding = existing_job_by_url.embedding
-                        title_embedding = existing_job_by_url.title_embedding
-                    else:
-                        # Generate description embedding (first API call - wait for response)
-                        if (
-                            ashby_job.description_plain
-                            and ashby_job.description_plain.strip()
-                        ):
-                            logger.info(f"    Generating description embedding...")
-                            description_embedding = generate_embedding(
-                                openai_client,
-                                ashby_job.description_plain,
-                                embedding_type="description",
-                            )
-                            if description_embedding:
-                                logger.info(f"    ✓ Description embedding complete")
-                            else:
-                                logger.warning(
-                                    f"    ⚠ Failed to generate description embedding"
-                                )
-                        else:
-                            logger.warning(
-                                f"    ⚠ No description available for embedding"
-                            )
-
-                        # Generate title+location embedding (second API call - wait for response)
-                        title_location_text = f"{ashby_job.title}; {ashby_job.location}"
-                        logger.info(f"    Generating title embedding...")
-                        title_embedding = generate_embedding(
-                            openai_client, title_location_text, embedding_type="title"
+                new_jobs += 1
+                embeddings.append(
+                    {"description": None, "title": None, "description_hash": None}
+                )
+                if ashby_job.description_plain and ashby_job.description_plain.strip():
+                    descriptions.append(
+                        (
+                            idx,
+                            description_hash(ashby_job.description_plain),
+                            ashby_job.description_plain,
                         )
-                        if title_embedding:
-                            logger.info(f"    ✓ Title embedding complete")
-                        else:
-                            logger.warning(f"    ⚠ Failed to generate title embedding")
+                    )
+                else:
+                    logger.warning(
+                        f"    ⚠ No description available for embedding: {ashby_job.title}"
+                    )
+                # Title+location embedding
+                pending.append(
+                    (idx, "title", f"{ashby_job.title}; {ashby_job.location}")
+                )
+
+            # Reuse the embedding of any identical description already stored
+            # (e.g. the same job reposted under a new URL)
+            stored = load_embeddings_by_description_hash(
+                session, {h for _, h, _ in descriptions}
+            )
+            if stored:
+                logger.info(f"    Reusing {len(stored)} stored description embeddings")
+            for idx, h, description in descriptions:
+                embeddings[idx]["description_hash"] = h
+                if h in stored:
+                    embeddings[idx]["description"] = stored[h]
+                else:
+                    pending.append((idx, "description", description))
+
+            if pending:
+                logger.info(
+                    f"Generating {len(pending)} embeddings for {new_jobs} new jobs..."
+                )
+                vectors = runner.run(
+                    generate_embeddings_batch(
+                        openai_client,
+                        [text for _, _, text in pending],
+                        cache=embedding_cache,
+                    )
+                )
+                for (idx, kind, _), vector in zip(pending, vectors):
+                    embeddings[idx][kind] = vector
+                    if kind == "description" and not vector:
+                        # Only record the hash of an embedded description
+                        embeddings[idx]["description_hash"] = None
+                failed = sum(1 for vector in vectors if not vector)
+                if failed:
+                    logger.warning(f"    ⚠ Failed to generate {failed} embeddings")
+                else:
+                    logger.info("    ✓ Embeddings complete")
+
+            # Second pass: convert every job, then save them all at once
+            rows = {}  # by job id, so a repeated id doesn't hit the same row twice
+            for idx, (ashby_job, job_embeddings) in enumerate(
+                zip(ashby_response.jobs, embeddings), 1
+            ):
+                try:
+                    logger.info(f"  [{idx}/{jobs_count}] Processing: {ashby_job.title}")
 
                     # Add URL to tracking set for diff logic
                     current_job_urls.add(ashby_job.job_url)
@@ -389,8 +789,9 @@ def process_ashby_companies(
                         ashby_job,
                         company_name,
                         company_id,
-                        description_embedding,
-                        title_embedding,
+                        job_embeddings["description"],
+                        job_embeddings["title"],
+                        job_embeddings["description_hash"],
                     )
 
                     # Verify embeddings are present before saving
@@ -407,68 +808,49 @@ def process_ashby_companies(
 
                     logger.debug(f"    Embeddings: {' '.join(embeddings_status)}")
 
-                    # Insert into database
-                    job_dict = db_job.model_dump(exclude_none=False)
-                    logger.debug(f"Job dict created with {len(job_dict)} fields")
-
-                    # Check if job already exists by ID
-                    logger.debug(f"Checking if job exists: {job_dict['id']}")
-                    existing = (
-                        session.query(JobTable).filter_by(id=job_dict["id"]).first()
-                    )
-                    if existing:
-                        # Update existing job (including setting is_active=True if it was inactive)
-                        logger.debug("Job exists, updating...")
-                        for key, value in job_dict.items():
-                            setattr(existing, key, value)
-                        # Ensure job is marked as active since it's in current scrape
-                        existing.is_active = db_job.is_active
-                        logger.info(f"    ✓ Updated existing job: {ashby_job.title}")
-                    else:
-                        # Insert new job
-                        logger.debug("Job is new, inserting...")
-                        new_job = JobTable(**job_dict)
-                        session.add(new_job)
-                        logger.info(f"    ✓ Inserted new job: {ashby_job.title}")
-
-                    session.commit()
-                    logger.debug("Changes committed to database")
-                    total_jobs_processed += 1
-
-                    # Wait 3 seconds before processing next job to avoid rate limits (only if generating embeddings)
-                    if not existing_job_by_url and idx < jobs_count:
-                        logger.debug("Waiting 3 seconds before next job...")
-                        time.sleep(3)
+                    # created_at is left to the server default on insert and
+                    # never overwritten on update
+                    job_dict = db_job.model_dump(exclude={"created_at"})
+                    rows[job_dict["id"]] = job_dict
 
                 except Exception as e:
                     logger.error(
                         f"    ✗ Error processing job '{ashby_job.title}': {e}",
                         exc_info=True,
                     )
-                    session.rollback()
                     total_errors += 1
                     continue
 
+            if rows:
+                upsert_jobs(session, list(rows.values()))
+
             # After processing all jobs, check for removed listings and deactivate them
             try:
                 logger.info(f"Checking for removed listings for {company_name}...")
-                deactivate_removed_jobs(
-                    session, company_id, "ashby", current_job_urls, company_name
-                )
+                # Savepoint, so a failure here doesn't undo the saved jobs
+                with session.begin_nested():
+                    deactivate_removed_jobs(
+                        session, company_id, "ashby", current_job_urls, company_name
+                    )
             except Exception as e:
                 logger.error(
                     f"Error deactivating removed jobs for {company_name}: {e}",
                     exc_info=True,
                 )
-                session.rollback()
 
+            # One commit per company: its jobs are saved all or nothing
+            session.commit()
+            if rows:
+                logger.info(f"    ✓ Saved {len(rows)} jobs for {company_name}")
+            total_jobs_processed += len(rows)
             total_companies_processed += 1
 
             # Mark company as successfully processed
-            mark_company_processed(checkpoint_file, company_name)
+            mark_company_processed(checkpoint_fh, company_name)
             logger.info(f"✓ Completed processing {company_name}")
 
-        except json.JSONDecodeError as e:
+        except msgspec.DecodeError as e:
+            # Malformed JSON, or JSON that doesn't match the Ashby models
             logger.error(f"JSON decode error in {json_file.name}: {e}", exc_info=True)
             session.rollback()
             total_errors += 1
@@ -478,6 +860,10 @@ def process_ashby_companies(
             total_errors += 1
 
     session.close()
+    checkpoint_fh.close()
+    embedding_cache.close()
+    runner.run(openai_client.close())
+    runner.close()
     logger.info(f"\n{'=' * 60}")
     logger.info("Processing Summary:")
     logger.info(f"  Total companies processed: {total_companies_processed}")
@@ -12,16 +12,22 @@ Rules per ATS/source (derived from the underlying JSON data):
 `posted_at` is stored as an ISO 8601 UTC datetime string, e.g. 2025-03-10T14:32:00Z.
 """
 
-import csv
-import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+import ijson
+import orjson
+import pandas as pd
 
 
 ROOT_DIR = Path(__file__).resolve().parent
 NEW_AI_CSV = ROOT_DIR / "new_ai.csv"
+# (url, posted_at) pairs already extracted from each source file, keyed by
+# path and invalidated when the file's mtime or size changes
+PARSE_CHECKPOINT = ROOT_DIR / ".posted_at_checkpoint.json"
 
 
 def _to_utc_iso(dt: datetime) -> str:
@@ -56,10 +62,164 @@ def _parse_date_to_iso_utc(date_str: str) -> Optional[str]:
         return None
 
 
+def _load_json_file(path: Path, source: str):
+    """Load one company JSON file, or warn and return None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        print(
+            f"Warning: failed to read {source} file {path.name}: {e}",
+            file=sys.stderr,
+        )
+        return None
+
+
+def _stream_job_pairs(
+    path: Path, source: str, extract: Callable[[dict], Tuple]
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Stream the jobs of a {"jobs": [...]} file one at a time with ijson and
+    extract a (url, posted_at) pair from each, so the whole document (with
+    every description) is never held in memory. Warns and returns nothing
+    if the file can't be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return [extract(job) for job in ijson.items(f, "jobs.item")]
+    except (OSError, ijson.JSONError) as e:
+        print(
+            f"Warning: failed to read {source} file {path.name}: {e}",
+            file=sys.stderr,
+        )
+        return []
+
+
+def _ashby_pair(job: dict) -> Tuple[Optional[str], Optional[str]]:
+    url = job.get("jobUrl") or job.get("applyUrl")
+    published = job.get("publishedAt")
+    return url, _parse_iso_datetime(published) if published else None
+
+
+def _greenhouse_pair(job: dict) -> Tuple[Optional[str], Optional[str]]:
+    url = job.get("absolute_url")
+    updated = job.get("updated_at") or job.get("first_published")
+    return url, _parse_iso_datetime(updated) if updated else None
+
+
+def _parse_ashby_file(path: Path) -> List[Tuple[Optional[str], Optional[str]]]:
+    return _stream_job_pairs(path, "Ashby", _ashby_pair)
+
+
+def _parse_greenhouse_file(path: Path) -> List[Tuple[Optional[str], Optional[str]]]:
+    return _stream_job_pairs(path, "Greenhouse", _greenhouse_pair)
+
+
+def _parse_lever_file(path: Path) -> List[Tuple[Optional[str], Optional[str]]]:
+    data = _load_json_file(path, "Lever")
+    if data is None:
+        return []
+
+    if isinstance(data, list):
+        job_list = data
+    else:
+        job_list = data.get("postings") or data.get("jobs") or []
+
+    pairs = []
+    for job in job_list:
+        url = job.get("hostedUrl") or job.get("applyUrl")
+        created_at = job.get("createdAt")
+        iso_ts: Optional[str] = None
+        if isinstance(created_at, (int, float)):
+            try:
+                dt = datetime.fromtimestamp(created_at / 1000.0, tz=timezone.utc)
+                iso_ts = _to_utc_iso(dt)
+            except Exception:
+                iso_ts = None
+        elif isinstance(created_at, str):
+            iso_ts = _parse_iso_datetime(created_at)
+        pairs.append((url, iso_ts))
+    return pairs
+
+
+def _parse_rippling_file(path: Path) -> List[Tuple[Optional[str], Optional[str]]]:
+    data = _load_json_file(path, "Rippling")
+    if data is None:
+        return []
+
+    pairs = []
+    job_list = data.get("jobs") or data.get("results") or []
+    for job in job_list:
+        url = job.get("url") or job.get("applyUrl")
+        created_on = job.get("created_on")
+        iso_ts = _parse_iso_datetime(created_on) if created_on else None
+        pairs.append((url, iso_ts))
+    return pairs
+
+
+def _parse_workable_file(path: Path) -> List[Tuple[Optional[str], Optional[str]]]:
+    data = _load_json_file(path, "Workable")
+    if data is None:
+        return []
+
+    job_list = (
+        data
+        if isinstance(data, list)
+        else data.get("jobs") or data.get("results") or []
+    )
+    pairs = []
+    for job in job_list:
+        url = job.get("url") or job.get("application_url")
+        published_on = job.get("published_on")
+        created_at = job.get("created_at")
+
+        iso_ts = None
+        if published_on:
+            iso_ts = _parse_date_to_iso_utc(published_on)
+        if not iso_ts and created_at:
+            iso_ts = _parse_date_to_iso_utc(created_at)
+
+        pairs.append((url, iso_ts))
+    return pairs
+
+
+# (folder under ROOT_DIR, per-file parser returning (url, posted_at) pairs)
+ATS_FILE_PARSERS = [
+    ("ashby", _parse_ashby_file),
+    ("greenhouse", _parse_greenhouse_file),
+    ("lever", _parse_lever_file),
+    ("rippling", _parse_rippling_file),
+    ("workable", _parse_workable_file),
+]
+
+
+def _load_parse_checkpoint() -> Dict[str, dict]:
+    if not PARSE_CHECKPOINT.exists():
+        return {}
+    try:
+        return orjson.loads(PARSE_CHECKPOINT.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(
+            f"Warning: ignoring unreadable {PARSE_CHECKPOINT.name}: {e}",
+            file=sys.stderr,
+        )
+        return {}
+
+
+def _save_parse_checkpoint(checkpoint: Dict[str, dict]) -> None:
+    tmp_path = PARSE_CHECKPOINT.with_suffix(".json.tmp")
+    tmp_path.write_bytes(orjson.dumps(checkpoint))
+    tmp_path.replace(PARSE_CHECKPOINT)
+
+
 def build_url_to_posted_at_map() -> Dict[str, str]:
     """
     Build a mapping from job URL to normalized posted_at ISO datetime by scanning
     all ATS JSON data under the project.
+
+    Only files that changed since the last run (per PARSE_CHECKPOINT) are
+    read and parsed, in a process pool; the results are merged here in file
+    order.
     """
     url_to_posted: Dict[str, str] = {}
 
@@ -70,145 +230,56 @@ def build_url_to_posted_at_map() -> Dict[str, str]:
         if not existing:
             url_to_posted[url] = iso_ts
             return
-        # Keep the earliest timestamp if there is a conflict
-        try:
-            if datetime.fromisoformat(
-                iso_ts.replace("Z", "+00:00")
-            ) < datetime.fromisoformat(existing.replace("Z", "+00:00")):
-                url_to_posted[url] = iso_ts
-        except Exception:
-            # If comparison fails, just keep the existing one
-            pass
-
-    # Ashby
-    ashby_dir = ROOT_DIR / "ashby" / "companies"
-    if ashby_dir.exists():
-        for path in ashby_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(
-                    f"Warning: failed to read Ashby file {path.name}: {e}",
-                    file=sys.stderr,
-                )
-                continue
-
-            for job in data.get("jobs", []):
-                url = job.get("jobUrl") or job.get("applyUrl")
-                published = job.get("publishedAt")
-                iso_ts = _parse_iso_datetime(published) if published else None
-                maybe_set(url, iso_ts)
-
-    # Greenhouse
-    gh_dir = ROOT_DIR / "greenhouse" / "companies"
-    if gh_dir.exists():
-        for path in gh_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(
-                    f"Warning: failed to read Greenhouse file {path.name}: {e}",
-                    file=sys.stderr,
-                )
-                continue
-
-            for job in data.get("jobs", []):
-                url = job.get("absolute_url")
-                updated = job.get("updated_at") or job.get("first_published")
-                iso_ts = _parse_iso_datetime(updated) if updated else None
-                maybe_set(url, iso_ts)
-
-    # Lever
-    lever_dir = ROOT_DIR / "lever" / "companies"
-    if lever_dir.exists():
-        for path in lever_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(
-                    f"Warning: failed to read Lever file {path.name}: {e}",
-                    file=sys.stderr,
-                )
-                continue
+        # Keep the earliest timestamp if there is a conflict. Both come from
+        # _to_utc_iso (fixed-width YYYY-MM-DDTHH:MM:SSZ), so they order as strings
+        if iso_ts < existing:
+            url_to_posted[url] = iso_ts
 
-            if isinstance(data, list):
-                job_list = data
-            else:
-                job_list = data.get("postings") or data.get("jobs") or []
-
-            for job in job_list:
-                url = job.get("hostedUrl") or job.get("applyUrl")
-                created_at = job.get("createdAt")
-                iso_ts: Optional[str] = None
-                if isinstance(created_at, (int, float)):
-                    try:
-                        dt = datetime.fromtimestamp(
-                            created_at / 1000.0, tz=timezone.utc
-                        )
-                        iso_ts = _to_utc_iso(dt)
-                    except Exception:
-                        iso_ts = None
-                elif isinstance(created_at, str):
-                    iso_ts = _parse_iso_datetime(created_at)
-                maybe_set(url, iso_ts)
-
-    # Rippling
-    rippling_dir = ROOT_DIR / "rippling" / "companies"
-    if rippling_dir.exists():
-        for path in rippling_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(
-                    f"Warning: failed to read Rippling file {path.name}: {e}",
-                    file=sys.stderr,
-                )
-                continue
+    checkpoint = _load_parse_checkpoint()
+    new_checkpoint: Dict[str, dict] = {}
+    reparsed = 0
 
-            job_list = data.get("jobs") or data.get("results") or []
-            for job in job_list:
-                url = job.get("url") or job.get("applyUrl")
-                created_on = job.get("created_on")
-                iso_ts = _parse_iso_datetime(created_on) if created_on else None
-                maybe_set(url, iso_ts)
-
-    # Workable
-    workable_dir = ROOT_DIR / "workable" / "companies"
-    if workable_dir.exists():
-        for path in workable_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(
-                    f"Warning: failed to read Workable file {path.name}: {e}",
-                    file=sys.stderr,
-                )
+    with ProcessPoolExecutor() as pool:
+        for folder, parse_file in ATS_FILE_PARSERS:
+            ats_dir = ROOT_DIR / folder / "companies"
+            if not ats_dir.exists():
                 continue
 
-            job_list = (
-                data
-                if isinstance(data, list)
-                else data.get("jobs") or data.get("results") or []
-            )
-            for job in job_list:
-                url = job.get("url") or job.get("application_url")
-                published_on = job.get("published_on")
-                created_at = job.get("created_at")
+            keys = []
+            changed = []  # (key, path, stat) of files to parse again
+            for path in ats_dir.glob("*.json"):
+                key = str(path.relative_to(ROOT_DIR))
+                keys.append(key)
+                stat = path.stat()
+                entry = checkpoint.get(key)
+                if (
+                    entry
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                    and entry["size"] == stat.st_size
+                ):
+                    new_checkpoint[key] = entry
+                else:
+                    changed.append((key, path, stat))
+
+            parsed = pool.map(parse_file, [path for _, path, _ in changed], chunksize=8)
+            for (key, _, stat), pairs in zip(changed, parsed):
+                new_checkpoint[key] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "pairs": pairs,
+                }
+            reparsed += len(changed)
+
+            for key in keys:
+                for url, iso_ts in new_checkpoint[key]["pairs"]:
+                    maybe_set(url, iso_ts)
+
+    _save_parse_checkpoint(new_checkpoint)
 
-                iso_ts = None
-                if published_on:
-                    iso_ts = _parse_date_to_iso_utc(published_on)
-                if not iso_ts and created_at:
-                    iso_ts = _parse_date_to_iso_utc(created_at)
-
-                maybe_set(url, iso_ts)
-
-    print(f"Built posted_at map for {len(url_to_posted)} URLs")
+    print(
+        f"Built posted_at map for {len(url_to_posted)} URLs "
+        f"({reparsed} of {len(new_checkpoint)} files parsed, rest from checkpoint)"
+    )
     return url_to_posted
 
 
@@ -220,31 +291,21 @@ def backfill_new_ai_csv() -> None:
 
     url_to_posted = build_url_to_posted_at_map()
 
-    rows = []
-    with open(NEW_AI_CSV, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames or [])
-        has_posted_at = "posted_at" in fieldnames
-        for row in reader:
-            url = row.get("url", "").strip()
-            posted_at = url_to_posted.get(url)
-            if posted_at:
-                row["posted_at"] = posted_at
-            else:
-                # Leave as-is if already present, otherwise empty
-                row.setdefault("posted_at", "")
-            rows.append(row)
-
-    if not has_posted_at:
-        fieldnames.append("posted_at")
+    # Read every column as plain strings so untouched values are written back
+    # exactly as they were (no NaN for empty cells, no numeric coercion)
+    df = pd.read_csv(NEW_AI_CSV, dtype=str, keep_default_na=False, encoding="utf-8")
+    if "url" in df.columns:
+        posted_at = df["url"].str.strip().map(url_to_posted)
+    else:
+        posted_at = pd.Series(None, index=df.index, dtype=object)
+    # Leave as-is if already present, otherwise empty
+    df["posted_at"] = posted_at.fillna(df["posted_at"] if "posted_at" in df else "")
 
     tmp_path = NEW_AI_CSV.with_suffix(".csv.tmp")
     backup_path = NEW_AI_CSV.with_suffix(".csv.bak")
 
-    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Same line endings as csv.DictWriter, which wrote this file before
+    df.to_csv(tmp_path, index=False, encoding="utf-8", lineterminator="\r\n")
 
     # Backup original and replace
     NEW_AI_CSV.replace(backup_path)
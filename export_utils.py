@@ -1,15 +1,72 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime
+import gzip
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import blake2b
+from itertools import chain, groupby, pairwise
+import io
+import json
+import multiprocessing
+from operator import itemgetter
+import os
+import re
 import shutil
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
 from urllib.parse import urlparse
-from uuid import NAMESPACE_URL, uuid5
+from uuid import NAMESPACE_URL, UUID, uuid5
 
+import orjson
 
-FIELDNAMES = ["url", "title", "location", "company", "ats_id", "id"]
+
+FIELDNAMES = ("url", "title", "location", "company", "ats_id", "id")
+
+# Buffer size for reading and writing the jobs CSVs (fewer read/write syscalls)
+IO_BUFFER_SIZE = 1 << 20
+
+# The _old backup of the jobs CSV is gzipped; the diff reads it back
+# and a fast level keeps compressing it cheap
+BACKUP_COMPRESSLEVEL = 1
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Diff files are numbered jobs_diff_00000001.csv, jobs_diff_00000002.csv, ...
+# from a counter file, and jobs_diff_latest.csv links to the newest one
+DIFF_COUNTER_WIDTH = 8
+LATEST_DIFF_SUFFIX = "latest"
+
+# Below this many rows the diff normalizes new rows in-process
+PARALLEL_DIFF_MIN_ROWS = 10_000
+
+# How job IDs are derived from their unique key. "uuid5" (the default) keeps the
+# IDs that are already published; "blake2b" is cheaper to compute but gives every
+# job a new ID, so only switch it together with a full re-export.
+JOB_ID_ALGORITHM = os.getenv("JOB_ID_ALGORITHM", "uuid5")
+if JOB_ID_ALGORITHM not in ("uuid5", "blake2b"):
+    raise ValueError(
+        f"JOB_ID_ALGORITHM must be 'uuid5' or 'blake2b', got {JOB_ID_ALGORITHM!r}"
+    )
+
+
+def generate_job_ids(
+    jobs: Iterable[Tuple[str | None, str | None, str | None]],
+) -> List[str]:
+    """
+    Generate the deterministic IDs for many (platform, url, ats_id) triples at
+    once; same result as calling generate_job_id on each.
+    """
+    unique_keys = [
+        f"{platform or 'unknown'}:{ats_id or ''}:{url or ''}"
+        for platform, url, ats_id in jobs
+    ]
+    if JOB_ID_ALGORITHM == "blake2b":
+        digest = blake2b
+        return [
+            str(UUID(bytes=digest(key.encode(), digest_size=16).digest()))
+            for key in unique_keys
+        ]
+    namespace = NAMESPACE_URL
+    return [str(uuid5(namespace, key)) for key in unique_keys]
 
 
 def generate_job_id(platform: str, url: str | None, ats_id: str | None) -> str:
@@ -18,11 +75,17 @@ def generate_job_id(platform: str, url: str | None, ats_id: str | None) -> str:
     Falls back gracefully when values are missing so the ID stays stable
     between runs.
     """
-    platform = platform or "unknown"
-    url = url or ""
-    ats_id = ats_id or ""
-    unique_key = f"{platform}:{ats_id}:{url}"
-    return str(uuid5(NAMESPACE_URL, unique_key))
+    return generate_job_ids([(platform, url, ats_id)])[0]
+
+
+def load_json_file(json_file: Path):
+    """Parse a JSON file with orjson, or the json module if it must."""
+    raw = json_file.read_bytes()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson is stricter (e.g. NaN); fall back to the json module
+        return json.loads(raw)
 
 
 def _extract_ats_id_from_url(url: str) -> str:
@@ -74,118 +137,528 @@ def _extract_ats_id_from_url(url: str) -> str:
     return ""
 
 
-def _build_row_key(row: Dict[str, str]) -> str:
+# All fields except 'id' (which is our local generated UUID)
+_COMPARED_FIELDS = tuple(f for f in FIELDNAMES if f != "id")
+_ATS_ID_INDEX = _COMPARED_FIELDS.index("ats_id")
+_URL_INDEX = _COMPARED_FIELDS.index("url")
+
+
+_COMPARED_POSITIONS = tuple(FIELDNAMES.index(f) for f in _COMPARED_FIELDS)
+
+# Fetch every compared field in one call instead of a lookup per field
+_get_compared_values = itemgetter(*_COMPARED_FIELDS)
+_get_compared_positions = itemgetter(*_COMPARED_POSITIONS)
+
+
+def _normalize_row(row: Dict[str, str]) -> Tuple[str, ...]:
+    """
+    Stripped values of the actual job data fields, computed once per row and
+    used for both its key and its fingerprint.
     """
-    Build a comparable key for a job row using only ats_id.
+    try:
+        values = _get_compared_values(row)
+    except KeyError:
+        # Exporters may leave out optional columns
+        values = [row.get(field) for field in _COMPARED_FIELDS]
+    return tuple((value or "").strip() for value in values)
+
+
+def _normalize_fields(fields: List[str]) -> Tuple[str, ...]:
+    """Same as _normalize_row, for a row given as a list ordered like FIELDNAMES."""
+    return tuple(value.strip() for value in _get_compared_positions(fields))
+
+
+def _build_row_key(values: Tuple[str, ...]) -> str:
+    """
+    Build a comparable key for a normalized job row using only ats_id.
     If ats_id is missing, try to extract it from the URL.
     Returns the ats_id or empty string if not available.
     """
-    ats_id = (row.get("ats_id") or "").strip()
+    ats_id = values[_ATS_ID_INDEX]
     if not ats_id:
         # Fallback: extract from URL if ats_id column doesn't exist
-        url = (row.get("url") or "").strip()
-        ats_id = _extract_ats_id_from_url(url)
+        ats_id = _extract_ats_id_from_url(values[_URL_INDEX])
     return ats_id
 
 
-def _rows_equal(row_a: Dict[str, str], row_b: Dict[str, str]) -> bool:
+def _canonical_row(values: Tuple[str, ...]) -> str:
     """
-    Compare rows for equality, excluding the 'id' field since it's our local generated ID.
-    Only compare the actual job data fields.
+    A normalized row joined into one string, so spotting an update is a single
+    string comparison. Unlike hash() it is the same in every process, so
+    worker processes can compute it too.
     """
-    # Compare all fields except 'id' (which is our local generated UUID)
-    fields_to_compare = [f for f in FIELDNAMES if f != "id"]
-    for field in fields_to_compare:
-        if (row_a.get(field) or "").strip() != (row_b.get(field) or "").strip():
-            return False
-    return True
+    return "\x1f".join(values)
+
 
+def _row_entries(rows: List[Dict[str, str]]) -> List[Tuple[str, str]]:
+    """(key, canonical string) of each row, in order."""
+    return [
+        (_build_row_key(values), _canonical_row(values))
+        for values in map(_normalize_row, rows)
+    ]
 
-def _compute_diff(
-    previous_rows: Iterable[Dict[str, str]], new_rows: Iterable[Dict[str, str]]
-) -> List[Dict[str, str]]:
-    previous_index = {_build_row_key(row): row for row in previous_rows}
-    new_index = {_build_row_key(row): row for row in new_rows}
-    diff_rows: List[Dict[str, str]] = []
+
+def _new_row_entries(rows: List[Dict[str, str]]) -> List[Tuple[str, str]]:
+    """
+    _row_entries, split across worker processes for exports big enough that
+    normalizing every row outweighs pickling the rows.
+    """
+    workers = os.cpu_count() or 1
+    if len(rows) < PARALLEL_DIFF_MIN_ROWS or workers < 2:
+        return _row_entries(rows)
+    chunk_size = -(-len(rows) // workers)
+    chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    # Spawned rather than forked: this runs on write_jobs_csv's diff thread
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(chain.from_iterable(executor.map(_row_entries, chunks)))
+
+
+def _with_status(row: Dict[str, str], status: str) -> Dict[str, str]:
+    diff_row = row.copy()
+    diff_row["status"] = status
+    return diff_row
+
+
+def _removed_row(fields: List[str]) -> Dict[str, str]:
+    diff_row = dict(zip(FIELDNAMES, fields))
+    diff_row["status"] = "removed"
+    return diff_row
+
+
+def _iter_diff(
+    previous_index: Dict[str, str],
+    new_rows: Iterable[Dict[str, str]],
+    new_entries: Iterable[Tuple[str, str]],
+    previous_rows: Iterable[List[str]],
+) -> Iterator[Dict[str, str]]:
+    """
+    Lazily yield new, updated, and removed jobs (with a status field) so the
+    diff can be written as it is found. new_entries holds the (key, canonical
+    string) of each new row and previous_index maps each previous key
+    to that string; previous_rows is only walked once, after the new rows, to
+    find removed jobs.
+    """
+    new_keys = set()
+    # Bound once as locals, these are looked up for every row
+    add_key = new_keys.add
+    get_previous = previous_index.get
+    build_row_key = _build_row_key
+    normalize_fields = _normalize_fields
 
     # Find new or updated jobs
-    for row in new_rows:
-        key = _build_row_key(row)
-        previous = previous_index.get(key)
+    for row, (key, row_canonical) in zip(new_rows, new_entries):
+        add_key(key)
+        previous = get_previous(key)
         if previous is None:
             # New job
-            diff_row = row.copy()
-            diff_row["status"] = "new"
-            diff_rows.append(diff_row)
-        elif not _rows_equal(previous, row):
+            yield _with_status(row, "new")
+        elif previous != row_canonical:
             # Updated job
-            diff_row = row.copy()
-            diff_row["status"] = "updated"
-            diff_rows.append(diff_row)
+            yield _with_status(row, "updated")
 
     # Find removed jobs
-    for row in previous_rows:
-        key = _build_row_key(row)
-        if key not in new_index:
-            # Removed job
-            diff_row = row.copy()
-            diff_row["status"] = "removed"
-            diff_rows.append(diff_row)
+    for fields in previous_rows:
+        key = build_row_key(normalize_fields(fields))
+        if key not in new_keys:
+            yield _removed_row(fields)
 
-    return diff_rows
+
+class _PreviousRowsNotSorted(Exception):
+    """Raised by _iter_merge_diff on reaching a previous row out of key order."""
+
+
+def _previous_groups(
+    previous_rows: Iterable[List[str]],
+) -> Iterator[Tuple[str, str, List[List[str]]]]:
+    """
+    Group consecutive previous rows sharing a key, yielding (key, canonical
+    string of the group's last normalized row, rows). The last row wins, as in the index.
+    Raises _PreviousRowsNotSorted if a key is lower than the one before it.
+    """
+    entries = ((_normalize_fields(fields), fields) for fields in previous_rows)
+    previous_key = None
+    for key, group in groupby(entries, key=lambda entry: _build_row_key(entry[0])):
+        if previous_key is not None and key < previous_key:
+            raise _PreviousRowsNotSorted(key)
+        previous_key = key
+        group = list(group)
+        yield key, _canonical_row(group[-1][0]), [fields for _, fields in group]
+
+
+def _iter_merge_diff(
+    new_rows: Iterable[Dict[str, str]],
+    new_entries: Iterable[Tuple[str, str]],
+    previous_rows: Iterable[List[str]],
+) -> Iterator[Dict[str, str]]:
+    """
+    Same output as _iter_diff when the new rows and the previous file are both
+    sorted by key: the two are walked side by side, so no index of the previous
+    file is built. Removed jobs are held back until the end to keep the order.
+    The previous file's order is checked along the way; rows already yielded
+    are not valid once _PreviousRowsNotSorted is raised.
+    """
+    groups = _previous_groups(previous_rows)
+    current = next(groups, None)
+    matched = False
+    removed: List[List[str]] = []
+
+    for row, (key, row_canonical) in zip(new_rows, new_entries):
+        # Previous keys below this one can't appear any more
+        while current is not None and current[0] < key:
+            if not matched:
+                removed.extend(current[2])
+            current = next(groups, None)
+            matched = False
+        if current is not None and current[0] == key:
+            matched = True
+            if current[1] != row_canonical:
+                yield _with_status(row, "updated")
+        else:
+            yield _with_status(row, "new")
+
+    while current is not None:
+        if not matched:
+            removed.extend(current[2])
+        current = next(groups, None)
+        matched = False
+
+    for fields in removed:
+        yield _removed_row(fields)
+
+
+def _is_sorted(keys: Iterable[str]) -> bool:
+    return all(a <= b for a, b in pairwise(keys))
+
+
+def _open_previous_csv(csv_path: Path) -> TextIO:
+    """Open a previous jobs CSV for reading, gzip-compressed or not."""
+    with open(csv_path, "rb") as f:
+        compressed = f.read(2) == GZIP_MAGIC
+    if compressed:
+        return io.TextIOWrapper(
+            io.BufferedReader(gzip.open(csv_path, "rb"), buffer_size=IO_BUFFER_SIZE),
+            encoding="utf-8",
+            newline="",
+        )
+    return open(csv_path, "r", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE)
+
+
+def _compress_backup(jobs_csv_path: Path, backup_path: Path) -> None:
+    """
+    Copy the jobs CSV to a gzip-compressed backup, keeping its timestamps.
+    Raises FileNotFoundError, before creating the backup, if there is no jobs CSV.
+    """
+    with open(jobs_csv_path, "rb") as src, gzip.open(
+        backup_path, "wb", compresslevel=BACKUP_COMPRESSLEVEL
+    ) as dst:
+        shutil.copyfileobj(src, dst, IO_BUFFER_SIZE)
+    shutil.copystat(jobs_csv_path, backup_path)
+
+
+def _read_previous_rows(csv_path: Path) -> Iterator[List[str]]:
+    """
+    Stream rows of a previously written jobs CSV as plain lists ordered like
+    FIELDNAMES (csv.reader, no per-row dict), whatever the file's column order.
+    Missing columns are empty and a missing ats_id is extracted from the URL.
+    """
+    ats_id_index = FIELDNAMES.index("ats_id")
+    url_index = FIELDNAMES.index("url")
+    with _open_previous_csv(csv_path) as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        positions = [header.index(f) if f in header else None for f in FIELDNAMES]
+        for raw in reader:
+            if not raw:
+                continue
+            fields = [
+                raw[i] if i is not None and i < len(raw) else "" for i in positions
+            ]
+            # Ensure ats_id exists (extract from URL if missing)
+            if not fields[ats_id_index].strip():
+                extracted_ats_id = _extract_ats_id_from_url(fields[url_index].strip())
+                if extracted_ats_id:
+                    fields[ats_id_index] = extracted_ats_id
+            yield fields
+
+
+def _dedupe_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Drop repeated (ats_id, url) pairs, keeping the first occurrence, so jobs
+    merged from several sources are only written and diffed once.
+    """
+    seen = set()
+    unique_rows = []
+    for row in rows:
+        key = (row.get("ats_id") or "", row.get("url") or "")
+        if key not in seen:
+            seen.add(key)
+            unique_rows.append(row)
+    return unique_rows
+
+
+def _rows_fingerprint(
+    rows: Iterable[Dict[str, str]], _fieldnames: Tuple[str, ...] = FIELDNAMES
+) -> str:
+    """Digest of every value the jobs CSV would contain for these rows."""
+    digest = blake2b(digest_size=32)
+    for row in rows:
+        values = (row.get(field) for field in _fieldnames)
+        line = "\x1f".join("" if value is None else str(value) for value in values)
+        digest.update(line.encode() + b"\x1e")
+    return digest.hexdigest()
+
+
+def _is_unchanged(jobs_csv_path: Path, fingerprint_path: Path, fingerprint: str) -> bool:
+    """
+    True when the jobs CSV was last written by write_jobs_csv with the same rows
+    and hasn't been touched since (its size and mtime match the sidecar).
+    """
+    try:
+        stored = json.loads(fingerprint_path.read_text(encoding="utf-8"))
+        stat = jobs_csv_path.stat()
+    except (OSError, ValueError):
+        return False
+    return stored == {
+        "rows": fingerprint,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+# Characters that make csv quote a field under the default QUOTE_MINIMAL
+_NEEDS_QUOTE = re.compile(r'[,"\r\n]')
+
+
+def _write_csv_rows(
+    csvfile: BinaryIO, fieldnames: Sequence[str], rows: Iterable[Dict[str, str]]
+) -> None:
+    """
+    Write a header and rows to a binary file exactly as csv.DictWriter would
+    in UTF-8 text mode. Plain string rows are joined and encoded once per line;
+    anything unusual goes through DictWriter into a small text buffer.
+    """
+    text = io.StringIO(newline="")
+    writer = csv.DictWriter(text, fieldnames=fieldnames)
+    get_values = itemgetter(*fieldnames)
+    write = csvfile.write
+
+    def write_with_dict_writer(row: Dict[str, str] | None = None) -> None:
+        if row is None:
+            writer.writeheader()
+        else:
+            writer.writerow(row)
+        write(text.getvalue().encode("utf-8"))
+        text.seek(0)
+        text.truncate()
+
+    write_with_dict_writer()
+    for row in rows:
+        try:
+            values = get_values(row) if len(row) == len(fieldnames) else None
+        except KeyError:
+            values = None
+        if values is None or not all(type(value) is str for value in values):
+            # Missing or extra keys, None or non-string values
+            write_with_dict_writer(row)
+            continue
+        line = ",".join(
+            '"' + value.replace('"', '""') + '"' if _NEEDS_QUOTE.search(value) else value
+            for value in values
+        )
+        write(line.encode("utf-8") + b"\r\n")
+
+
+def _next_diff_number(jobs_csv_path: Path) -> int:
+    """
+    Bump the diff counter kept next to the jobs CSV (jobs.csv.counter) and
+    return the new value. Without a counter file it continues after the
+    highest numbered diff already there, so no diff is overwritten.
+    """
+    counter_path = jobs_csv_path.with_name(f"{jobs_csv_path.name}.counter")
+    try:
+        current = int(counter_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        prefix = f"{jobs_csv_path.stem}_diff_"
+        numbers = [
+            int(path.stem[len(prefix) :])
+            for path in jobs_csv_path.parent.glob(f"{prefix}*{jobs_csv_path.suffix}")
+            if path.stem[len(prefix) :].isdigit()
+            and len(path.stem) - len(prefix) == DIFF_COUNTER_WIDTH
+        ]
+        current = max(numbers, default=0)
+
+    next_number = current + 1
+    tmp_path = counter_path.with_name(f"{counter_path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(str(next_number))
+        os.replace(tmp_path, counter_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return next_number
+
+
+def _link_latest_diff(diff_path: Path, latest_path: Path) -> None:
+    """Point latest_path at the newest diff, where symlinks are supported."""
+    tmp_path = latest_path.with_name(f"{latest_path.name}.{os.getpid()}.tmp")
+    try:
+        os.symlink(diff_path.name, tmp_path)
+        os.replace(tmp_path, latest_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        print(f"Could not link {latest_path.name}: {e}")
+
+
+def _write_diff_rows(diff_file: BinaryIO, diff_rows: Iterator[Dict[str, str]]) -> bool:
+    """
+    Write diff_rows, with a header including the status field, to diff_file.
+    Returns False, writing nothing, if there are no rows.
+    """
+    first_diff_row = next(diff_rows, None)
+    if first_diff_row is None:
+        return False
+    # Diff file includes status field
+    diff_fieldnames = (*FIELDNAMES, "status")
+    _write_csv_rows(diff_file, diff_fieldnames, chain([first_diff_row], diff_rows))
+    return True
+
+
+def _write_diff_csv(
+    jobs_csv_path: Path, previous_path: Path, rows: List[Dict[str, str]]
+) -> Path | None:
+    """
+    Diff rows against the previous jobs CSV at previous_path and write the
+    changes next to jobs_csv_path. Returns the diff file path, or None when
+    nothing changed.
+    """
+    new_entries = _new_row_entries(rows)
+
+    # Written under a temporary name, numbered only once it is known to have
+    # changes; a merge that finds the previous file unsorted starts it over
+    tmp_path = jobs_csv_path.with_name(
+        f"{jobs_csv_path.stem}_diff{jobs_csv_path.suffix}.tmp"
+    )
+    try:
+        with open(tmp_path, "wb", buffering=IO_BUFFER_SIZE) as diff_file:
+            changed = None
+            if _is_sorted(key for key, _ in new_entries):
+                try:
+                    changed = _write_diff_rows(
+                        diff_file,
+                        _iter_merge_diff(
+                            rows, new_entries, _read_previous_rows(previous_path)
+                        ),
+                    )
+                except _PreviousRowsNotSorted:
+                    diff_file.seek(0)
+                    diff_file.truncate()
+            if changed is None:
+                # The previous file is read a second time for the diff itself
+                # rather than keeping every previous row in memory
+                previous_index = {
+                    _build_row_key(values): _canonical_row(values)
+                    for values in map(
+                        _normalize_fields, _read_previous_rows(previous_path)
+                    )
+                }
+                changed = _write_diff_rows(
+                    diff_file,
+                    _iter_diff(
+                        previous_index,
+                        rows,
+                        new_entries,
+                        _read_previous_rows(previous_path),
+                    ),
+                )
+        if not changed:  # Only create diff file if there are changes
+            tmp_path.unlink()
+            return None
+
+        diff_number = _next_diff_number(jobs_csv_path)
+        diff_filename = (
+            f"{jobs_csv_path.stem}_diff_{diff_number:0{DIFF_COUNTER_WIDTH}d}"
+            f"{jobs_csv_path.suffix}"
+        )
+        diff_path = jobs_csv_path.with_name(diff_filename)
+        os.replace(tmp_path, diff_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _link_latest_diff(
+        diff_path,
+        jobs_csv_path.with_name(
+            f"{jobs_csv_path.stem}_diff_{LATEST_DIFF_SUFFIX}{jobs_csv_path.suffix}"
+        ),
+    )
+    return diff_path
+
+
+def _write_main_csv(jobs_csv_path: Path, rows: List[Dict[str, str]]) -> None:
+    """
+    Main jobs.csv contains all current jobs (no status field). It is written
+    next to the real file and swapped in so readers never see half of it.
+    """
+    tmp_path = jobs_csv_path.with_suffix(jobs_csv_path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=IO_BUFFER_SIZE) as csvfile:
+            _write_csv_rows(csvfile, FIELDNAMES, rows)
+        os.replace(tmp_path, jobs_csv_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def write_jobs_csv(jobs_csv_path: Path, rows: List[Dict[str, str]]) -> Path | None:
     """
     Write the jobs CSV with all current jobs, and when a previous file exists,
     emit a diff file that contains only new, updated, or removed jobs with a status field.
+    Rows repeating an earlier (ats_id, url) pair are dropped.
+
+    If the rows are exactly the ones written last time (per the .fingerprint
+    sidecar) nothing is read or written at all.
 
     Returns the diff file path if one was created.
     """
     jobs_csv_path = Path(jobs_csv_path)
     jobs_csv_path.parent.mkdir(parents=True, exist_ok=True)
 
+    rows = _dedupe_rows(rows)
+
+    fingerprint_path = jobs_csv_path.with_suffix(".fingerprint")
+    fingerprint = _rows_fingerprint(rows)
+    if _is_unchanged(jobs_csv_path, fingerprint_path, fingerprint):
+        return None
+
     diff_path: Path | None = None
-    previous_rows: List[Dict[str, str]] = []
-
-    if jobs_csv_path.exists():
-        backup_path = jobs_csv_path.with_name(f"{jobs_csv_path.stem}_old{jobs_csv_path.suffix}")
-        shutil.copy2(jobs_csv_path, backup_path)
-        with open(jobs_csv_path, "r", encoding="utf-8", newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            previous_rows = list(reader)
-
-        # Normalize previous_rows: ensure ats_id exists (extract from URL if missing)
-        for row in previous_rows:
-            if "ats_id" not in row or not row.get("ats_id", "").strip():
-                url = row.get("url", "").strip()
-                extracted_ats_id = _extract_ats_id_from_url(url)
-                if extracted_ats_id:
-                    row["ats_id"] = extracted_ats_id
-            # Ensure all expected fields exist with empty defaults
-            for field in FIELDNAMES:
-                if field not in row:
-                    row[field] = ""
-
-        diff_rows = _compute_diff(previous_rows, rows)
-        if diff_rows:  # Only create diff file if there are changes
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            diff_filename = (
-                f"{jobs_csv_path.stem}_diff_{timestamp}{jobs_csv_path.suffix}"
+
+    backup_path = jobs_csv_path.with_name(
+        f"{jobs_csv_path.stem}_old{jobs_csv_path.suffix}.gz"
+    )
+    try:
+        _compress_backup(jobs_csv_path, backup_path)
+    except FileNotFoundError:
+        # No previous jobs CSV, so there is nothing to diff against
+        _write_main_csv(jobs_csv_path, rows)
+    else:
+        # The diff reads the backup copy, so the new jobs.csv can be written
+        # and swapped in at the same time
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            diff_future = executor.submit(
+                _write_diff_csv, jobs_csv_path, backup_path, rows
             )
-            diff_path = jobs_csv_path.with_name(diff_filename)
-
-            # Diff file includes status field
-            diff_fieldnames = FIELDNAMES + ["status"]
-            with open(diff_path, "w", encoding="utf-8", newline="") as diff_file:
-                writer = csv.DictWriter(diff_file, fieldnames=diff_fieldnames)
-                writer.writeheader()
-                writer.writerows(diff_rows)
-
-    # Main jobs.csv contains all current jobs (no status field)
-    with open(jobs_csv_path, "w", encoding="utf-8", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(rows)
+            _write_main_csv(jobs_csv_path, rows)
+            diff_path = diff_future.result()
+
+    stat = jobs_csv_path.stat()
+    fingerprint_path.write_text(
+        json.dumps(
+            {"rows": fingerprint, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        ),
+        encoding="utf-8",
+    )
 
     return diff_path
@@ -11,25 +11,211 @@ Usage:
 """
 
 import csv
+import hashlib
 import html
 import json
+import os
+import pickle
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from glob import glob
 from datetime import datetime
 
+import orjson
+
+from export_utils import load_json_file
+
 # Paths
 ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR
 
+# Regex patterns, compiled once at import rather than on every job
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+# Text with at least this many characters per "<" is stripped with str.find
+SPARSE_TAG_CHARS = 1024
+
+# False positive indicators checked in the context around a salary match
+# (company revenue, statistics, etc.)
+# Simplified - only check for obvious false positives like billions/millions in wrong context
+# Note: context is lowercased, so patterns should match lowercase
+_FALSE_POSITIVE_INDICATORS = [
+    r"\b(billion|billions|million|millions)\s+.*?\$",  # Only flag billions, not millions
+    r"\b(paid|pay|pays|revenue|revenues|raised|valued|valuation)\s+\d+.*?\$",  # "paid $X" but not "pay range" or "Annual Salary"
+    r"\$\s*\d+(?:,\d+)*(?:[km])?\s+in\s+revenue",  # "$500k in revenue", "$500,000 in revenue" (case-insensitive via context_lower)
+    r"\$\s*\d+(?:,\d+)*(?:[km])?\s+revenue",  # "$500k revenue", "$500,000 revenue"
+    r"\$\s*\d+(?:,\d+)*(?:[km])?\s+arr\b",  # "$500k ARR", "$750K ARR", "$500,000 ARR" (case-insensitive via context_lower)
+    r"\$\s*\d+(?:,\d+)*(?:[km])?\s+arr\s+",  # "$500k ARR " (with space after)
+]
+
+# Every indicator needs a "$" and one of these words; contexts without them
+# skip the regex search
+_FALSE_POSITIVE_KEYWORDS = (
+    "million",
+    "billion",
+    "paid",
+    "pay",
+    "revenue",
+    "raised",
+    "valued",
+    "valuation",
+    "arr",
+)
+
+# All indicators as one alternation, searched once per candidate match
+_FALSE_POSITIVE_RE = re.compile(
+    "|".join(f"(?:{indicator})" for indicator in _FALSE_POSITIVE_INDICATORS)
+)
+
+# Pattern 1: Salary range with currency symbols: "$100k-150k", "$100,000 - $150,000"
+# Handle multi-line cases and various formats
+# IMPORTANT: Range patterns must come BEFORE single value patterns to avoid matching just the first number
+_SALARY_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        # Estimated annual base salary: $93,000.00 - 135,000.00 (handles "estimated", "annual", and ranges without second currency)
+        r"(?i)(?:estimated\s+)?(?:annual\s+)?(?:base\s+)?salary[:\s]*(?:of\s+)?[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
+        # Annual Salary: $210,000 - $248,500 or $210,000&mdash;$248,500 (handles multi-line, HTML entities)
+        # Also handles European format: €155.000 - €205.000 (dots as thousand separators)
+        r"(?i)(?:annual\s+)?salary[:\s]*[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
+        # salary range: $100k-150k, compensation range: $100k-150k (most specific, highest priority)
+        # Handles both comma and dot thousand separators
+        r"(?i)(?:salary|compensation|base\s+salary|base\s+compensation)(?:\s+range)?[:\s]+[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—to]+|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
+        # salary: $100k-150k, compensation: $100k-150k
+        r"(?i)(?:salary|compensation|base\s+salary|base\s+compensation)[:\s]+[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—to]+|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
+        # $100k-150k, $100K-150K, $130,900 - $177,100, $210,000&mdash;$248,500, €155.000 - €205.000
+        # Handles both comma and dot thousand separators
+        r"[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
+        # $100k to $150k, $130,900 to $177,100
+        r"[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s+to\s+[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
+        # $100,000 - $150,000 per year
+        r"[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:per|\/)\s*(?:year|annum|annually)",
+        # Single salary: $100k, $100,000 (with salary/compensation context) - ONLY if no range found
+        r"(?i)(?:salary|compensation|base)\s+[:\s]+[\$£€¥]\s*(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|K)?(?!\s*(?:[-–—]|&mdash;|&ndash;|to)\s*[\$£€¥]?\s*\d)",
+        # Single salary: $100k, $100,000 (standalone, but check for false positives) - ONLY if no range found
+        r"[\$£€¥]\s*(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|K)?(?!\s*(?:[-–—]|&mdash;|&ndash;|to)\s*[\$£€¥]?\s*\d)\s*(?:per|\/)?\s*(?:year|annum|annually)?",
+    ]
+)
+
+# Patterns for experience requirements (ordered from most specific to least specific)
+_EXPERIENCE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        # "3+ years of experience with research operations, community engagement" - with "with" clause
+        r"(?<!\d)(\d++)\+\s+years?\s+of\s+experience\s+with\s+(?:\w+(?:\s+,\s+)?\s*)+",
+        # "3+ years of proven experience in payroll system implementation"
+        r"(?<!\d)(\d++)\+\s+years?\s+of\s+(?:proven\s+)?experience\s+in\s+\w+(?:\s+\w+)*",
+        # "Have 4+ years of experience", "Possess 2+ years of research engineering experience"
+        r"(?:have|possess|require|requires|required|need|needs)\s+(\d++)\+?\s+years?\s+(?:of\s+)?(?:\w++\s++){0,8}(?:experience|exp)",
+        # "3–5 years of social media strategy experience"
+        r"(?<!\d)(\d++)\s*[-–—to]+\s*(\d++)\+?\s+years?\s+of\s+(?:\w++\s++){0,5}(?:experience|exp)",
+        # "2–4 years building full-stack products" - with action verb
+        r"(?<!\d)(\d++)\s*[-–—to]+\s*(\d++)\+?\s+years?\s+(?:building|developing|designing|managing|working|creating|implementing|maintaining|supporting)\s+\w+(?:\s+\w+)*",
+        # "3+ years building" - with action verb
+        r"(?<!\d)(\d++)\+\s+years?\s+(?:building|developing|designing|managing|working|creating|implementing|maintaining|supporting)\s+\w+(?:\s+\w+)*",
+        # "3-5 years", "3 to 5 years", "3–5 years" with experience keyword
+        r"(?<!\d)(\d++)\s*[-–—to]+\s*(\d++)\+?\s+years?\s+(?:of\s+)?(?:\w++\s++){0,8}(?:experience|exp)",
+        # "5+ years", "5+ years of experience", "5+ years of research engineering experience"
+        r"(?<!\d)(\d++)\+\s+years?\s+(?:of\s+)?(?:\w++\s++){0,8}(?:experience|exp)",
+        # "at least 3 years", "minimum 3 years"
+        r"(?:at\s+least|minimum|min\.?)\s+(\d++)\s+years?\s+(?:of\s+)?(?:\w++\s++){0,8}(?:experience|exp)",
+        # "3-5 years" (without "experience" keyword, but with context words)
+        r"(?<!\d)(\d++)\s*[-–—to]+\s*(\d++)\+?\s+years?\s+(?:in|with|working|building|developing|designing|managing|shipping)",
+        # "5+ years" (without "experience" keyword, but with context words)
+        r"(?<!\d)(\d++)\+\s+years?\s+(?:in|with|working|building|developing|designing|managing|shipping)",
+        # "3 years experience", "5 years of experience" (without +)
+        r"(?<!\d)(\d++)\s+years?\s+(?:of\s+)?(?:\w++\s++){0,8}(?:experience|exp)",
+        # "3-5 years" (simple, without experience keyword)
+        r"(?<!\d)(\d++)\s*[-–—to]+\s*(\d++)\+?\s+years?",
+        # "5+ years" (simple, without experience keyword)
+        r"(?<!\d)(\d++)\+\s+years?",
+    ]
+)
+
+# Every salary pattern contains a currency symbol followed by a number, and
+# every experience pattern a number followed by "year(s)". One scan for that
+# rules a description out before trying each pattern in turn.
+_CURRENCY_SYMBOLS = "$£€¥"
+# Currency symbol -> code for parse_salary, in the order they are checked
+_CURRENCY_CODES = (("$", "USD"), ("€", "EUR"), ("£", "GBP"))
+_SALARY_GATE_RE = re.compile(r"[\$£€¥]\s*\d")
+_EXPERIENCE_GATE_RE = re.compile(r"\d\+?\s+years?", re.IGNORECASE)
+# Salary patterns led by a keyword ("salary", "compensation", "base") are the
+# slowest to search, and each needs the keyword just before a currency symbol.
+# One search for that decides whether any of them needs running at all.
+_SALARY_KEYWORD_PATTERNS = frozenset(_SALARY_PATTERNS[i] for i in (0, 1, 2, 3, 7))
+_SALARY_KEYWORD_GATE_RE = re.compile(
+    r"(?:salary|compensation|base)(?:\s+range)?[:\s]*(?:of\s+)?[\$£€¥]", re.IGNORECASE
+)
+
+# parse_salary: characters removed before parsing, "100k-150k" ranges and
+# "100k" single values
+_SALARY_STRIP_CHARS = _CURRENCY_SYMBOLS + ","
+_SALARY_RANGE_RE = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(?:k|K)?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*(?:k|K)?"
+)
+_SALARY_SINGLE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:k|K)?")
+
+
+# Buffer size for reading and writing the ai-*.csv file (fewer read/write syscalls)
+IO_BUFFER_SIZE = 1 << 20
+
+# Reposted and cross-listed jobs share descriptions; extraction results are
+# memoized per description (per worker process)
+EXTRACTION_CACHE_SIZE = 8192
+
+# Parsed company JSON files are pickled here between runs, keyed on the file's
+# path, mtime and size so an edited file is parsed again
+JSON_CACHE_DIR = ROOT_DIR / ".cache" / "company_json"
+
+# Company JSON files read at once by prefetch_company_json
+JSON_PREFETCH_WORKERS = 16
+
+# Job fields holding the job's URL, in order of preference
+_JOB_URL_KEYS = ("jobUrl", "url", "absolute_url", "hostedUrl")
+
 # Cache for loaded JSON files
 _json_cache: Dict[str, Dict] = {}
+# URL/ID/title -> job positions, per company JSON
+_job_indexes: Dict[str, Tuple] = {}
 _company_json_paths: Dict[str, Path] = {}
 
 
+def _load_json_cached(json_file: Path):
+    """
+    Load a company JSON file, reusing the pickled copy from an earlier run
+    when the file hasn't changed since.
+    """
+    stat = json_file.stat()
+    path_key = hashlib.sha1(str(json_file.resolve()).encode()).hexdigest()[:16]
+    pickle_path = JSON_CACHE_DIR / f"{path_key}-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+    try:
+        with open(pickle_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    data = load_json_file(json_file)
+
+    try:
+        JSON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Drop pickles of older versions of this file
+        for stale in JSON_CACHE_DIR.glob(f"{path_key}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp_path = pickle_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except OSError as e:
+        print(f"⚠️  Could not cache {json_file.name}: {e}")
+    return data
+
+
 def find_most_recent_ai_csv() -> Optional[Path]:
     """Find the most recent ai-*.csv file."""
     csv_files = glob(str(DATA_DIR / "ai-*.csv"))
@@ -48,6 +234,39 @@ def normalize_company_name(name: str) -> str:
     return name.lower().strip()
 
 
+def _strip_tags(text: str) -> str:
+    """
+    Remove HTML tags, i.e. what _HTML_TAG_RE matches. Tag-free text (most
+    plain descriptions) is returned as is; html.unescape has the same shortcut
+    for text without "&".
+
+    When tags are sparse, jumping between them with str.find is faster than
+    the regex, which walks every character; for tag-dense HTML the regex wins.
+    """
+    tag_count = text.count("<")
+    if not tag_count:
+        return text
+    if len(text) < SPARSE_TAG_CHARS * tag_count:
+        return _HTML_TAG_RE.sub("", text)
+
+    parts = []
+    pos = 0
+    start = text.find("<")
+    while start != -1:
+        end = text.find(">", start + 1)
+        if end == -1:
+            break
+        if end == start + 1:
+            # "<>" is not a tag
+            start = text.find("<", end)
+            continue
+        parts.append(text[pos:start])
+        pos = end + 1
+        start = text.find("<", pos)
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
 def process_greenhouse_content(content: Optional[str]) -> Optional[str]:
     """
     Process Greenhouse job content: decode HTML entities but keep HTML tags.
@@ -63,7 +282,7 @@ def process_greenhouse_content(content: Optional[str]) -> Optional[str]:
     decoded = decoded.replace("\xa0", " ")
 
     # Clean up extra whitespace but keep HTML structure
-    decoded = re.sub(r"\n\s*\n", "\n\n", decoded)
+    decoded = _BLANK_LINES_RE.sub("\n\n", decoded)
     decoded = decoded.strip()
 
     return decoded if decoded else None
@@ -88,7 +307,7 @@ def combine_lever_description(job: dict) -> Optional[str]:
                 content = list_item.get("content", "")
                 if content:
                     # Strip HTML tags from content
-                    content_plain = re.sub(r"<[^>]+>", "", content)
+                    content_plain = _strip_tags(content)
                     content_plain = content_plain.strip()
                     if content_plain:
                         if header:
@@ -123,25 +342,124 @@ def build_company_json_map():
             _company_json_paths[normalize_company_name(company_name)] = json_file
 
 
-def get_job_description_fast(
-    job_url: str, company: str, title: str, ats_id: str = None, ats_type: str = None
-) -> Tuple[Optional[str], float]:
+def _job_url(job: dict) -> Optional[str]:
+    return next((job[key] for key in _JOB_URL_KEYS if job.get(key)), None)
+
+
+def _build_job_index(
+    jobs: List[dict],
+) -> Tuple[Dict[str, List[int]], Dict[str, List[int]], Dict[str, List[int]]]:
     """
-    Try to quickly retrieve job description from JSON files with caching.
-    Returns (description if found, None otherwise, time_taken_in_seconds).
+    Index a company's jobs by URL, ID and lowercased title, mapping each to
+    the positions of the jobs that have it.
     """
-    start_time = time.time()
+    urls: Dict[str, List[int]] = {}
+    ids: Dict[str, List[int]] = {}
+    titles: Dict[str, List[int]] = {}
+    for position, job in enumerate(jobs):
+        if not isinstance(job, dict):
+            continue
+        job_url_field = _job_url(job)
+        if isinstance(job_url_field, str):
+            urls.setdefault(job_url_field, []).append(position)
+        job_id = job.get("id")
+        if job_id:
+            ids.setdefault(str(job_id), []).append(position)
+        job_title = job.get("title", "")
+        if job_title and isinstance(job_title, str):
+            titles.setdefault(job_title.strip().lower(), []).append(position)
+    return urls, ids, titles
+
+
+def _extract_description(job: dict, ats_type: str = None) -> Optional[str]:
+    """Description fields of a job, combined the way its ATS needs."""
+    # For Lever jobs, combine descriptionPlain, additionalPlain, and lists
+    if ats_type == "lever":
+        return combine_lever_description(job)
+    # For Greenhouse jobs, process content field (decode HTML entities, strip tags)
+    if ats_type == "greenhouse":
+        return process_greenhouse_content(job.get("content"))
+    return (
+        job.get("descriptionPlain")  # Ashby uses this
+        or job.get("description")
+        or job.get("text")
+    )
 
-    # Build map if not already built
-    build_company_json_map()
 
-    # Try to find JSON file - try exact match first, then normalized
+def _job_description(job: dict, url_match: bool, ats_type: str = None) -> Optional[str]:
+    """
+    Description of a job found by URL, ID or title (url_match says whether
+    by URL). Returns None if it has none, and the search moves on to the
+    next job.
+    """
+    description = _extract_description(job, ats_type)
+    if url_match and ats_type not in ("lever", "greenhouse"):
+        # Fallback to HTML if plain not available
+        description = description or job.get("descriptionHtml")
+        # If we got HTML, try to extract plain text (basic)
+        if (
+            description
+            and description.startswith("<")
+            and "descriptionPlain" not in str(job)
+        ):
+            # Skip HTML for now, but could add HTML parsing here
+            return None
+    if not description:
+        return None
+    if url_match and ats_type == "lever":
+        # Matched by URL, the combined Lever description is used as is
+        return description
+    return description.strip()
+
+
+def _company_json_file(company: str) -> Optional[Path]:
+    """Company JSON file - try exact match first, then normalized."""
     json_file = _company_json_paths.get(company)
     if not json_file or not json_file.exists():
-        normalized_company = normalize_company_name(company)
-        json_file = _company_json_paths.get(normalized_company)
+        json_file = _company_json_paths.get(normalize_company_name(company))
         if not json_file or not json_file.exists():
-            return None, time.time() - start_time
+            return None
+    return json_file
+
+
+def prefetch_company_json(companies: List[str]):
+    """
+    Load the JSON files for these companies into the cache ahead of the
+    lookups, reading several files at once.
+    """
+    build_company_json_map()
+
+    # Same file per cache key as the first lookup for it would pick
+    json_files: Dict[str, Path] = {}
+    for company in companies:
+        cache_key = normalize_company_name(company)
+        if cache_key in _json_cache or cache_key in json_files:
+            continue
+        json_file = _company_json_file(company)
+        if json_file:
+            json_files[cache_key] = json_file
+
+    with ThreadPoolExecutor(max_workers=JSON_PREFETCH_WORKERS) as executor:
+        futures = {
+            cache_key: executor.submit(_load_json_cached, json_file)
+            for cache_key, json_file in json_files.items()
+        }
+    for cache_key, future in futures.items():
+        # Files that fail to load are left for the lookup to report
+        if future.exception() is None:
+            _json_cache[cache_key] = future.result()
+
+
+def _find_job_description(
+    job_url: str, company: str, title: str, ats_id: str, ats_type: str
+) -> Optional[str]:
+    """Description of the job from its company's JSON file, or None."""
+    # Build map if not already built
+    build_company_json_map()
+
+    json_file = _company_json_file(company)
+    if not json_file:
+        return None
 
     # Use normalized company name for cache key
     cache_key = normalize_company_name(company)
@@ -149,10 +467,9 @@ def get_job_description_fast(
     # Load JSON with caching
     if cache_key not in _json_cache:
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                _json_cache[cache_key] = json.load(f)
+            _json_cache[cache_key] = _load_json_cached(json_file)
         except Exception:
-            return None, time.time() - start_time
+            return None
 
     data = _json_cache[cache_key]
     # Handle both dict (with "jobs" key) and list formats
@@ -161,88 +478,60 @@ def get_job_description_fast(
     elif isinstance(data, list):
         jobs = data
     else:
-        return None, time.time() - start_time
+        return None
 
     if not isinstance(jobs, list):
-        return None, time.time() - start_time
+        return None
 
-    # Search for matching job - try multiple strategies
-    for job in jobs:
-        # Strategy 1: Match by URL (most reliable)
-        job_url_field = (
-            job.get("jobUrl")
-            or job.get("url")
-            or job.get("absolute_url")
-            or job.get("hostedUrl")
+    # Only the jobs matching by URL, ID or title are checked, in file order
+    if cache_key not in _job_indexes:
+        _job_indexes[cache_key] = _build_job_index(jobs)
+    urls, ids, titles = _job_indexes[cache_key]
+    # Strategy 1: Match by URL (most reliable)
+    url_positions = set(urls.get(job_url, ()))
+    positions = set(url_positions)
+    # Strategy 2: Match by ID (for Ashby, Lever, and Greenhouse jobs)
+    if ats_id and ats_type in ("ashby", "lever", "greenhouse"):
+        positions.update(ids.get(str(ats_id), ()))
+    # Strategy 3: Match by title (fallback)
+    positions.update(titles.get(title.strip().lower(), ()))
+
+    for position in sorted(positions):
+        description = _job_description(
+            jobs[position], position in url_positions, ats_type
         )
-        if job_url_field and job_url_field == job_url:
-            # For Lever jobs, combine descriptionPlain, additionalPlain, and lists
-            if ats_type == "lever":
-                description = combine_lever_description(job)
-                if description:
-                    return description, time.time() - start_time
-            # For Greenhouse jobs, process content field (decode HTML entities, strip tags)
-            elif ats_type == "greenhouse":
-                content = job.get("content")
-                description = process_greenhouse_content(content)
-                if description:
-                    return description, time.time() - start_time
-            else:
-                description = (
-                    job.get("descriptionPlain")  # Ashby uses this
-                    or job.get("description")
-                    or job.get("text")
-                    or job.get(
-                        "descriptionHtml"
-                    )  # Fallback to HTML if plain not available
-                )
-                if description:
-                    # If we got HTML, try to extract plain text (basic)
-                    if description.startswith("<") and "descriptionPlain" not in str(
-                        job
-                    ):
-                        # Skip HTML for now, but could add HTML parsing here
-                        continue
-                    return description.strip(), time.time() - start_time
-
-        # Strategy 2: Match by ID (for Ashby, Lever, and Greenhouse jobs)
-        if ats_id and ats_type in ("ashby", "lever", "greenhouse"):
-            job_id = job.get("id")
-            if job_id and str(job_id) == str(ats_id):
-                if ats_type == "lever":
-                    description = combine_lever_description(job)
-                elif ats_type == "greenhouse":
-                    content = job.get("content")
-                    description = process_greenhouse_content(content)
-                else:
-                    description = (
-                        job.get("descriptionPlain")
-                        or job.get("description")
-                        or job.get("text")
-                    )
-                if description:
-                    return description.strip(), time.time() - start_time
+        if description is not None:
+            return description
 
-        # Strategy 3: Match by title (fallback)
-        job_title = job.get("title", "")
-        if job_title and job_title.strip().lower() == title.strip().lower():
-            if ats_type == "lever":
-                description = combine_lever_description(job)
-            elif ats_type == "greenhouse":
-                content = job.get("content")
-                description = process_greenhouse_content(content)
-            else:
-                description = (
-                    job.get("descriptionPlain")
-                    or job.get("description")
-                    or job.get("text")
-                )
-            if description:
-                return description.strip(), time.time() - start_time
+    return None
 
-    return None, time.time() - start_time
+
+def get_job_description_fast(
+    job_url: str, company: str, title: str, ats_id: str = None, ats_type: str = None
+) -> Tuple[Optional[str], float]:
+    """
+    Try to quickly retrieve job description from JSON files with caching.
+    Returns (description if found, None otherwise, time_taken_in_seconds).
+    """
+    start_ns = time.perf_counter_ns()
+    description = _find_job_description(job_url, company, title, ats_id, ats_type)
+    return description, (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def _currency_symbol(matched_text: str) -> str:
+    """Currency symbol of a salary match: $, then €, then £, otherwise ¥."""
+    return next((symbol for symbol in "$€£" if symbol in matched_text), "¥")
 
 
+def _salary_amount(value: str, has_k: bool) -> float:
+    """Salary amount as a float; "k" amounts under 1000 are in thousands."""
+    amount = float(value)
+    if has_k and amount < 1000:
+        amount *= 1000
+    return amount
+
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
 def extract_salary_from_description(
     description: str,
 ) -> Tuple[Optional[str], Optional[str]]:
@@ -254,68 +543,53 @@ def extract_salary_from_description(
     if not description:
         return None, None
 
+    # Every pattern needs a currency symbol, written out or as an HTML entity
+    if "&" not in description and not any(
+        symbol in description for symbol in _CURRENCY_SYMBOLS
+    ):
+        return None, None
+
     # Normalize description (remove HTML tags if any, decode HTML entities, lowercase for matching)
-    desc_clean = re.sub(r"<[^>]+>", "", description)
+    desc_clean = _strip_tags(description)
     # Decode HTML entities like &mdash; and &ndash; to their unicode equivalents
     desc_clean = html.unescape(desc_clean)
 
-    # Check for false positive indicators in context (company revenue, statistics, etc.)
-    # Simplified - only check for obvious false positives like billions/millions in wrong context
-    # Note: context is lowercased, so patterns should match lowercase
-    false_positive_indicators = [
-        r"\b(billion|billions|million|millions)\s+.*?\$",  # Only flag billions, not millions
-        r"\b(paid|pay|pays|revenue|revenues|raised|valued|valuation)\s+\d+.*?\$",  # "paid $X" but not "pay range" or "Annual Salary"
-        r"\$\s*\d+(?:,\d+)*(?:[km])?\s+in\s+revenue",  # "$500k in revenue", "$500,000 in revenue" (case-insensitive via context_lower)
-        r"\$\s*\d+(?:,\d+)*(?:[km])?\s+revenue",  # "$500k revenue", "$500,000 revenue"
-        r"\$\s*\d+(?:,\d+)*(?:[km])?\s+arr\b",  # "$500k ARR", "$750K ARR", "$500,000 ARR" (case-insensitive via context_lower)
-        r"\$\s*\d+(?:,\d+)*(?:[km])?\s+arr\s+",  # "$500k ARR " (with space after)
-    ]
-
-    # Pattern 1: Salary range with currency symbols: "$100k-150k", "$100,000 - $150,000"
-    # Handle multi-line cases and various formats
-    # IMPORTANT: Range patterns must come BEFORE single value patterns to avoid matching just the first number
-    patterns = [
-        # Estimated annual base salary: $93,000.00 - 135,000.00 (handles "estimated", "annual", and ranges without second currency)
-        r"(?i)(?:estimated\s+)?(?:annual\s+)?(?:base\s+)?salary[:\s]*(?:of\s+)?[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
-        # Annual Salary: $210,000 - $248,500 or $210,000&mdash;$248,500 (handles multi-line, HTML entities)
-        # Also handles European format: €155.000 - €205.000 (dots as thousand separators)
-        r"(?i)(?:annual\s+)?salary[:\s]*[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
-        # salary range: $100k-150k, compensation range: $100k-150k (most specific, highest priority)
-        # Handles both comma and dot thousand separators
-        r"(?i)(?:salary|compensation|base\s+salary|base\s+compensation)(?:\s+range)?[:\s]+[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—to]+|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
-        # salary: $100k-150k, compensation: $100k-150k
-        r"(?i)(?:salary|compensation|base\s+salary|base\s+compensation)[:\s]+[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—to]+|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
-        # $100k-150k, $100K-150K, $130,900 - $177,100, $210,000&mdash;$248,500, €155.000 - €205.000
-        # Handles both comma and dot thousand separators
-        r"[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
-        # $100k to $150k, $130,900 to $177,100
-        r"[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?\s+to\s+[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:k|K)?",
-        # $100,000 - $150,000 per year
-        r"[\$£€¥]\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:[-–—]|&mdash;|&ndash;)\s*[\$£€¥]?\s*(\d{1,3}(?:[.,]\d{3})*(?:\.\d+)?)\s*(?:per|\/)\s*(?:year|annum|annually)",
-        # Single salary: $100k, $100,000 (with salary/compensation context) - ONLY if no range found
-        r"(?i)(?:salary|compensation|base)\s+[:\s]+[\$£€¥]\s*(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|K)?(?!\s*(?:[-–—]|&mdash;|&ndash;|to)\s*[\$£€¥]?\s*\d)",
-        # Single salary: $100k, $100,000 (standalone, but check for false positives) - ONLY if no range found
-        r"[\$£€¥]\s*(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|K)?(?!\s*(?:[-–—]|&mdash;|&ndash;|to)\s*[\$£€¥]?\s*\d)\s*(?:per|\/)?\s*(?:year|annum|annually)?",
-    ]
+    if not _SALARY_GATE_RE.search(desc_clean):
+        return None, None
 
-    for pattern in patterns:
-        match = re.search(pattern, desc_clean, re.IGNORECASE)
+    has_keyword = _SALARY_KEYWORD_GATE_RE.search(desc_clean) is not None
+    # Lowercased once, on the first match, for every false positive check
+    desc_lower = None
+    for pattern in _SALARY_PATTERNS:
+        if not has_keyword and pattern in _SALARY_KEYWORD_PATTERNS:
+            continue
+        match = pattern.search(desc_clean)
         if match:
             matched_text = match.group(0)
             # Get context around the match (100 chars before and after for false positive detection)
             start = max(0, match.start() - 100)
             end = min(len(desc_clean), match.end() + 100)
-            context = desc_clean[start:end].strip()
-            context_lower = context.lower()
+            # Same bounds as .strip() on the slice
+            while start < end and desc_clean[start].isspace():
+                start += 1
+            while end > start and desc_clean[end - 1].isspace():
+                end -= 1
+            if desc_lower is None:
+                desc_lower = desc_clean.lower()
+            if len(desc_lower) == len(desc_clean):
+                context_lower = desc_lower[start:end]
+            else:
+                # Lowercasing changed some lengths, so offsets don't line up
+                context_lower = desc_clean[start:end].lower()
 
             # Check for false positive indicators
-            is_false_positive = False
-            for indicator in false_positive_indicators:
-                if re.search(indicator, context_lower):
-                    is_false_positive = True
-                    break
-
-            if is_false_positive:
+            if (
+                "$" in context_lower
+                and any(
+                    keyword in context_lower for keyword in _FALSE_POSITIVE_KEYWORDS
+                )
+                and _FALSE_POSITIVE_RE.search(context_lower)
+            ):
                 continue
 
             if len(match.groups()) == 2:
@@ -325,12 +599,9 @@ def extract_salary_from_description(
                 min_val_str = match.group(1).replace(",", "")
                 max_val_str = match.group(2).replace(",", "")
                 # Convert to float (handles decimal points like ".00" correctly)
-                min_float = float(min_val_str)
-                max_float = float(max_val_str)
-                if "k" in matched_text.lower() and min_float < 1000:
-                    min_float *= 1000
-                if "k" in matched_text.lower() and max_float < 1000:
-                    max_float *= 1000
+                has_k = "k" in matched_text.lower()
+                min_float = _salary_amount(min_val_str, has_k)
+                max_float = _salary_amount(max_val_str, has_k)
 
                 # Filter out unrealistic salaries (too high or too low)
                 # Typical salary range: $30k - $500k (allowing some flexibility)
@@ -340,15 +611,7 @@ def extract_salary_from_description(
                     continue
 
                 # Extract currency
-                currency = (
-                    "$"
-                    if "$" in matched_text
-                    else (
-                        "€"
-                        if "€" in matched_text
-                        else ("£" if "£" in matched_text else "¥")
-                    )
-                )
+                currency = _currency_symbol(matched_text)
                 # Format with commas if original had commas (preserve formatting)
                 min_str = (
                     match.group(1) if "," in match.group(1) else str(int(min_float))
@@ -365,23 +628,13 @@ def extract_salary_from_description(
                 # Single value found
                 # Handle both comma and dot thousand separators (European format uses dots)
                 val = match.group(1).replace(",", "").replace(".", "")
-                val_float = float(val)
-                if "k" in matched_text.lower() and val_float < 1000:
-                    val_float *= 1000
+                val_float = _salary_amount(val, "k" in matched_text.lower())
 
                 # Filter out unrealistic salaries
                 if val_float < 20000 or val_float > 1000000:
                     continue
 
-                currency = (
-                    "$"
-                    if "$" in matched_text
-                    else (
-                        "€"
-                        if "€" in matched_text
-                        else ("£" if "£" in matched_text else "¥")
-                    )
-                )
+                currency = _currency_symbol(matched_text)
                 # Get shorter context for return (50 chars)
                 short_start = max(0, match.start() - 50)
                 short_end = min(len(desc_clean), match.end() + 50)
@@ -391,6 +644,7 @@ def extract_salary_from_description(
     return None, None
 
 
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
 def extract_experience_from_description(
     description: str,
 ) -> Tuple[Optional[int], Optional[str]]:
@@ -402,42 +656,17 @@ def extract_experience_from_description(
         return None, None
 
     # Normalize description
-    desc_clean = re.sub(r"<[^>]+>", "", description)
+    desc_clean = _strip_tags(description)
 
-    # Patterns for experience requirements (ordered from most specific to least specific)
-    patterns = [
-        # "3+ years of experience with research operations, community engagement" - with "with" clause
-        r"(\d+)\+\s+years?\s+of\s+experience\s+with\s+(?:\w+(?:\s+,\s+)?\s*)+",
-        # "3+ years of proven experience in payroll system implementation"
-        r"(\d+)\+\s+years?\s+of\s+(?:proven\s+)?experience\s+in\s+\w+(?:\s+\w+)*",
-        # "Have 4+ years of experience", "Possess 2+ years of research engineering experience"
-        r"(?:have|possess|require|requires|required|need|needs)\s+(\d+)\+?\s+years?\s+(?:of\s+)?(?:\w+\s+){0,8}(?:experience|exp)",
-        # "3–5 years of social media strategy experience"
-        r"(\d+)\s*[-–—to]+\s*(\d+)\+?\s+years?\s+of\s+(?:\w+\s+){0,5}(?:experience|exp)",
-        # "2–4 years building full-stack products" - with action verb
-        r"(\d+)\s*[-–—to]+\s*(\d+)\+?\s+years?\s+(?:building|developing|designing|managing|working|creating|implementing|maintaining|supporting)\s+\w+(?:\s+\w+)*",
-        # "3+ years building" - with action verb
-        r"(\d+)\+\s+years?\s+(?:building|developing|designing|managing|working|creating|implementing|maintaining|supporting)\s+\w+(?:\s+\w+)*",
-        # "3-5 years", "3 to 5 years", "3–5 years" with experience keyword
-        r"(\d+)\s*[-–—to]+\s*(\d+)\+?\s+years?\s+(?:of\s+)?(?:\w+\s+){0,8}(?:experience|exp)",
-        # "5+ years", "5+ years of experience", "5+ years of research engineering experience"
-        r"(\d+)\+\s+years?\s+(?:of\s+)?(?:\w+\s+){0,8}(?:experience|exp)",
-        # "at least 3 years", "minimum 3 years"
-        r"(?:at\s+least|minimum|min\.?)\s+(\d+)\s+years?\s+(?:of\s+)?(?:\w+\s+){0,8}(?:experience|exp)",
-        # "3-5 years" (without "experience" keyword, but with context words)
-        r"(\d+)\s*[-–—to]+\s*(\d+)\+?\s+years?\s+(?:in|with|working|building|developing|designing|managing|shipping)",
-        # "5+ years" (without "experience" keyword, but with context words)
-        r"(\d+)\+\s+years?\s+(?:in|with|working|building|developing|designing|managing|shipping)",
-        # "3 years experience", "5 years of experience" (without +)
-        r"(\d+)\s+years?\s+(?:of\s+)?(?:\w+\s+){0,8}(?:experience|exp)",
-        # "3-5 years" (simple, without experience keyword)
-        r"(\d+)\s*[-–—to]+\s*(\d+)\+?\s+years?",
-        # "5+ years" (simple, without experience keyword)
-        r"(\d+)\+\s+years?",
-    ]
+    # Every pattern needs "year(s)"
+    if "year" not in desc_clean.lower():
+        return None, None
 
-    for pattern in patterns:
-        match = re.search(pattern, desc_clean, re.IGNORECASE)
+    if not _EXPERIENCE_GATE_RE.search(desc_clean):
+        return None, None
+
+    for pattern in _EXPERIENCE_PATTERNS:
+        match = pattern.search(desc_clean)
         if match:
             # Get context around the match (50 chars before and after)
             start = max(0, match.start() - 50)
@@ -454,6 +683,18 @@ def extract_experience_from_description(
     return None, None
 
 
+def _currency_code(salary_str: str) -> str:
+    """Currency of a salary string: symbols first, then codes, defaulting to USD."""
+    for symbol, code in _CURRENCY_CODES:
+        if symbol in salary_str:
+            return code
+    salary_upper = salary_str.upper()
+    for _, code in _CURRENCY_CODES:
+        if code in salary_upper:
+            return code
+    return "USD"
+
+
 def parse_salary(
     salary_str: Optional[str],
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -467,60 +708,139 @@ def parse_salary(
     # Remove common prefixes
     salary_str = salary_str.strip()
 
-    # Extract currency
-    currency = None
-    if salary_str.startswith("$") or "$" in salary_str:
-        currency = "USD"
-    elif salary_str.startswith("€") or "€" in salary_str:
-        currency = "EUR"
-    elif salary_str.startswith("£") or "£" in salary_str:
-        currency = "GBP"
-    elif "USD" in salary_str.upper():
-        currency = "USD"
-    elif "EUR" in salary_str.upper():
-        currency = "EUR"
-    elif "GBP" in salary_str.upper():
-        currency = "GBP"
-
-    # Default to USD if no currency found
-    if not currency:
-        currency = "USD"
+    currency = _currency_code(salary_str)
 
     # Remove all currency symbols and extract numbers (handle ranges like "100k-150k", "100,000-150,000", "155.000-205.000", etc.)
-    # Remove currency symbols first
-    salary_str = re.sub(r"[\$£€¥]", "", salary_str).strip()
-    # Handle comma thousand separators (remove commas, but keep decimal points)
-    # Note: We don't remove dots here because they might be decimal points (e.g., "93000.00")
+    # Commas (thousand separators) are removed along with them, but not dots,
+    # because they might be decimal points (e.g., "93000.00")
     # European format with dots as thousand separators is handled differently
-    salary_str = salary_str.replace(",", "")
+    for char in _SALARY_STRIP_CHARS:
+        salary_str = salary_str.replace(char, "")
+    has_k = "k" in salary_str.lower()
 
     # Pattern for ranges: "100k-150k" or "100000-150000" or "93000.00-135000.00"
-    range_pattern = r"(\d+(?:\.\d+)?)\s*(?:k|K)?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*(?:k|K)?"
-    match = re.search(range_pattern, salary_str)
+    match = _SALARY_RANGE_RE.search(salary_str)
     if match:
-        # Convert to float (handles decimal points correctly)
-        min_val = float(match.group(1))
-        max_val = float(match.group(2))
-        # Convert k to thousands
-        if "k" in salary_str.lower() and min_val < 1000:
-            min_val *= 1000
-        if "k" in salary_str.lower() and max_val < 1000:
-            max_val *= 1000
+        min_val = _salary_amount(match.group(1), has_k)
+        max_val = _salary_amount(match.group(2), has_k)
         return str(int(min_val)), str(int(max_val)), currency
 
     # Pattern for single value: "100k" or "100000"
-    single_pattern = r"(\d+(?:\.\d+)?)\s*(?:k|K)?"
-    match = re.search(single_pattern, salary_str)
+    match = _SALARY_SINGLE_RE.search(salary_str)
     if match:
-        val = float(match.group(1))
-        # Convert k to thousands
-        if "k" in salary_str.lower() and val < 1000:
-            val *= 1000
+        val = _salary_amount(match.group(1), has_k)
         return str(int(val)), str(int(val)), currency
 
     return None, None, None
 
 
+def _extract_job(item: tuple) -> dict:
+    """
+    Look up one job's description and extract its salary and experience.
+    item is (url, title, company, ats_id, ats_type, needs_salary,
+    needs_experience); runs in a worker process.
+    """
+    url, title, company, ats_id, ats_type, needs_salary, needs_experience = item
+    description, desc_time = get_job_description_fast(
+        url, company, title, ats_id, ats_type
+    )
+    result = {
+        "description": description,
+        "desc_time": desc_time,
+        "extracted_salary_raw": None,
+        "extracted_salary_context": None,
+        "extracted_experience": None,
+        "extracted_experience_context": None,
+        "salary_min": None,
+        "salary_max": None,
+        "salary_currency": None,
+        "salary_summary": None,
+    }
+    if not description:
+        return result
+
+    # Extract salary and experience using regex
+    if needs_salary:
+        result["extracted_salary_raw"], result["extracted_salary_context"] = (
+            extract_salary_from_description(description)
+        )
+
+    if needs_experience:
+        result["extracted_experience"], result["extracted_experience_context"] = (
+            extract_experience_from_description(description)
+        )
+
+    # Parse salary
+    if needs_salary and result["extracted_salary_raw"]:
+        salary_min, salary_max, salary_currency = parse_salary(
+            result["extracted_salary_raw"]
+        )
+        result["salary_min"] = salary_min
+        result["salary_max"] = salary_max
+        result["salary_currency"] = salary_currency
+        if salary_min and salary_max:
+            if salary_min == salary_max:
+                result["salary_summary"] = (
+                    f"${int(salary_min) / 1000:.0f}K"
+                    if salary_currency == "USD"
+                    else f"{salary_currency} {int(salary_min) / 1000:.0f}K"
+                )
+            else:
+                result["salary_summary"] = (
+                    f"${int(salary_min) / 1000:.0f}K - ${int(salary_max) / 1000:.0f}K"
+                    if salary_currency == "USD"
+                    else f"{salary_currency} {int(salary_min) / 1000:.0f}K - {int(salary_max) / 1000:.0f}K"
+                )
+
+    return result
+
+
+class ExtractionResultsWriter:
+    """
+    Streams dry-run extraction results to extraction_results_<timestamp>.json
+    as they come in, rather than keeping every result dict until the end.
+
+    The file is written next to the CSV under a .tmp name and only moved into
+    place by close(); nothing is written if no result was recorded.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.count = 0
+        self._tmp_path = directory / f"extraction_results_{os.getpid()}.json.tmp"
+        self._file = None
+
+    def write(self, result: dict):
+        try:
+            payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers over 64 bits (e.g. a long digit run
+            # matched as years of experience); the json module doesn't
+            payload = json.dumps(result, indent=2, ensure_ascii=False).encode("utf-8")
+        if self._file is None:
+            self._file = open(self._tmp_path, "wb", buffering=IO_BUFFER_SIZE)
+            self._file.write(b"[\n  ")
+        else:
+            self._file.write(b",\n  ")
+        # Indent the object one level, as an element of the list
+        self._file.write(payload.replace(b"\n", b"\n  "))
+        self.count += 1
+
+    def close(self) -> Optional[Path]:
+        """Finish the file; returns its path, or None if nothing was written."""
+        if self._file is None:
+            return None
+        self._file.write(b"\n]")
+        self._file.close()
+        self._file = None
+        output_file = (
+            self.directory
+            / f"extraction_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        os.replace(self._tmp_path, output_file)
+        return output_file
+
+
 def main():
     """Main extraction loop."""
     import argparse
@@ -557,7 +877,9 @@ def main():
     # Read CSV
     jobs = []
     fieldnames = None
-    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+    with open(
+        csv_path, "r", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE
+    ) as f:
         reader = csv.DictReader(f)
         fieldnames = reader.fieldnames
         jobs = list(reader)
@@ -595,151 +917,149 @@ def main():
     # Process jobs
     updated_count = 0
     failed_count = 0
-    extraction_results = []  # Store all extraction results for review
+    # Dry-run extraction results, kept for review
+    extraction_results = ExtractionResultsWriter(csv_path.parent)
 
+    # Jobs without a URL are skipped but keep their place in the numbering
+    entries = []
     for idx, (job, needs_salary, needs_experience) in enumerate(jobs_to_process, 1):
         url = job.get("url", "").strip()
-        title = job.get("title", "").strip()
-        company = job.get("company", "").strip()
+        if url:
+            entries.append((idx, job, needs_salary, needs_experience, url))
+
+    # Description lookup and extraction run in worker processes; results come
+    # back in order so the output reads the same as a sequential run
+    items = [
+        (
+            url,
+            job.get("title", "").strip(),
+            job.get("company", "").strip(),
+            job.get("ats_id", "").strip(),
+            job.get("ats_type", "").strip(),
+            needs_salary,
+            needs_experience,
+        )
+        for _, job, needs_salary, needs_experience, url in entries
+    ]
+    # Workers forked after this start with the files already loaded; otherwise
+    # they read the pickles written by it
+    prefetch_company_json([item[2] for item in items])
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=build_company_json_map
+    ) as executor:
+        results = executor.map(
+            _extract_job, items, chunksize=max(1, len(items) // (workers * 4))
+        )
+        for (idx, job, needs_salary, needs_experience, url), item, result in zip(
+            entries, items, results
+        ):
+            title, company = item[1], item[2]
+            print(f"[{idx}/{total_jobs}] {title[:60]}...")
+            print(f"    URL: {url}")
+
+            description = result["description"]
+            desc_time = result["desc_time"]
+            if not description:
+                print(f"    ❌ Description not found (took {desc_time:.3f}s)")
+                failed_count += 1
+                if args.dry_run:
+                    extraction_results.write(
+                        {
+                            "url": url,
+                            "title": title,
+                            "company": company,
+                            "needs_salary": needs_salary,
+                            "needs_experience": needs_experience,
+                            "description_found": False,
+                            "error": "Description not found",
+                        }
+                    )
+                continue
 
-        if not url:
-            continue
+            print(
+                f"    📝 Description retrieved ({len(description)} chars, {desc_time:.3f}s)"
+            )
 
-        print(f"[{idx}/{total_jobs}] {title[:60]}...")
-        print(f"    URL: {url}")
+            extracted_salary_raw = result["extracted_salary_raw"]
+            extracted_salary_context = result["extracted_salary_context"]
+            extracted_experience = result["extracted_experience"]
+            extracted_experience_context = result["extracted_experience_context"]
+            salary_min = result["salary_min"]
+            salary_max = result["salary_max"]
+            salary_currency = result["salary_currency"]
+            salary_summary = result["salary_summary"]
+
+            if needs_salary and extracted_salary_raw:
+                if salary_min and salary_max:
+                    print(f"    ✅ Salary extracted: {salary_summary}")
+                    print(f"        Raw: {extracted_salary_raw}")
+                    print(
+                        f"        Parsed: min={salary_min}, max={salary_max}, currency={salary_currency}"
+                    )
+                    if extracted_salary_context:
+                        print(f"        Context: ...{extracted_salary_context}...")
+                else:
+                    print(f"    ⚠️  Could not parse salary: {extracted_salary_raw}")
+            elif needs_salary:
+                print("    ⚠️  No salary found in description")
 
-        # Get description - pass ats_id and ats_type for better matching
-        ats_id = job.get("ats_id", "").strip()
-        ats_type = job.get("ats_type", "").strip()
-        description, desc_time = get_job_description_fast(
-            url, company, title, ats_id, ats_type
-        )
-        if not description:
-            print(f"    ❌ Description not found (took {desc_time:.3f}s)")
-            failed_count += 1
+            # Update experience if needed
+            if needs_experience and extracted_experience is not None:
+                print(f"    ✅ Experience extracted: {extracted_experience} years")
+                if extracted_experience_context:
+                    print(f"        Context: ...{extracted_experience_context}...")
+            elif needs_experience:
+                print("    ⚠️  No experience requirement found in description")
+
+            # Store extraction result for review
             if args.dry_run:
-                extraction_results.append(
+                # Get description snippet (first 500 chars and last 200 chars)
+                desc_snippet = (
+                    description[:500]
+                    if len(description) <= 500
+                    else description[:500] + "\n...\n" + description[-200:]
+                )
+
+                extraction_results.write(
                     {
                         "url": url,
                         "title": title,
                         "company": company,
                         "needs_salary": needs_salary,
                         "needs_experience": needs_experience,
-                        "description_found": False,
-                        "error": "Description not found",
+                        "description_found": True,
+                        "description_length": len(description),
+                        "description_snippet": desc_snippet,
+                        "extracted_salary_raw": extracted_salary_raw,
+                        "extracted_salary_context": extracted_salary_context,
+                        "extracted_salary_min": salary_min,
+                        "extracted_salary_max": salary_max,
+                        "extracted_salary_currency": salary_currency,
+                        "extracted_salary_summary": salary_summary,
+                        "extracted_experience_years": extracted_experience,
+                        "extracted_experience_context": extracted_experience_context,
+                        "current_salary_min": job.get("salary_min"),
+                        "current_salary_max": job.get("salary_max"),
+                        "current_experience_years": job.get("experience_years"),
                     }
                 )
-            continue
-
-        print(
-            f"    📝 Description retrieved ({len(description)} chars, {desc_time:.3f}s)"
-        )
 
-        # Extract salary and experience using regex
-        extracted_salary_raw = None
-        extracted_salary_context = None
-        extracted_experience = None
-        extracted_experience_context = None
+            # Update job data (for non-dry-run)
+            if not args.dry_run:
+                if needs_salary and salary_min and salary_max:
+                    job["salary_min"] = salary_min
+                    job["salary_max"] = salary_max
+                    if salary_currency:
+                        job["salary_currency"] = salary_currency
+                    job["salary_period"] = "1 YEAR"
+                    job["salary_summary"] = salary_summary
 
-        if needs_salary:
-            extracted_salary_raw, extracted_salary_context = (
-                extract_salary_from_description(description)
-            )
+                if needs_experience and extracted_experience is not None:
+                    job["experience_years"] = str(extracted_experience)
 
-        if needs_experience:
-            extracted_experience, extracted_experience_context = (
-                extract_experience_from_description(description)
-            )
-
-        # Parse salary
-        salary_min = None
-        salary_max = None
-        salary_currency = None
-        salary_summary = None
-
-        if needs_salary and extracted_salary_raw:
-            salary_min, salary_max, salary_currency = parse_salary(extracted_salary_raw)
-            if salary_min and salary_max:
-                if salary_min == salary_max:
-                    salary_summary = (
-                        f"${int(salary_min) / 1000:.0f}K"
-                        if salary_currency == "USD"
-                        else f"{salary_currency} {int(salary_min) / 1000:.0f}K"
-                    )
-                else:
-                    salary_summary = (
-                        f"${int(salary_min) / 1000:.0f}K - ${int(salary_max) / 1000:.0f}K"
-                        if salary_currency == "USD"
-                        else f"{salary_currency} {int(salary_min) / 1000:.0f}K - {int(salary_max) / 1000:.0f}K"
-                    )
-                print(f"    ✅ Salary extracted: {salary_summary}")
-                print(f"        Raw: {extracted_salary_raw}")
-                print(
-                    f"        Parsed: min={salary_min}, max={salary_max}, currency={salary_currency}"
-                )
-                if extracted_salary_context:
-                    print(f"        Context: ...{extracted_salary_context}...")
-            else:
-                print(f"    ⚠️  Could not parse salary: {extracted_salary_raw}")
-        elif needs_salary:
-            print("    ⚠️  No salary found in description")
-
-        # Update experience if needed
-        if needs_experience and extracted_experience is not None:
-            print(f"    ✅ Experience extracted: {extracted_experience} years")
-            if extracted_experience_context:
-                print(f"        Context: ...{extracted_experience_context}...")
-        elif needs_experience:
-            print("    ⚠️  No experience requirement found in description")
-
-        # Store extraction result for review
-        if args.dry_run:
-            # Get description snippet (first 500 chars and last 200 chars)
-            desc_snippet = (
-                description[:500]
-                if len(description) <= 500
-                else description[:500] + "\n...\n" + description[-200:]
-            )
-
-            extraction_results.append(
-                {
-                    "url": url,
-                    "title": title,
-                    "company": company,
-                    "needs_salary": needs_salary,
-                    "needs_experience": needs_experience,
-                    "description_found": True,
-                    "description_length": len(description),
-                    "description_snippet": desc_snippet,
-                    "extracted_salary_raw": extracted_salary_raw,
-                    "extracted_salary_context": extracted_salary_context,
-                    "extracted_salary_min": salary_min,
-                    "extracted_salary_max": salary_max,
-                    "extracted_salary_currency": salary_currency,
-                    "extracted_salary_summary": salary_summary,
-                    "extracted_experience_years": extracted_experience,
-                    "extracted_experience_context": extracted_experience_context,
-                    "current_salary_min": job.get("salary_min"),
-                    "current_salary_max": job.get("salary_max"),
-                    "current_experience_years": job.get("experience_years"),
-                }
-            )
-
-        # Update job data (for non-dry-run)
-        if not args.dry_run:
-            if needs_salary and salary_min and salary_max:
-                job["salary_min"] = salary_min
-                job["salary_max"] = salary_max
-                if salary_currency:
-                    job["salary_currency"] = salary_currency
-                job["salary_period"] = "1 YEAR"
-                job["salary_summary"] = salary_summary
-
-            if needs_experience and extracted_experience is not None:
-                job["experience_years"] = str(extracted_experience)
-
-        updated_count += 1
-        print()
+            updated_count += 1
+            print()
 
     # Write updated CSV
     if not args.dry_run and updated_count > 0:
@@ -747,16 +1067,30 @@ def main():
         backup_path = csv_path.with_suffix(
             f".backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
-        import shutil
+        tmp_path = csv_path.with_name(f"{csv_path.name}.tmp")
 
-        shutil.copy2(csv_path, backup_path)
-        print(f"💾 Backup created: {backup_path.name}")
+        # Write updated CSV next to the original, which stays intact until
+        # the new file replaces it
+        try:
+            with open(
+                tmp_path, "w", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE
+            ) as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(jobs)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # The original file becomes the backup; linking it avoids a copy
+        try:
+            os.link(csv_path, backup_path)
+        except OSError:
+            import shutil
 
-        # Write updated CSV
-        with open(csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(jobs)
+            shutil.copy2(csv_path, backup_path)
+        print(f"💾 Backup created: {backup_path.name}")
+        os.replace(tmp_path, csv_path)
 
         print(f"✅ Updated {csv_path.name}")
         print(f"   - {updated_count} jobs updated")
@@ -767,15 +1101,10 @@ def main():
         print(f"   - {failed_count} jobs would fail")
 
         # Save extraction results to file
-        if extraction_results:
-            output_file = (
-                csv_path.parent
-                / f"extraction_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            )
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(extraction_results, f, indent=2, ensure_ascii=False)
+        output_file = extraction_results.close()
+        if output_file:
             print(f"💾 Extraction results saved to: {output_file.name}")
-            print(f"   - {len(extraction_results)} extraction results recorded")
+            print(f"   - {extraction_results.count} extraction results recorded")
     else:
         print("ℹ️  No jobs were updated")
 
@@ -105,7 +105,7 @@ from models.ashby import AshbyApiResponse, AshbyJob
 from models.gh import GreenhouseJob
 from models.lever import LeverJob
 from models.workable import WorkableJob
-from pydantic import ValidationError
+import msgspec
 
 # Configure logging
 logging.basicConfig(
@@ -162,10 +162,8 @@ def extract_description_from_ashby(
 ) -> Optional[str]:
     """Extract job description from Ashby JSON file."""
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        parsed = AshbyApiResponse(**data)
+        with open(json_file, "rb") as f:
+            parsed = msgspec.json.decode(f.read(), type=AshbyApiResponse, strict=False)
 
         for job in parsed.jobs:
             job_url = job.job_url or job.apply_url or ""
@@ -213,8 +211,8 @@ def extract_description_from_greenhouse(
 
         for job_data in job_list:
             try:
-                job = GreenhouseJob(**job_data)
-            except ValidationError:
+                job = msgspec.convert(job_data, GreenhouseJob, strict=False)
+            except msgspec.ValidationError:
                 continue
 
             job_url = job.absolute_url or ""
@@ -283,8 +281,8 @@ def extract_description_from_lever(
 
         for job_data in job_list:
             try:
-                job = LeverJob(**job_data)
-            except ValidationError:
+                job = msgspec.convert(job_data, LeverJob, strict=False)
+            except msgspec.ValidationError:
                 continue
 
             job_url = job.hostedUrl or job.applyUrl or ""
@@ -318,8 +316,8 @@ def extract_description_from_workable(
 
         for job_data in job_list:
             try:
-                job = WorkableJob(**job_data)
-            except ValidationError:
+                job = msgspec.convert(job_data, WorkableJob, strict=False)
+            except msgspec.ValidationError:
                 continue
 
             job_url = job.url or job.application_url or ""
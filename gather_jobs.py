@@ -4,18 +4,117 @@ Script to gather all jobs.csv files from subdirectories and merge them into a si
 Also gathers all jobs_diff_*.csv files from subdirectories and merges them into a single jobs_diff file at the root.
 """
 
+import csv
 from datetime import datetime
-import pandas as pd
+import os
 from pathlib import Path
+from typing import Optional
 
 from export_utils import FIELDNAMES
 
 
+def _csv_header(csv_file: Path) -> list[str]:
+    """Column names of a CSV file, or [] if it has none."""
+    with open(csv_file, "r", encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _read_rows(csv_file: Path) -> tuple[list[str], list[list[str]]]:
+    """
+    Header and rows of a CSV file, read before any are merged so a bad file is
+    skipped whole. Rows are kept as lists, without a dict per row.
+    """
+    with open(csv_file, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if not header:
+            raise ValueError("No columns to parse from file")
+        # Blank lines are skipped, as csv.DictReader does
+        rows = [row for row in reader if row]
+    for row in rows:
+        if len(row) > len(header):
+            raise ValueError(f"Expected {len(header)} fields, saw more")
+    return header, rows
+
+
+def _merged_fieldnames(csv_files: list[Path]) -> list[str]:
+    """Columns of all the files, in order of appearance."""
+    fieldnames = []
+    for csv_file in csv_files:
+        try:
+            header = _csv_header(csv_file)
+        except Exception:
+            continue
+        fieldnames.extend(name for name in header if name not in fieldnames)
+    return fieldnames
+
+
+def _merge_csv_files(
+    csv_files: list[Path],
+    output_file: Path,
+    fieldnames: list[str],
+    root_dir: Path,
+    defaults: Optional[dict[str, str]] = None,
+) -> Optional[tuple[int, int]]:
+    """
+    Stream the rows of csv_files into output_file, keeping the first row for
+    each url, with defaults set on every row.
+    Returns (rows written, duplicates removed), or None without touching
+    output_file if no file could be read.
+    """
+    seen_urls = set()
+    written = 0
+    duplicates = 0
+    loaded_any = False
+    default_columns = [
+        (i, defaults[name])
+        for i, name in enumerate(fieldnames)
+        if defaults and name in defaults
+    ]
+    tmp_file = output_file.with_name(f"{output_file.name}.tmp")
+    with open(tmp_file, "w", encoding="utf-8", newline="") as out:
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(fieldnames)
+        for csv_file in csv_files:
+            try:
+                header, rows = _read_rows(csv_file)
+            except Exception as e:
+                print(f"  Error reading {csv_file.relative_to(root_dir)}: {e}")
+                continue
+            loaded_any = True
+            print(f"  Loaded {len(rows)} rows from {csv_file.relative_to(root_dir)}")
+
+            # Position of each output column in this file's rows; a repeated
+            # column name takes its last position. Columns the file lacks, or
+            # a short row doesn't reach, are written empty
+            positions = {name: i for i, name in enumerate(header)}
+            columns = [positions.get(name, len(header)) for name in fieldnames]
+            url_column = positions.get("url", len(header))
+            for row in rows:
+                # Rows without a url count as duplicates of each other
+                url = row[url_column] if url_column < len(row) else ""
+                if url in seen_urls:
+                    duplicates += 1
+                    continue
+                seen_urls.add(url)
+                out_row = [row[i] if i < len(row) else "" for i in columns]
+                for i, value in default_columns:
+                    out_row[i] = value
+                writer.writerow(out_row)
+                written += 1
+
+    if not loaded_any:
+        tmp_file.unlink()
+        return None
+    os.replace(tmp_file, output_file)
+    return written, duplicates
+
+
 def gather_jobs():
     """Find all jobs.csv files and merge them into a single file at the root. Also gather all diff files."""
     root_dir = Path(__file__).parent
     output_file = root_dir / "jobs.csv"
-    
+
     # Find all jobs.csv files in subdirectories (excluding the root)
     jobs_files = []
     for jobs_file in root_dir.rglob("jobs.csv"):
@@ -25,108 +124,82 @@ def gather_jobs():
         # Only include files in subdirectories
         if jobs_file.parent != root_dir:
             jobs_files.append(jobs_file)
-    
+
     if not jobs_files:
         print("No jobs.csv files found in subdirectories.")
         return
-    
+
     print(f"Found {len(jobs_files)} jobs.csv files:")
     for f in jobs_files:
         print(f"  - {f.relative_to(root_dir)}")
-    
-    # Read and concatenate all CSV files
-    dataframes = []
-    for jobs_file in jobs_files:
-        try:
-            df = pd.read_csv(jobs_file)
-            print(f"  Loaded {len(df)} rows from {jobs_file.relative_to(root_dir)}")
-            dataframes.append(df)
-        except Exception as e:
-            print(f"  Error reading {jobs_file.relative_to(root_dir)}: {e}")
-            continue
-    
-    if not dataframes:
+
+    # Stream all CSV files into the output, removing duplicates based on url
+    # (the unique identifier)
+    merged = _merge_csv_files(
+        jobs_files, output_file, _merged_fieldnames(jobs_files), root_dir
+    )
+    if merged is None:
         print("No data to merge.")
         return
-    
-    # Concatenate all dataframes
-    combined_df = pd.concat(dataframes, ignore_index=True)
-    
-    # Remove duplicates based on url (the unique identifier)
-    initial_count = len(combined_df)
-    combined_df = combined_df.drop_duplicates(subset=['url'], keep='first')
-    duplicates_removed = initial_count - len(combined_df)
-    
+    job_count, duplicates_removed = merged
+
     if duplicates_removed > 0:
         print(f"Removed {duplicates_removed} duplicate entries.")
-    
-    # Write to output file
-    combined_df.to_csv(output_file, index=False)
-    print(f"\nSuccessfully created {output_file} with {len(combined_df)} unique jobs.")
-    
+
+    print(f"\nSuccessfully created {output_file} with {job_count} unique jobs.")
+
     # Find all jobs_diff_*.csv files in subdirectories
     diff_files = []
     for diff_file in root_dir.rglob("jobs_diff_*.csv"):
-        # Only include files in subdirectories (not root)
-        if diff_file.parent != root_dir:
+        # Only include files in subdirectories (not root), and skip the
+        # jobs_diff_latest.csv links so no diff is counted twice
+        if diff_file.parent != root_dir and not diff_file.is_symlink():
             diff_files.append(diff_file)
-    
+
     if not diff_files:
         print("\nNo jobs_diff_*.csv files found in subdirectories.")
         return
-    
+
     print(f"\nFound {len(diff_files)} jobs_diff_*.csv files:")
     for f in diff_files:
         print(f"  - {f.relative_to(root_dir)}")
-    
-    # Read and concatenate all diff CSV files
-    diff_dataframes = []
-    for diff_file in diff_files:
-        try:
-            df = pd.read_csv(diff_file)
-            print(f"  Loaded {len(df)} rows from {diff_file.relative_to(root_dir)}")
-            diff_dataframes.append(df)
-        except Exception as e:
-            print(f"  Error reading {diff_file.relative_to(root_dir)}: {e}")
-            continue
-    
-    if not diff_dataframes:
+
+    # Create output diff file with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    diff_filename = f"{output_file.stem}_diff_{timestamp}{output_file.suffix}"
+    diff_output_file = output_file.with_name(diff_filename)
+
+    # Stream all diff CSV files into it, ensuring all expected fields exist and
+    # keeping the first occurrence of each url. This handles cases where the
+    # same job appears in multiple platform diff files
+    diff_fieldnames = _merged_fieldnames(diff_files)
+    has_status = "status" in diff_fieldnames
+    if not has_status:
+        diff_fieldnames.append("status")
+    diff_fieldnames.extend(
+        field for field in FIELDNAMES if field not in diff_fieldnames
+    )
+    merged = _merge_csv_files(
+        diff_files,
+        diff_output_file,
+        diff_fieldnames,
+        root_dir,
+        defaults=None if has_status else {"status": "new"},
+    )
+    if merged is None:
         print("No diff data to merge.")
         return
-    
-    # Concatenate all diff dataframes
-    combined_diff_df = pd.concat(diff_dataframes, ignore_index=True)
-    
+    diff_count, diff_duplicates_removed = merged
+
     # Ensure status field exists
-    if 'status' not in combined_diff_df.columns:
+    if not has_status:
         print("  Warning: status field not found in diff files, adding default 'new' status.")
-        combined_diff_df['status'] = 'new'
-    
-    # Remove duplicates based on url (keeping the first occurrence)
-    # This handles cases where the same job appears in multiple platform diff files
-    initial_diff_count = len(combined_diff_df)
-    combined_diff_df = combined_diff_df.drop_duplicates(subset=['url'], keep='first')
-    diff_duplicates_removed = initial_diff_count - len(combined_diff_df)
-    
+
     if diff_duplicates_removed > 0:
         print(f"Removed {diff_duplicates_removed} duplicate entries from diff files.")
-    
-    # Create output diff file with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    diff_filename = f"{output_file.stem}_diff_{timestamp}{output_file.suffix}"
-    diff_output_file = output_file.with_name(diff_filename)
-    
-    # Ensure all expected fields exist
-    diff_fieldnames = FIELDNAMES + ["status"]
-    for field in diff_fieldnames:
-        if field not in combined_diff_df.columns:
-            combined_diff_df[field] = ""
-    
-    # Write diff file
-    combined_diff_df.to_csv(diff_output_file, index=False)
-    print(f"\nSuccessfully created {diff_output_file.name} with {len(combined_diff_df)} diff entries.")
+
+    print(f"\nSuccessfully created {diff_output_file.name} with {diff_count} diff entries.")
 
 
 if __name__ == "__main__":
     gather_jobs()
-
@@ -1,17 +1,96 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import json
+import os
 import sys
 from pathlib import Path
 
-from pydantic import ValidationError
+import msgspec
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from export_utils import generate_job_id, write_jobs_csv  # noqa: E402
+from export_utils import (  # noqa: E402
+    FIELDNAMES,
+    generate_job_ids,
+    load_json_file,
+    write_jobs_csv,
+)
 from models.lever import LeverJob  # noqa: E402
 
 
+def _parse_file(json_file: Path, slug_to_name: dict) -> list:
+    """Job rows of one company JSON file; runs in a worker process."""
+    rows = []
+    company_slug = json_file.stem
+    # Normalize slug to lowercase for lookup (URLs are case-insensitive)
+    company_slug_lower = company_slug.lower()
+    # Try to get company name from JSON first, then from CSV mapping
+    company_name = company_slug  # fallback
+    try:
+        data = load_json_file(json_file)
+        # Check if name field exists in JSON
+        if isinstance(data, dict) and "name" in data:
+            # Ensure name is not URL-encoded (shouldn't happen, but safety check)
+            from urllib.parse import unquote
+
+            company_name = data["name"]
+            # If name looks URL-encoded, prefer CSV name instead
+            if "%" in company_name:
+                decoded_slug = unquote(company_slug_lower)
+                if company_slug_lower in slug_to_name:
+                    company_name = slug_to_name[company_slug_lower]
+                elif decoded_slug in slug_to_name:
+                    company_name = slug_to_name[decoded_slug]
+        else:
+            # Try to find in slug mapping (try both encoded and decoded versions, case-insensitive)
+            from urllib.parse import unquote
+
+            decoded_slug = unquote(company_slug_lower)
+            if company_slug_lower in slug_to_name:
+                company_name = slug_to_name[company_slug_lower]
+            elif decoded_slug in slug_to_name:
+                company_name = slug_to_name[decoded_slug]
+    except json.JSONDecodeError:
+        return []
+
+    job_list = (
+        data
+        if isinstance(data, list)
+        else data.get("postings", []) or data.get("jobs", [])
+    )
+    if not isinstance(job_list, list):
+        return []
+
+    for job_data in job_list:
+        try:
+            job = msgspec.convert(job_data, LeverJob, strict=False)
+        except msgspec.ValidationError:
+            continue
+
+        url = job.hostedUrl or job.applyUrl or ""
+        ats_id = job.id or ""
+        title = job.text or ""
+
+        location_str = ""
+        if job.categories:
+            if job.categories.location:
+                location_str = job.categories.location
+            elif job.categories.allLocations:
+                location_str = ", ".join(
+                    loc for loc in job.categories.allLocations if loc
+                )
+        if not location_str:
+            location_str = job.country or ""
+
+        rows.append((url, title, location_str, company_name, ats_id))
+
+    # Rows are collected as tuples and get their IDs in one batch
+    job_ids = generate_job_ids(("lever", row[0], row[4]) for row in rows)
+    return [dict(zip(FIELDNAMES, (*row, job_id))) for row, job_id in zip(rows, job_ids)]
+
+
 def main():
     companies_dir = Path(__file__).resolve().parent / "companies"
     jobs_csv_path = Path(__file__).resolve().parent / "jobs.csv"
@@ -43,79 +122,22 @@ def main():
     if not companies_dir.exists() or not companies_dir.is_dir():
         print(f"Companies directory does not exist: {companies_dir}")
     else:
-        for json_file in sorted(companies_dir.glob("*.json")):
-            company_slug = json_file.stem
-            # Normalize slug to lowercase for lookup (URLs are case-insensitive)
-            company_slug_lower = company_slug.lower()
-            # Try to get company name from JSON first, then from CSV mapping
-            company_name = company_slug  # fallback
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # Check if name field exists in JSON
-                if isinstance(data, dict) and "name" in data:
-                    # Ensure name is not URL-encoded (shouldn't happen, but safety check)
-                    from urllib.parse import unquote
-
-                    company_name = data["name"]
-                    # If name looks URL-encoded, prefer CSV name instead
-                    if "%" in company_name:
-                        decoded_slug = unquote(company_slug_lower)
-                        if company_slug_lower in slug_to_name:
-                            company_name = slug_to_name[company_slug_lower]
-                        elif decoded_slug in slug_to_name:
-                            company_name = slug_to_name[decoded_slug]
-                else:
-                    # Try to find in slug mapping (try both encoded and decoded versions, case-insensitive)
-                    from urllib.parse import unquote
-
-                    decoded_slug = unquote(company_slug_lower)
-                    if company_slug_lower in slug_to_name:
-                        company_name = slug_to_name[company_slug_lower]
-                    elif decoded_slug in slug_to_name:
-                        company_name = slug_to_name[decoded_slug]
-            except json.JSONDecodeError:
-                continue
-
-            job_list = (
-                data
-                if isinstance(data, list)
-                else data.get("postings", []) or data.get("jobs", [])
+        # Files are parsed in parallel; rows come back in file order
+        with os.scandir(companies_dir) as entries:
+            json_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
             )
-            if not isinstance(job_list, list):
-                continue
-
-            for job_data in job_list:
-                try:
-                    job = LeverJob(**job_data)
-                except ValidationError:
-                    continue
-
-                url = job.hostedUrl or job.applyUrl or ""
-                ats_id = job.id or ""
-                title = job.text or ""
-
-                location_str = ""
-                if job.categories:
-                    if job.categories.location:
-                        location_str = job.categories.location
-                    elif job.categories.allLocations:
-                        location_str = ", ".join(
-                            loc for loc in job.categories.allLocations if loc
-                        )
-                if not location_str:
-                    location_str = job.country or ""
-
-                job_rows.append(
-                    {
-                        "url": url,
-                        "title": title,
-                        "location": location_str,
-                        "company": company_name,
-                        "ats_id": ats_id,
-                        "id": generate_job_id("lever", url, ats_id),
-                    }
-                )
+        if json_files:
+            workers = min(os.cpu_count() or 1, len(json_files))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for rows in executor.map(
+                    partial(_parse_file, slug_to_name=slug_to_name),
+                    json_files,
+                    chunksize=4,
+                ):
+                    job_rows.extend(rows)
 
     print(f"Processed {len(job_rows)} total jobs")
     diff_path = write_jobs_csv(jobs_csv_path, job_rows)
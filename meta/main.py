@@ -6,12 +6,13 @@ This scraper fetches job listings from Meta Careers using:
 2. Playwright to fetch individual job descriptions (with caching)
 
 Caching System:
-- Descriptions are cached by job ID in meta_descriptions_cache.json
+- Descriptions are cached by job ID in the SQLite database
+  meta_descriptions_cache.db, committed as each one is fetched
 - Only NEW or UPDATED jobs need to be fetched
 - Massive time savings on subsequent runs (seconds vs hours)
 
 Performance:
-- First run: ~1171 jobs, ~40-50 minutes for all descriptions
+- First run: ~1171 jobs, descriptions fetched 8 pages at a time
 - Subsequent runs: Only new jobs fetched, typically seconds to minutes
 - Cache hits are instant, no network requests needed
 
@@ -21,15 +22,42 @@ Usage:
     python3 main.py --no-descriptions  # Skip descriptions entirely
 """
 
-import json
-import time
-from playwright.sync_api import sync_playwright
+import asyncio
+from functools import lru_cache
+import orjson
+import re
+import sqlite3
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 import os
 from typing import Optional
 from datetime import datetime
 
 JOBS_PAGE_URL = "https://www.metacareers.com/jobs"
-DESCRIPTION_CACHE_FILE = "meta_descriptions_cache.json"
+DESCRIPTION_CACHE_FILE = "meta_descriptions_cache.db"
+# Caches written by earlier versions (a single JSON object, then one object per
+# line), oldest first; imported into the database on load and then removed
+LEGACY_DESCRIPTION_CACHE_FILES = (
+    "meta_descriptions_cache.json",
+    "meta_descriptions_cache.jsonl",
+)
+# Job pages open at once while fetching descriptions
+MAX_CONCURRENT_DESCRIPTION_FETCHES = 8
+# Requests aborted in the browser; none of them carry job text. Stylesheets are
+# only blocked on the job list page, since innerText relies on CSS to leave out
+# hidden elements on job pages
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_LIST_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES | {"stylesheet"}
+# A job page is read once one of its content elements holds some text, or
+# after the timeout
+CONTENT_READY_JS = """
+    () => ['[role="main"]', 'main', 'article'].some((selector) => {
+        const element = document.querySelector(selector);
+        const text = element && (element.innerText || element.textContent);
+        return text && text.length > 200;
+    })
+"""
+CONTENT_READY_TIMEOUT_MS = 5000
 
 # Unwanted patterns to remove from job descriptions
 UNWANTED_PATTERNS = [
@@ -103,6 +131,12 @@ UNWANTED_PATTERNS = [
     "If you have any trouble, you can report an issue",
 ]
 
+# Lowercased and joined into one regex at import; lines are lowercased before
+# checking them
+UNWANTED_RE = re.compile(
+    "|".join(re.escape(pattern.lower()) for pattern in UNWANTED_PATTERNS)
+)
+
 # Patterns that indicate the end of job description content
 END_PATTERNS = [
     "©2025 Meta",
@@ -110,11 +144,38 @@ END_PATTERNS = [
     "©Meta",
     "Notice regarding automated employment decision tools",
 ]
+END_RE = re.compile("|".join(re.escape(pattern) for pattern in END_PATTERNS))
+
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+# Cleaned descriptions shorter than this are taken to be navigation only
+MIN_DESCRIPTION_LENGTH = 100
+
+
+# How _classify_line sees a line
+LINE_KEEP = 0
+LINE_UNWANTED = 1
+LINE_END = 2
+
+
+@lru_cache(maxsize=8192)
+def _classify_line(line_stripped):
+    """Check a line against END_PATTERNS and UNWANTED_PATTERNS
+
+    Navigation and footer lines repeat verbatim across job pages, so the
+    result is cached per line.
+    """
+    if END_RE.search(line_stripped):
+        return LINE_END
+    if UNWANTED_RE.search(line_stripped.lower()):
+        return LINE_UNWANTED
+    return LINE_KEEP
 
 
 def clean_job_description(raw_text):
     """Clean job description by removing navigation, footer, and unwanted content"""
-    if not raw_text:
+    # The cleaned text is made of whole lines of raw_text, so input shorter
+    # than the minimum length can't make it either
+    if not raw_text or len(raw_text) < MIN_DESCRIPTION_LENGTH:
         return None
 
     lines = raw_text.split("\n")
@@ -126,9 +187,10 @@ def clean_job_description(raw_text):
 
     for line in lines:
         line_stripped = line.strip()
+        line_kind = _classify_line(line_stripped)
 
         # Check if we've hit the end markers (copyright, footer, etc.)
-        if any(pattern in line_stripped for pattern in END_PATTERNS):
+        if line_kind == LINE_END:
             break
 
         # Skip empty lines at the beginning
@@ -136,17 +198,18 @@ def clean_job_description(raw_text):
             continue
 
         # Skip unwanted patterns
-        if any(
-            pattern.lower() in line_stripped.lower() for pattern in UNWANTED_PATTERNS
-        ):
+        if line_kind == LINE_UNWANTED:
             continue
 
         # Skip very short lines that are likely navigation
         if len(line_stripped) < 3:
             continue
 
+        # Both "+" checks below look at the lowercased line
+        line_lower = line_stripped.lower() if "+" in line_stripped else ""
+
         # Skip lines that look like "+2 more" or similar category indicators
-        if line_stripped.startswith("+") and "more" in line_stripped.lower():
+        if line_stripped.startswith("+") and "more" in line_lower:
             continue
 
         # Skip lines that are just punctuation or numbers
@@ -161,17 +224,19 @@ def clean_job_description(raw_text):
                 continue
 
         # Skip location lines (e.g., "Sunnyvale, CA +1 location")
-        if "+" in line_stripped and "location" in line_stripped.lower():
+        if "location" in line_lower:
             continue
 
+        word_count = len(line_stripped.split())
+
         # Skip lines that look like navigation (short, few words)
-        if not job_content_started and len(line_stripped.split()) <= 3:
+        if not job_content_started and word_count <= 3:
             # Skip single or double word lines at the beginning
             continue
 
         # Mark that we've started seeing real content
         # Job descriptions typically have sentences with multiple words
-        if len(line_stripped) > 50 or (len(line_stripped.split()) > 8):
+        if len(line_stripped) > 50 or word_count > 8:
             job_content_started = True
 
         cleaned_lines.append(line)
@@ -180,29 +245,50 @@ def clean_job_description(raw_text):
     cleaned_text = "\n".join(cleaned_lines)
 
     # Remove multiple consecutive newlines
-    while "\n\n\n" in cleaned_text:
-        cleaned_text = cleaned_text.replace("\n\n\n", "\n\n")
+    cleaned_text = _EXTRA_NEWLINES_RE.sub("\n\n", cleaned_text)
 
     # Remove leading/trailing whitespace
     cleaned_text = cleaned_text.strip()
 
     # Return None if cleaned text is too short (likely just navigation)
-    if len(cleaned_text) < 100:
+    if len(cleaned_text) < MIN_DESCRIPTION_LENGTH:
         return None
 
     return cleaned_text
 
 
-def fetch_job_description_playwright(job_url, browser):
+async def fetch_job_description_playwright(job_url, context):
     """Fetch job description from individual job page using Playwright"""
+    page = None
     try:
-        page = browser.new_page()
-        page.goto(job_url, wait_until="domcontentloaded", timeout=30000)
-        time.sleep(1.5)  # Wait for content to render
+        page = await context.new_page()
+        await page.goto(job_url, wait_until="domcontentloaded", timeout=30000)
+        # Wait until the job content has rendered, rather than a fixed time;
+        # pages that never get there (errors, removed jobs) are read as they are
+        try:
+            await page.wait_for_function(
+                CONTENT_READY_JS, timeout=CONTENT_READY_TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError:
+            pass
 
         # Extract job description from the page
-        raw_description = page.evaluate("""
+        raw_description = await page.evaluate("""
             () => {
+                // Drop navigation and page chrome before reading any text, so
+                // it isn't sent back only to be cleaned out. Headers inside the
+                // job content (title blocks) are kept.
+                const chromeSelector = 'nav, header, footer, [role="navigation"], [role="banner"], [role="contentinfo"]';
+                document.querySelectorAll(chromeSelector).forEach((element) => {
+                    if (
+                        element.tagName === 'HEADER' &&
+                        element.closest('main, [role="main"], article')
+                    ) {
+                        return;
+                    }
+                    element.remove();
+                });
+
                 // Try to find the main job content first
                 const contentSelectors = [
                     '[role="main"]',
@@ -230,8 +316,6 @@ def fetch_job_description_playwright(job_url, browser):
             }
         """)
 
-        page.close()
-
         # Clean the description to remove navigation and footer content
         cleaned_description = clean_job_description(raw_description)
         return cleaned_description
@@ -239,227 +323,387 @@ def fetch_job_description_playwright(job_url, browser):
     except Exception as e:
         print(f"  ✗ Error fetching {job_url}: {e}")
         return None
+    finally:
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:
+                pass
 
 
-def scrape_meta_jobs():
+async def block_resources(context, resource_types):
+    """Abort the context's requests for the given resource types"""
+
+    async def handle_route(route):
+        if route.request.resource_type in resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle_route)
+
+
+async def fetch_descriptions_playwright(jobs, cache, conn, browser):
+    """Fetch descriptions for jobs concurrently, caching them by job ID
+
+    Progress and cache updates follow the order pages finish in.
+    Returns the number of new descriptions added to the cache.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DESCRIPTION_FETCHES)
+    cached_count = 0
+    context = await browser.new_context()
+    await block_resources(context, BLOCKED_RESOURCE_TYPES)
+
+    async def bounded_fetch(job):
+        async with semaphore:
+            description = await fetch_job_description_playwright(job["url"], context)
+        return job, description
+
+    # Print progress every 5 jobs for small batches, every 25 for larger
+    interval = 5 if len(jobs) <= 50 else 25
+    desc_count = 0
+    for i, task in enumerate(
+        asyncio.as_completed([bounded_fetch(job) for job in jobs])
+    ):
+        job, description = await task
+        job["description"] = description
+        job_id = job.get("id")
+
+        # Cache the description if we have a job ID
+        if job_id and description:
+            cache[job_id] = description
+            append_cache_entry(conn, job_id, description)
+            cached_count += 1
+
+        if description:
+            desc_count += 1
+        if (i + 1) % interval == 0 or i == 0:
+            print(
+                f"  Progress: {i + 1}/{len(jobs)} fetched ({desc_count} with descriptions)"
+            )
+
+    await context.close()
+    return cached_count
+
+
+async def _with_browser(run):
+    """Launch Chromium, await run(browser) and close the browser again"""
+    async with async_playwright() as p:
+        print("Launching browser...")
+        browser = await p.chromium.launch(headless=True)
+        try:
+            return await run(browser)
+        finally:
+            await browser.close()
+
+
+async def scrape_meta_jobs_async(browser):
     """Scrape Meta jobs using Playwright for browser automation"""
     all_jobs = []
     graphql_data = []
+    # Body of each parsed response, written out as is
+    graphql_bodies = []
 
-    with sync_playwright() as p:
-        print("Launching browser...")
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        )
-        page = context.new_page()
-
-        # Capture GraphQL responses
-        def handle_response(response):
-            if "graphql" in response.url:
-                try:
-                    json_data = response.json()
-                    graphql_data.append(json_data)
-                    print(f"Captured GraphQL response from {response.url}")
-                except Exception as e:
-                    print(f"Error parsing GraphQL response: {e}")
-
-        page.on("response", handle_response)
-
-        print(f"Navigating to {JOBS_PAGE_URL}...")
-        response = page.goto(
-            JOBS_PAGE_URL, wait_until="domcontentloaded", timeout=60000
-        )
+    context = await browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    )
+    await block_resources(context, BLOCKED_LIST_RESOURCE_TYPES)
+    page = await context.new_page()
+
+    # Capture GraphQL responses
+    async def handle_response(response):
+        if "graphql" in response.url:
+            try:
+                body = await response.body()
+                json_data = orjson.loads(body)
+                graphql_data.append(json_data)
+                graphql_bodies.append(body)
+                print(f"Captured GraphQL response from {response.url}")
+            except Exception as e:
+                print(f"Error parsing GraphQL response: {e}")
+
+    page.on("response", handle_response)
+
+    print(f"Navigating to {JOBS_PAGE_URL}...")
+    response = await page.goto(
+        JOBS_PAGE_URL, wait_until="domcontentloaded", timeout=60000
+    )
+
+    actual_url = page.url
+    print(f"Actual URL after navigation: {actual_url}")
+    print(f"Response status: {response.status}")
 
-        actual_url = page.url
-        print(f"Actual URL after navigation: {actual_url}")
-        print(f"Response status: {response.status}")
-
-        # Wait for GraphQL requests to complete
-        print("Waiting for jobs to load...")
-        time.sleep(5)
-
-        print("Extracting jobs from GraphQL responses...")
-        all_jobs = []
-
-        # Process GraphQL responses if we captured any
-        if graphql_data:
-            print(f"\nProcessing {len(graphql_data)} GraphQL responses...")
-            with open("meta_graphql_responses.json", "w", encoding="utf-8") as f:
-                json.dump(graphql_data, f, indent=2)
-            print("Saved GraphQL responses to meta_graphql_responses.json")
-
-            # Try to extract jobs from GraphQL data
-            for gql_response in graphql_data:
-                if isinstance(gql_response, dict) and "data" in gql_response:
-                    # Navigate through possible GraphQL response structures
-                    data = gql_response.get("data", {})
-
-                    # Check for job_search_with_featured_jobs structure (the one Meta uses)
-                    if "job_search_with_featured_jobs" in data:
-                        job_search = data["job_search_with_featured_jobs"]
-                        job_results = job_search.get("all_jobs", [])
-
-                        if job_results:
-                            print(f"Found {len(job_results)} jobs in GraphQL response!")
-                            for job in job_results:
-                                job_id = job.get("id")
-                                # Construct URL from job ID
-                                job_url = (
-                                    f"https://www.metacareers.com/jobs/{job_id}/"
-                                    if job_id
-                                    else None
-                                )
-
-                                all_jobs.append(
-                                    {
-                                        "id": job_id,
-                                        "title": job.get("title"),
-                                        "locations": job.get("locations", []),
-                                        "teams": job.get("teams", []),
-                                        "sub_teams": job.get("sub_teams", []),
-                                        "url": job_url,
-                                    }
-                                )
-                        continue
-
-                    # Fallback: try other possible paths
-                    job_results = (
-                        data.get("job_search_results", {}).get("results", [])
-                        or data.get("jobSearchResults", {}).get("results", [])
-                        or data.get("careers", {}).get("jobs", [])
-                        or []
-                    )
+    # Wait for GraphQL requests to complete
+    print("Waiting for jobs to load...")
+    await asyncio.sleep(5)
+
+    print("Extracting jobs from GraphQL responses...")
+    all_jobs = []
+
+    # Process GraphQL responses if we captured any
+    if graphql_data:
+        print(f"\nProcessing {len(graphql_data)} GraphQL responses...")
+        with open("meta_graphql_responses.json", "wb") as f:
+            # Each body parsed as JSON, so together they make a JSON array
+            f.write(b"[" + b",".join(graphql_bodies) + b"]")
+        print("Saved GraphQL responses to meta_graphql_responses.json")
+
+        # Try to extract jobs from GraphQL data
+        for gql_response in graphql_data:
+            if isinstance(gql_response, dict) and "data" in gql_response:
+                # Navigate through possible GraphQL response structures
+                data = gql_response.get("data", {})
+
+                # Check for job_search_with_featured_jobs structure (the one Meta uses)
+                if "job_search_with_featured_jobs" in data:
+                    job_search = data["job_search_with_featured_jobs"]
+                    job_results = job_search.get("all_jobs", [])
 
                     if job_results:
                         print(f"Found {len(job_results)} jobs in GraphQL response!")
                         for job in job_results:
+                            job_id = job.get("id")
+                            # Construct URL from job ID
+                            job_url = (
+                                f"https://www.metacareers.com/jobs/{job_id}/"
+                                if job_id
+                                else None
+                            )
+
                             all_jobs.append(
                                 {
-                                    "id": job.get("id"),
+                                    "id": job_id,
                                     "title": job.get("title"),
-                                    "location": job.get("location")
-                                    or job.get("locations"),
-                                    "team": job.get("team") or job.get("teams"),
-                                    "url": job.get("posting_url") or job.get("url"),
-                                    "updated_time": job.get("updated_time"),
+                                    "locations": job.get("locations", []),
+                                    "teams": job.get("teams", []),
+                                    "sub_teams": job.get("sub_teams", []),
+                                    "url": job_url,
                                 }
                             )
+                    continue
+
+                # Fallback: try other possible paths
+                job_results = (
+                    data.get("job_search_results", {}).get("results", [])
+                    or data.get("jobSearchResults", {}).get("results", [])
+                    or data.get("careers", {}).get("jobs", [])
+                    or []
+                )
+
+                if job_results:
+                    print(f"Found {len(job_results)} jobs in GraphQL response!")
+                    for job in job_results:
+                        all_jobs.append(
+                            {
+                                "id": job.get("id"),
+                                "title": job.get("title"),
+                                "location": job.get("location") or job.get("locations"),
+                                "team": job.get("team") or job.get("teams"),
+                                "url": job.get("posting_url") or job.get("url"),
+                                "updated_time": job.get("updated_time"),
+                            }
+                        )
 
-        print(f"Total jobs extracted: {len(all_jobs)}")
+    print(f"Total jobs extracted: {len(all_jobs)}")
 
-        browser.close()
+    await context.close()
 
     return all_jobs
 
 
-def load_description_cache():
-    """Load cached descriptions from file"""
-    if os.path.exists(DESCRIPTION_CACHE_FILE):
+def scrape_meta_jobs():
+    """Scrape Meta jobs in a browser of its own"""
+    return asyncio.run(_with_browser(scrape_meta_jobs_async))
+
+
+def open_description_cache():
+    """Open the description cache database, creating it if needed
+
+    Falls back to an in-memory database (nothing is kept between runs) if
+    the file can't be opened.
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(DESCRIPTION_CACHE_FILE)
+        # WAL makes each commit an append; with synchronous=NORMAL it isn't
+        # synced to disk on every commit, and still survives a crash
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    except sqlite3.Error as e:
+        print(f"  ⚠ Warning: Could not open cache file: {e}")
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS descriptions"
+        " (id TEXT PRIMARY KEY, description TEXT) WITHOUT ROWID"
+    )
+    return conn
+
+
+def load_description_cache(conn):
+    """Load cached descriptions, importing any cache files of earlier versions"""
+    migrate_legacy_description_cache(conn)
+    try:
+        return dict(conn.execute("SELECT id, description FROM descriptions"))
+    except sqlite3.Error as e:
+        print(f"  ⚠ Warning: Could not load cache file: {e}")
+        return {}
+
+
+def _read_legacy_cache(path):
+    """Entries of an old JSON or JSONL cache file (later entries win)"""
+    with open(path, "rb") as f:
+        if not path.endswith(".jsonl"):
+            return orjson.loads(f.read())
+        cache = {}
+        for line in f:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A line cut short by an interrupted run
+                continue
+            cache[entry["id"]] = entry["description"]
+        return cache
+
+
+def migrate_legacy_description_cache(conn):
+    """Import the cache files of earlier versions into the database, once"""
+    for path in LEGACY_DESCRIPTION_CACHE_FILES:
+        if not os.path.exists(path):
+            continue
         try:
-            with open(DESCRIPTION_CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            cache = _read_legacy_cache(path)
         except Exception as e:
             print(f"  ⚠ Warning: Could not load cache file: {e}")
-            return {}
-    return {}
+            continue
+        if save_description_cache(conn, cache):
+            os.remove(path)
+            print(f"  ✓ Imported {path} into {DESCRIPTION_CACHE_FILE}")
 
 
-def save_description_cache(cache):
-    """Save description cache to file"""
+def save_description_cache(conn, cache):
+    """Add the descriptions in cache to the database, replacing existing ones"""
     try:
-        with open(DESCRIPTION_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
-    except Exception as e:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?)", cache.items()
+            )
+        return True
+    except sqlite3.Error as e:
         print(f"  ⚠ Warning: Could not save cache file: {e}")
+        return False
 
 
-def fetch_descriptions_for_jobs(all_jobs, limit=None):
+def append_cache_entry(conn, job_id, description):
+    """Store one description, committed right away"""
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?)",
+                (job_id, description),
+            )
+    except sqlite3.Error as e:
+        print(f"  ⚠ Warning: Could not save cache file: {e}")
+
+
+async def fetch_descriptions_for_jobs_async(all_jobs, browser, limit=None):
     """Fetch descriptions for all jobs using Playwright with caching
 
     Args:
         all_jobs: List of job dictionaries
+        browser: Playwright browser to open the job pages in
         limit: Maximum number of jobs to fetch descriptions for (None = all jobs)
     """
     jobs_to_process = all_jobs[:limit] if limit else all_jobs
 
     # Load cache
-    cache = load_description_cache()
-    cache_hits = 0
-    cache_misses = 0
-
-    print(f"\nFetching descriptions for {len(jobs_to_process)} jobs...")
-    if limit and limit < len(all_jobs):
-        print(f"  (Limited to first {limit} jobs out of {len(all_jobs)} total)")
-
-    if cache:
-        print(f"  Loaded cache with {len(cache)} entries")
-
-    # First pass: use cache where possible
-    jobs_needing_fetch = []
-    for job in jobs_to_process:
-        job_id = job.get("id")
-        if job_id and job_id in cache:
-            job["description"] = cache[job_id]
-            cache_hits += 1
-        else:
-            jobs_needing_fetch.append(job)
-
-    if cache_hits > 0:
-        print(f"  ✓ Using cached descriptions for {cache_hits} jobs")
-
-    # Second pass: fetch missing descriptions
-    if jobs_needing_fetch:
-        print(f"  Fetching {len(jobs_needing_fetch)} new descriptions...")
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-
-            for i, job in enumerate(jobs_needing_fetch):
-                job_url = job.get("url")
-                job_id = job.get("id")
-
-                if job_url:
-                    description = fetch_job_description_playwright(job_url, browser)
-                    job["description"] = description
-
-                    # Cache the description if we have a job ID
-                    if job_id and description:
-                        cache[job_id] = description
-                        cache_misses += 1
-
-                    # Print progress every 5 jobs for small batches, every 25 for larger
-                    interval = 5 if len(jobs_needing_fetch) <= 50 else 25
-                    if (i + 1) % interval == 0 or i == 0:
-                        desc_count = sum(
-                            1
-                            for j in jobs_needing_fetch[: i + 1]
-                            if j.get("description")
-                        )
-                        print(
-                            f"  Progress: {i + 1}/{len(jobs_needing_fetch)} fetched ({desc_count} with descriptions)"
-                        )
+    conn = open_description_cache()
+    try:
+        cache = load_description_cache(conn)
+        cache_hits = 0
+        cache_misses = 0
+
+        print(f"\nFetching descriptions for {len(jobs_to_process)} jobs...")
+        if limit and limit < len(all_jobs):
+            print(f"  (Limited to first {limit} jobs out of {len(all_jobs)} total)")
+
+        if cache:
+            print(f"  Loaded cache with {len(cache)} entries")
+
+        # First pass: use cache where possible
+        jobs_needing_fetch = []
+        for job in jobs_to_process:
+            job_id = job.get("id")
+            if job_id and job_id in cache:
+                job["description"] = cache[job_id]
+                cache_hits += 1
+            else:
+                jobs_needing_fetch.append(job)
+
+        if cache_hits > 0:
+            print(f"  ✓ Using cached descriptions for {cache_hits} jobs")
+
+        # Second pass: fetch missing descriptions
+        if jobs_needing_fetch:
+            print(f"  Fetching {len(jobs_needing_fetch)} new descriptions...")
+
+            jobs_with_url = []
+            for job in jobs_needing_fetch:
+                if job.get("url"):
+                    jobs_with_url.append(job)
                 else:
                     job["description"] = None
                     print(f"  ⚠ Job {job.get('title', 'Unknown')} has no URL")
 
-            browser.close()
+            if jobs_with_url:
+                cache_misses = await fetch_descriptions_playwright(
+                    jobs_with_url, cache, conn, browser
+                )
+
+            # New descriptions were committed to the cache as they came in
+            if cache_misses > 0:
+                print(f"  ✓ Cached {cache_misses} new descriptions")
+
+        # Set description to None for remaining jobs if limited
+        if limit:
+            for job in all_jobs[limit:]:
+                job["description"] = None
 
-        # Save updated cache
-        if cache_misses > 0:
-            save_description_cache(cache)
-            print(f"  ✓ Cached {cache_misses} new descriptions")
+        print(
+            f"  ✓ Completed fetching descriptions (Cache: {cache_hits} hits, {cache_misses} misses)"
+        )
+        return all_jobs
+    finally:
+        conn.close()
 
-    # Set description to None for remaining jobs if limited
-    if limit:
-        for job in all_jobs[limit:]:
-            job["description"] = None
 
-    print(
-        f"  ✓ Completed fetching descriptions (Cache: {cache_hits} hits, {cache_misses} misses)"
+def fetch_descriptions_for_jobs(all_jobs, limit=None):
+    """Fetch descriptions for all jobs in a browser of its own"""
+    return asyncio.run(
+        _with_browser(
+            lambda browser: fetch_descriptions_for_jobs_async(all_jobs, browser, limit)
+        )
     )
-    return all_jobs
+
+
+async def _scrape_with_descriptions(fetch_descriptions, description_limit):
+    """Scrape the job list and fetch descriptions, sharing one browser"""
+
+    async def run(browser):
+        all_jobs = await scrape_meta_jobs_async(browser)
+
+        print(f"\nTotal jobs fetched: {len(all_jobs)}")
+
+        # Fetch descriptions
+        if all_jobs and fetch_descriptions:
+            all_jobs = await fetch_descriptions_for_jobs_async(
+                all_jobs, browser, limit=description_limit
+            )
+        return all_jobs
+
+    return await _with_browser(run)
 
 
 def main(fetch_descriptions=True, description_limit=None):
@@ -470,13 +714,9 @@ def main(fetch_descriptions=True, description_limit=None):
         fetch_descriptions: Whether to fetch job descriptions (default: True)
         description_limit: Maximum number of descriptions to fetch (None = all)
     """
-    all_jobs = scrape_meta_jobs()
-
-    print(f"\nTotal jobs fetched: {len(all_jobs)}")
-
-    # Fetch descriptions
-    if all_jobs and fetch_descriptions:
-        all_jobs = fetch_descriptions_for_jobs(all_jobs, limit=description_limit)
+    all_jobs = asyncio.run(
+        _scrape_with_descriptions(fetch_descriptions, description_limit)
+    )
 
     # Wrap in standardized format
     wrapped = {
@@ -485,8 +725,8 @@ def main(fetch_descriptions=True, description_limit=None):
         "jobs": all_jobs,
     }
 
-    with open("meta.json", "w", encoding="utf-8") as f:
-        json.dump(wrapped, f, indent=2, ensure_ascii=False)
+    with open("meta.json", "wb") as f:
+        f.write(orjson.dumps(wrapped, option=orjson.OPT_INDENT_2))
 
     print(f"\nSaved {len(all_jobs)} jobs to meta.json")
     return all_jobs
@@ -506,8 +746,8 @@ def scrape_meta(
 
     if not force and os.path.exists(json_path):
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
+            with open(json_path, "rb") as f:
+                existing = orjson.loads(f.read())
             jobs = (
                 existing.get("jobs", existing)
                 if isinstance(existing, dict)
@@ -534,7 +774,7 @@ def scrape_meta(
                 else:
                     print("Existing Meta data found. Reusing without rescraping.")
                 return json_path, len(jobs), False
-        except (OSError, json.JSONDecodeError):
+        except (OSError, orjson.JSONDecodeError):
             pass
 
     jobs = main(
@@ -548,7 +788,7 @@ def scrape_meta(
 
 if __name__ == "__main__":
     # Fetch all job descriptions by default
-    # Descriptions are cached in meta_descriptions_cache.json to avoid re-fetching
+    # Descriptions are cached in meta_descriptions_cache.db to avoid re-fetching
     #
     # Options:
     #   - Fetch all: main(fetch_descriptions=True, description_limit=None)  [default]
@@ -556,8 +796,8 @@ if __name__ == "__main__":
     #   - Skip descriptions: main(fetch_descriptions=False)
     #
     # Cache benefits:
-    #   - First run: Fetches ~1171 descriptions (~40-50 minutes)
+    #   - First run: Fetches ~1171 descriptions (8 pages at a time)
     #   - Subsequent runs: Only fetches NEW jobs (seconds to minutes)
-    #   - To clear cache: delete meta_descriptions_cache.json
+    #   - To clear cache: delete meta_descriptions_cache.db
 
     scrape_meta(force=True, fetch_descriptions=True, description_limit=None)
@@ -1,96 +1,79 @@
-from pydantic import BaseModel, Field, field_validator
+import msgspec
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
 
-class Address(BaseModel):
-    postal_address: Optional[Dict[str, str]] = Field(
-        alias="postalAddress", default=None
-    )
+# Field names are snake_case; Ashby's JSON keys are their camelCase forms
+class Address(msgspec.Struct, kw_only=True, rename="camel"):
+    postal_address: Optional[Dict[str, str]] = None
 
 
-class CompensationComponent(BaseModel):
+class CompensationComponent(msgspec.Struct, kw_only=True, rename="camel"):
     id: Optional[str] = None
     summary: Optional[str] = None
-    compensation_type: str = Field(alias="compensationType")
+    compensation_type: str
     interval: Optional[str] = None
-    currency_code: Optional[str] = Field(alias="currencyCode", default=None)
-    min_value: Optional[float] = Field(alias="minValue", default=None)
-    max_value: Optional[float] = Field(alias="maxValue", default=None)
+    currency_code: Optional[str] = None
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
 
 
-class CompensationTier(BaseModel):
+class CompensationTier(msgspec.Struct, kw_only=True, rename="camel"):
     id: str
-    tier_summary: str = Field(alias="tierSummary")
+    tier_summary: str
     title: Optional[str] = None
-    additional_information: Optional[str] = Field(
-        alias="additionalInformation", default=None
-    )
+    additional_information: Optional[str] = None
     components: List[CompensationComponent]
 
 
-class Compensation(BaseModel):
-    compensation_tier_summary: Optional[str] = Field(
-        alias="compensationTierSummary", default=None
-    )
-    scrapeable_compensation_salary_summary: Optional[str] = Field(
-        alias="scrapeableCompensationSalarySummary", default=None
-    )
-    compensation_tiers: List[CompensationTier] = Field(
-        alias="compensationTiers", default_factory=list
-    )
-    summary_components: List[CompensationComponent] = Field(
-        alias="summaryComponents", default_factory=list
-    )
+class Compensation(msgspec.Struct, kw_only=True, rename="camel"):
+    compensation_tier_summary: Optional[str] = None
+    scrapeable_compensation_salary_summary: Optional[str] = None
+    compensation_tiers: List[CompensationTier] = []
+    summary_components: List[CompensationComponent] = []
 
 
-class AshbyJob(BaseModel):
+class AshbyJob(msgspec.Struct, kw_only=True, rename="camel"):
     id: str
     title: str
     department: str
     team: str
-    employment_type: str = Field(alias="employmentType")
+    employment_type: str
     location: str
-    should_display_compensation_on_job_postings: bool = Field(
-        alias="shouldDisplayCompensationOnJobPostings"
-    )
-    secondary_locations: List[Union[str, Dict[str, Any]]] = Field(
-        alias="secondaryLocations", default_factory=list
-    )
-    published_at: datetime = Field(alias="publishedAt")
-    is_listed: bool = Field(alias="isListed")
-    is_remote: Optional[bool] = Field(alias="isRemote", default=None)
+    should_display_compensation_on_job_postings: bool
+    secondary_locations: Optional[List[Union[str, Dict[str, Any]]]] = []
+    published_at: datetime
+    is_listed: bool
+    is_remote: Optional[bool] = None
     address: Optional[Address] = None
-    job_url: str = Field(alias="jobUrl")
-    apply_url: str = Field(alias="applyUrl")
-    description_html: str = Field(alias="descriptionHtml")
-    description_plain: str = Field(alias="descriptionPlain")
+    job_url: str
+    apply_url: str
+    description_html: str
+    description_plain: str
     compensation: Optional[Compensation] = None
 
-    @field_validator("secondary_locations", mode="before")
-    @classmethod
-    def convert_secondary_locations(cls, v):
+    def __post_init__(self):
         """Convert dict locations to strings."""
-        if not v:
-            return []
         result = []
-        for item in v:
+        for item in self.secondary_locations or []:
             if isinstance(item, dict):
                 # Extract location string from dict
-                result.append(item.get("location", ""))
-            else:
-                result.append(item)
-        return result
+                item = item.get("location", "")
+            if not isinstance(item, str):
+                raise TypeError("secondaryLocations entries must be strings")
+            result.append(item)
+        self.secondary_locations = result
 
 
-class AshbyApiResponse(BaseModel):
+class AshbyApiResponse(msgspec.Struct, kw_only=True, rename="camel"):
     jobs: List[AshbyJob]
-    api_version: str = Field(alias="apiVersion")
+    api_version: str
+    # Company name, added to the saved files by ashby/main.py
+    name: Optional[str] = None
 
 
 # Example usage:
-# response_data = {...}  # Your JSON data
-# ashby_response = AshbyApiResponse(**response_data)
+# ashby_response = msgspec.json.decode(raw_bytes, type=AshbyApiResponse, strict=False)
 # print(f"Found {len(ashby_response.jobs)} jobs")
 # for job in ashby_response.jobs:
 #     print(f"- {job.title} at {job.location}")
@@ -1,6 +1,6 @@
 import pydantic
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -18,7 +18,7 @@ class DatabaseJob(pydantic.BaseModel):
     description: Optional[str] = None
     employment_type: Optional[str] = None
     industry: Optional[str] = None
-    embedding: Optional[str] = None  # vector type
+    embedding: Optional[List[float]] = None  # vector(1536)
     posted_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
     source: Optional[str] = None
@@ -28,7 +28,7 @@ class DatabaseJob(pydantic.BaseModel):
     wfh: Optional[bool] = None
     application_url: Optional[str] = None
     language: Optional[str] = None
-    title_embedding: Optional[str] = None  # vector type
+    title_embedding: Optional[List[float]] = None  # vector(1536)
     verified_at: Optional[datetime] = None
     lon: Optional[float] = None
     lat: Optional[float] = None
@@ -41,3 +41,4 @@ class DatabaseJob(pydantic.BaseModel):
     city: Optional[str] = None
     ats_type: Optional[str] = None
     company_id: Optional[UUID] = None
+    description_hash: Optional[str] = None  # hash of the embedded description
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
+import msgspec
 from typing import List, Optional, Any, Union, Dict
 
-class DataComplianceItem(BaseModel):
+class DataComplianceItem(msgspec.Struct):
     type: Optional[str]
     requires_consent: Optional[bool]
     requires_processing_consent: Optional[bool]
@@ -9,29 +9,29 @@ class DataComplianceItem(BaseModel):
     retention_period: Optional[Any]
     demographic_data_consent_applies: Optional[bool]
 
-class Location(BaseModel):
+class Location(msgspec.Struct):
     name: Optional[str]
 
-class MetadataItem(BaseModel):
+class MetadataItem(msgspec.Struct):
     id: Optional[int]
     name: Optional[str]
     value: Optional[Union[str, List[str], Dict[str, Any], bool]]
     value_type: Optional[str]
 
-class Department(BaseModel):
+class Department(msgspec.Struct):
     id: Optional[int]
     name: Optional[str]
     child_ids: Optional[List[int]]
     parent_id: Optional[Union[int, None]]
 
-class Office(BaseModel):
+class Office(msgspec.Struct):
     id: Optional[int]
     name: Optional[str]
     location: Optional[str]
     child_ids: Optional[List[int]]
     parent_id: Optional[Union[int, None]]
 
-class GreenhouseJob(BaseModel):
+class GreenhouseJob(msgspec.Struct):
     absolute_url: Optional[str]
     data_compliance: Optional[List[DataComplianceItem]]
     internal_job_id: Optional[int]
@@ -1,15 +1,15 @@
-from pydantic import BaseModel
+import msgspec
 from typing import List, Optional, Any
 
 
-class Categories(BaseModel):
+class Categories(msgspec.Struct):
     location: Optional[str] = None
     team: Optional[str] = None
     commitment: Optional[str] = None
     allLocations: Optional[List[str]] = None
 
 
-class LeverJob(BaseModel):
+class LeverJob(msgspec.Struct):
     additional: Optional[str] = None
     additionalPlain: Optional[str] = None
     categories: Optional[Categories] = None
@@ -1,8 +1,8 @@
 from typing import List, Optional
-from pydantic import BaseModel
+import msgspec
 
 
-class Location(BaseModel):
+class Location(msgspec.Struct):
     country: Optional[str]
     countryCode: Optional[str]
     city: Optional[str]
@@ -10,7 +10,7 @@ class Location(BaseModel):
     hidden: Optional[bool]
 
 
-class WorkableJob(BaseModel):
+class WorkableJob(msgspec.Struct):
     title: Optional[str]
     shortcode: Optional[str]
     code: Optional[str]
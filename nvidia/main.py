@@ -1,5 +1,8 @@
-import requests
-import json
+import asyncio
+import httpx
+import msgspec
+import orjson
+import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,12 +18,18 @@ DETAILS_ENDPOINT = f"{BASE_URL}/api/pcsx/position_details"
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 OUTPUT_FILE = SCRIPT_DIR / "nvidia.json"
+# One job per line, appended to as descriptions are fetched; also the
+# description cache for the next run
+JOBS_FILE = SCRIPT_DIR / "nvidia.jobs.ndjson"
+# last_scraped and count, so checking freshness doesn't read every job
+META_FILE = SCRIPT_DIR / "nvidia.meta.json"
 
 PAGE_SIZE = 10  # Use API's supported page size
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
 RATE_LIMIT_DELAY = 0.5  # seconds between requests
-DETAILS_DELAY = 0.5  # seconds between detail requests
+DETAILS_MAX_CONCURRENCY = 16  # Detail requests in flight at once
+DETAILS_RATE_LIMIT = 8  # Detail requests per second, in total
 WRITE_BATCH_SIZE = 5  # Write output every N pages
 
 HEADERS = {"accept": "application/json, text/plain, */*", "user-agent": "Mozilla/5.0"}
@@ -32,8 +41,7 @@ HEADERS = {"accept": "application/json, text/plain, */*", "user-agent": "Mozilla
 
 def load_output():
     if OUTPUT_FILE.exists():
-        with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(OUTPUT_FILE.read_bytes())
 
     return {"last_scraped": None, "company": COMPANY, "count": 0, "jobs": []}
 
@@ -42,8 +50,114 @@ def write_output(data):
     data["last_scraped"] = datetime.now(timezone.utc).isoformat()
     data["count"] = len(data["jobs"])
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    OUTPUT_FILE.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
+    # Drops the jobs that are gone, and any written twice by interrupted runs
+    write_jobs(data["jobs"])
+    META_FILE.write_bytes(
+        orjson.dumps(
+            {"last_scraped": data["last_scraped"], "company": COMPANY, "count": data["count"]},
+            option=orjson.OPT_INDENT_2,
+        )
+    )
+
+
+def load_meta():
+    if META_FILE.exists():
+        return orjson.loads(META_FILE.read_bytes())
+
+    # nvidia.json from before META_FILE existed
+    data = load_output()
+    return {"last_scraped": data.get("last_scraped"), "company": COMPANY, "count": len(data.get("jobs", []))}
+
+
+def job_line(job):
+    return orjson.dumps(job, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+
+
+def write_jobs(jobs):
+    tmp_file = JOBS_FILE.with_name(f"{JOBS_FILE.name}.tmp")
+    with open(tmp_file, "wb") as f:
+        for job in jobs:
+            f.write(job_line(job))
+    os.replace(tmp_file, JOBS_FILE)
+
+
+class SavedJobId(msgspec.Struct):
+    eightfold_id: int | str | None = None
+
+
+# Decodes only the id; the other fields of the line are skipped over
+decode_saved_job_id = msgspec.json.Decoder(SavedJobId).decode
+
+
+def index_saved_jobs():
+    """
+    Byte offset in JOBS_FILE of the last line written for each job id, so a
+    saved job is only read (with read_saved_job) if it is still listed. An
+    older nvidia.json without JOBS_FILE is converted first.
+    """
+    if not JOBS_FILE.exists():
+        if not OUTPUT_FILE.exists():
+            return {}
+        write_jobs(load_output().get("jobs", []))
+
+    offsets = {}
+    offset = 0
+    with open(JOBS_FILE, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Cut short by a run that was killed mid-write
+                break
+            try:
+                job_id = decode_saved_job_id(line).eightfold_id
+            except msgspec.DecodeError:
+                job_id = None
+            if job_id:
+                offsets[job_id] = offset
+            offset += len(line)
+    if offset < JOBS_FILE.stat().st_size:
+        # Drop the partial last line, so this run's jobs aren't appended onto it
+        os.truncate(JOBS_FILE, offset)
+    return offsets
+
+
+def read_saved_job(f, offset):
+    f.seek(offset)
+    return orjson.loads(f.readline())
+
+
+class RateLimiter:
+    """Spaces out calls from any number of tasks to at most `rate` per second"""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate
+        self._next_slot = 0.0
+
+    async def wait(self):
+        slot = max(self._next_slot, time.monotonic())
+        self._next_slot = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+DETAILS_LIMITER = RateLimiter(DETAILS_RATE_LIMIT)
+
+
+# One shared copy of each location/department string; across thousands of
+# jobs only a few hundred of these are distinct
+_STR_POOL: dict[str, str] = {}
+
+
+def _intern(value):
+    """value with its string, or the strings of a list, from _STR_POOL"""
+    if isinstance(value, str):
+        return _STR_POOL.setdefault(value, value)
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
 
 
 def ts_to_date(ts):
@@ -57,7 +171,7 @@ def ts_to_date(ts):
 # -----------------------
 
 
-def fetch_page(start):
+async def fetch_page(client, start):
     """Fetch a page of jobs with retry logic"""
     params = {
         "domain": "nvidia.com",
@@ -70,12 +184,7 @@ def fetch_page(start):
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             start_time = time.time()
-            r = requests.get(
-                SEARCH_ENDPOINT,
-                params=params,
-                headers=HEADERS,
-                timeout=15,
-            )
+            r = await client.get(SEARCH_ENDPOINT, params=params)
             elapsed = time.time() - start_time
             r.raise_for_status()
 
@@ -83,39 +192,39 @@ def fetch_page(start):
             if elapsed > 5:
                 print(f"  ⏱️  Slow request: {elapsed:.1f}s for start={start}")
 
-            return r.json().get("data", {}).get("positions", [])
+            return orjson.loads(r.content).get("data", {}).get("positions", [])
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             print(f"⏱️  Timeout on attempt {attempt}/{MAX_RETRIES}")
             if attempt == MAX_RETRIES:
                 raise
-            time.sleep(RETRY_DELAY * attempt)
+            await asyncio.sleep(RETRY_DELAY * attempt)
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:  # Rate limit
                 wait_time = RETRY_DELAY * (2**attempt)
                 print(f"⏸️  Rate limited, waiting {wait_time}s...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             elif e.response.status_code >= 500:  # Server error
                 print(
                     f"🔴 Server error {e.response.status_code} on attempt {attempt}/{MAX_RETRIES}"
                 )
                 if attempt == MAX_RETRIES:
                     raise
-                time.sleep(RETRY_DELAY * attempt)
+                await asyncio.sleep(RETRY_DELAY * attempt)
             else:
                 raise
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
             print(f"⚠️  Request error on attempt {attempt}/{MAX_RETRIES}: {e}")
             if attempt == MAX_RETRIES:
                 raise
-            time.sleep(RETRY_DELAY * attempt)
+            await asyncio.sleep(RETRY_DELAY * attempt)
 
     return []
 
 
-def fetch_job_details(position_id):
+async def fetch_job_details(client, position_id):
     """Fetch detailed job information including description"""
     params = {
         "position_id": position_id,
@@ -124,50 +233,46 @@ def fetch_job_details(position_id):
     }
 
     for attempt in range(1, MAX_RETRIES + 1):
+        await DETAILS_LIMITER.wait()
         try:
-            r = requests.get(
-                DETAILS_ENDPOINT,
-                params=params,
-                headers=HEADERS,
-                timeout=15,
-            )
+            r = await client.get(DETAILS_ENDPOINT, params=params)
             r.raise_for_status()
-            data = r.json().get("data", {})
+            data = orjson.loads(r.content).get("data", {})
             return {
                 "description": data.get("jobDescription"),
                 "standardized_locations": data.get("standardizedLocations", []),
             }
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             print(
                 f"⏱️  Timeout fetching details for {position_id} (attempt {attempt}/{MAX_RETRIES})"
             )
             if attempt == MAX_RETRIES:
                 return None
-            time.sleep(RETRY_DELAY * attempt)
+            await asyncio.sleep(RETRY_DELAY * attempt)
 
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 wait_time = RETRY_DELAY * (2**attempt)
                 print(f"⏸️  Rate limited on details, waiting {wait_time}s...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             elif e.response.status_code >= 500:
                 print(
                     f"🔴 Server error {e.response.status_code} on details (attempt {attempt}/{MAX_RETRIES})"
                 )
                 if attempt == MAX_RETRIES:
                     return None
-                time.sleep(RETRY_DELAY * attempt)
+                await asyncio.sleep(RETRY_DELAY * attempt)
             else:
                 return None
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
             print(
                 f"⚠️  Request error fetching details for {position_id} (attempt {attempt}/{MAX_RETRIES}): {e}"
             )
             if attempt == MAX_RETRIES:
                 return None
-            time.sleep(RETRY_DELAY * attempt)
+            await asyncio.sleep(RETRY_DELAY * attempt)
 
     return None
 
@@ -177,123 +282,167 @@ def fetch_job_details(position_id):
 # -----------------------
 
 
-def main():
-    print("▶ Starting scrape (caching enabled for performance)")
-
-    # Load existing data for description caching
-    existing_data = load_output()
-    description_cache = {}
-
-    if existing_data.get("jobs"):
-        print(f"📦 Loading {len(existing_data['jobs'])} cached job descriptions...")
-        for job in existing_data["jobs"]:
-            job_id = job.get("eightfold_id")
-            if job_id and job.get("description"):
-                description_cache[job_id] = {
-                    "description": job["description"],
-                    "standardized_locations": job.get("standardized_locations"),
-                }
-        print(f"✓ Cached {len(description_cache)} job descriptions")
-
-    # Step 1: Fetch all job listings (fast, just metadata)
-    print("\n🔍 Step 1: Fetching all job listings (metadata only)...")
-    all_positions = []
-    start = 0
-    page_count = 0
-    consecutive_empty = 0
-    MAX_CONSECUTIVE_EMPTY = 3
-
-    while True:
-        try:
-            positions = fetch_page(start)
-
-            if not positions:
-                consecutive_empty += 1
-                if consecutive_empty >= MAX_CONSECUTIVE_EMPTY:
-                    print("✓ No more job listings")
-                    break
-                start += PAGE_SIZE
-                time.sleep(RATE_LIMIT_DELAY)
-                continue
-
-            consecutive_empty = 0
-            all_positions.extend(positions)
-            page_count += 1
+def _interrupted():
+    """
+    Take back the cancellation asyncio.run sends on Ctrl-C, so the jobs
+    gathered so far are still written out.
+    """
+    asyncio.current_task().uncancel()
+    print("\n⏹️  Interrupted by user")
 
-            print(f"  📄 Page {page_count}: {len(positions)} jobs | Total: {len(all_positions)}")
 
-            start += PAGE_SIZE
-            time.sleep(RATE_LIMIT_DELAY)
+async def scrape_async():
+    print("▶ Starting scrape (caching enabled for performance)")
 
-        except KeyboardInterrupt:
-            print("\n⏹️  Interrupted by user")
-            break
-        except Exception as e:
-            print(f"❌ Error fetching page: {e}")
-            break
+    # Index the jobs saved by earlier runs for description caching
+    print("📦 Indexing cached jobs...")
+    saved_offsets = index_saved_jobs()
+    print(f"✓ Indexed {len(saved_offsets)} cached jobs")
+
+    # One client for the whole run, so every request reuses the pooled
+    # connections; over HTTP/2 the detail requests share a single one
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=HEADERS,
+        timeout=15,
+        limits=httpx.Limits(
+            max_connections=DETAILS_MAX_CONCURRENCY,
+            max_keepalive_connections=DETAILS_MAX_CONCURRENCY,
+        ),
+    ) as client:
+        # Step 1: Fetch all job listings (fast, just metadata)
+        print("\n🔍 Step 1: Fetching all job listings (metadata only)...")
+        all_positions = []
+        start = 0
+        page_count = 0
+        consecutive_empty = 0
+        MAX_CONSECUTIVE_EMPTY = 3
+
+        while True:
+            try:
+                positions = await fetch_page(client, start)
+
+                if not positions:
+                    consecutive_empty += 1
+                    if consecutive_empty >= MAX_CONSECUTIVE_EMPTY:
+                        print("✓ No more job listings")
+                        break
+                    start += PAGE_SIZE
+                    await asyncio.sleep(RATE_LIMIT_DELAY)
+                    continue
+
+                consecutive_empty = 0
+                all_positions.extend(positions)
+                page_count += 1
+
+                print(f"  📄 Page {page_count}: {len(positions)} jobs | Total: {len(all_positions)}")
 
-    print(f"\n✓ Fetched {len(all_positions)} total job listings")
+                start += PAGE_SIZE
+                await asyncio.sleep(RATE_LIMIT_DELAY)
 
-    # Step 2: Build jobs with cached or new descriptions
-    print("\n🔍 Step 2: Fetching descriptions (only for new/changed jobs)...")
+            except asyncio.CancelledError:
+                _interrupted()
+                break
+            except Exception as e:
+                print(f"❌ Error fetching page: {e}")
+                break
 
-    output = {"last_scraped": None, "company": COMPANY, "count": 0, "jobs": []}
-    seen_ids = set()
-    cached_count = 0
-    fetched_count = 0
+        print(f"\n✓ Fetched {len(all_positions)} total job listings")
 
-    for idx, p in enumerate(all_positions, 1):
-        job_id = p["id"]
+        # Step 2: Build jobs with cached or new descriptions
+        print("\n🔍 Step 2: Fetching descriptions (only for new/changed jobs)...")
 
-        if job_id in seen_ids:
-            continue
-        seen_ids.add(job_id)
+        output = {"last_scraped": None, "company": COMPANY, "count": 0, "jobs": []}
+        seen_ids = set()
+        cached_count = 0
+        fetched_count = 0
+        to_fetch = {}  # job_id -> job_data still waiting for its description
 
-        try:
-            job_data = {
-                "eightfold_id": job_id,
-                "jr_id": p.get("displayJobId"),
-                "title": p.get("name"),
-                "locations": p.get("locations", []),
-                "department": p.get("department"),
-                "work_location_option": p.get("workLocationOption"),
-                "posted_at": ts_to_date(p.get("postedTs")),
-                "created_at": ts_to_date(p.get("creationTs")),
-                "url": BASE_URL + p.get("positionUrl"),
-            }
+        # Cached jobs are read from JOBS_FILE at their offsets, and each fetched
+        # job is appended to it right away so an interrupted or failed run
+        # doesn't have to fetch it again
+        with open(JOBS_FILE, "a+b") as jobs_file:
+            for idx, p in enumerate(all_positions, 1):
+                job_id = p["id"]
 
-            # Check cache first
-            if job_id in description_cache:
-                cached_desc = description_cache[job_id]
-                job_data["description"] = cached_desc["description"]
-                if cached_desc.get("standardized_locations"):
-                    job_data["standardized_locations"] = cached_desc["standardized_locations"]
-                cached_count += 1
+                if job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
 
-                if idx % 100 == 0:
-                    print(f"  Progress: {idx}/{len(all_positions)} | Cached: {cached_count} | Fetched: {fetched_count}")
-            else:
-                # Fetch description for new job
-                details = fetch_job_details(job_id)
-                if details:
-                    job_data["description"] = details.get("description")
-                    if details.get("standardized_locations"):
-                        job_data["standardized_locations"] = details["standardized_locations"]
+                try:
+                    job_data = {
+                        "eightfold_id": job_id,
+                        "jr_id": p.get("displayJobId"),
+                        "title": p.get("name"),
+                        "locations": _intern(p.get("locations", [])),
+                        "department": _intern(p.get("department")),
+                        "work_location_option": _intern(p.get("workLocationOption")),
+                        "posted_at": ts_to_date(p.get("postedTs")),
+                        "created_at": ts_to_date(p.get("creationTs")),
+                        "url": BASE_URL + p.get("positionUrl"),
+                    }
+                except Exception as e:
+                    print(f"⚠️  Error processing job {job_id}: {e}")
+                    continue
+
+                # Check cache first
+                cached_job = None
+                if job_id in saved_offsets:
+                    cached_job = read_saved_job(jobs_file, saved_offsets[job_id])
+                if cached_job and cached_job.get("description"):
+                    job_data["description"] = cached_job["description"]
+                    if cached_job.get("standardized_locations"):
+                        job_data["standardized_locations"] = cached_job["standardized_locations"]
+                    cached_count += 1
+
+                    if idx % 100 == 0:
+                        print(f"  Progress: {idx}/{len(all_positions)} | Cached: {cached_count}")
                 else:
-                    job_data["description"] = None
-
-                fetched_count += 1
-                print(f"  [{idx}/{len(all_positions)}] 🆕 Fetched: {p.get('name', 'Unknown')[:60]}")
-                time.sleep(DETAILS_DELAY)
-
-            output["jobs"].append(job_data)
-
-        except KeyboardInterrupt:
-            print("\n⏹️  Interrupted by user")
-            break
-        except Exception as e:
-            print(f"⚠️  Error processing job {job_id}: {e}")
-            continue
+                    to_fetch[job_id] = job_data
+
+                output["jobs"].append(job_data)
+
+            # Fetch descriptions for new jobs concurrently; the semaphore bounds the
+            # requests in flight and DETAILS_LIMITER the overall request rate
+            print(f"  {len(to_fetch)} new jobs to fetch, {DETAILS_MAX_CONCURRENCY} at a time")
+            semaphore = asyncio.Semaphore(DETAILS_MAX_CONCURRENCY)
+
+            async def fetch_details(job_id):
+                async with semaphore:
+                    try:
+                        return job_id, await fetch_job_details(client, job_id), None
+                    except Exception as e:
+                        return job_id, None, e
+
+            tasks = [asyncio.create_task(fetch_details(job_id)) for job_id in to_fetch]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    job_id, details, error = await next_done
+                    if error:
+                        print(f"⚠️  Error processing job {job_id}: {error}")
+                        continue
+
+                    job_data = to_fetch.pop(job_id)
+                    if details:
+                        job_data["description"] = details.get("description")
+                        if details.get("standardized_locations"):
+                            job_data["standardized_locations"] = details["standardized_locations"]
+                    else:
+                        job_data["description"] = None
+
+                    jobs_file.write(job_line(job_data))
+                    # So a hard kill loses at most the job being written
+                    jobs_file.flush()
+                    fetched_count += 1
+                    print(f"  [{fetched_count}/{len(tasks)}] 🆕 Fetched: {(job_data['title'] or 'Unknown')[:60]}")
+            except asyncio.CancelledError:
+                _interrupted()
+                for task in tasks:
+                    task.cancel()
+
+        # Leave out the jobs whose details failed or were never fetched
+        if to_fetch:
+            output["jobs"] = [job for job in output["jobs"] if job["eightfold_id"] not in to_fetch]
 
     # Save final output
     write_output(output)
@@ -306,6 +455,10 @@ def main():
     print(f"  Cache hit rate: {cached_count/(cached_count+fetched_count)*100:.1f}%" if (cached_count+fetched_count) > 0 else "  Cache hit rate: N/A")
 
 
+def main():
+    asyncio.run(scrape_async())
+
+
 def scrape_nvidia_jobs(force: bool = False) -> tuple[str, int, bool]:
     """
     Scrape NVIDIA jobs and store them in nvidia/nvidia.json.
@@ -313,9 +466,8 @@ def scrape_nvidia_jobs(force: bool = False) -> tuple[str, int, bool]:
     """
     if not force and OUTPUT_FILE.exists():
         try:
-            existing = load_output()
+            existing = load_meta()
             last_scraped_str = existing.get("last_scraped")
-            jobs = existing.get("jobs", [])
 
             if last_scraped_str:
                 try:
@@ -327,18 +479,16 @@ def scrape_nvidia_jobs(force: bool = False) -> tuple[str, int, bool]:
                         print(
                             f"Existing NVIDIA data scraped {hours_elapsed:.1f} hours ago. Reusing."
                         )
-                        return str(OUTPUT_FILE), len(jobs), False
+                        return str(OUTPUT_FILE), existing["count"], False
                 except Exception:
                     pass
-        except (OSError, json.JSONDecodeError):
+        except (OSError, orjson.JSONDecodeError):
             pass
 
     main()
 
     try:
-        data = load_output()
-        jobs = data.get("jobs", [])
-        return str(OUTPUT_FILE), len(jobs), True
+        return str(OUTPUT_FILE), load_meta()["count"], True
     except Exception:
         return str(OUTPUT_FILE), 0, True
 
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import csv
+import gzip
+from pathlib import Path
+from uuid import NAMESPACE_URL, uuid5
+
+from export_utils import FIELDNAMES, generate_job_id, generate_job_ids, write_jobs_csv
+
+
+def make_row(ats_id: str, title: str) -> dict[str, str]:
+    return {
+        "url": f"https://jobs.lever.co/acme/{ats_id}",
+        "title": title,
+        "location": "Paris",
+        "company": "Acme",
+        "ats_id": ats_id,
+        "id": f"id-{ats_id}",
+    }
+
+
+def read_rows(path: Path) -> list[dict[str, str]]:
+    with open(path, "r", encoding="utf-8", newline="") as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def test_job_ids_stay_uuid5_by_default():
+    url = "https://jobs.lever.co/acme/a"
+    assert generate_job_id("lever", url, "a") == str(
+        uuid5(NAMESPACE_URL, f"lever:a:{url}")
+    )
+
+
+def test_batched_job_ids_match_single_ids():
+    triples = [("lever", "https://jobs.lever.co/acme/a", "a"), ("", None, None)]
+    assert generate_job_ids(triples) == [generate_job_id(*t) for t in triples]
+    assert generate_job_id("", None, None) == str(uuid5(NAMESPACE_URL, "unknown::"))
+
+
+def test_first_write_has_no_diff(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+
+    assert write_jobs_csv(jobs_csv, [make_row("a", "Engineer")]) is None
+    assert read_rows(jobs_csv) == [make_row("a", "Engineer")]
+
+
+def test_diff_reports_new_updated_and_removed_jobs(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    write_jobs_csv(jobs_csv, [make_row("a", "Engineer"), make_row("b", "Designer")])
+
+    diff_path = write_jobs_csv(
+        jobs_csv, [make_row("a", "Senior Engineer"), make_row("c", "Recruiter")]
+    )
+
+    assert diff_path is not None
+    diff = read_rows(diff_path)
+    assert list(diff[0]) == [*FIELDNAMES, "status"]
+    assert {(row["ats_id"], row["status"]) for row in diff} == {
+        ("a", "updated"),
+        ("c", "new"),
+        ("b", "removed"),
+    }
+    assert read_rows(jobs_csv) == [make_row("a", "Senior Engineer"), make_row("c", "Recruiter")]
+    with gzip.open(tmp_path / "jobs_old.csv.gz", "rt", encoding="utf-8", newline="") as backup:
+        assert [row["ats_id"] for row in csv.DictReader(backup)] == ["a", "b"]
+
+
+def test_diff_files_are_numbered_and_latest_is_linked(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    write_jobs_csv(jobs_csv, [make_row("a", "Engineer")])
+
+    first = write_jobs_csv(jobs_csv, [make_row("b", "Designer")])
+    second = write_jobs_csv(jobs_csv, [make_row("c", "Recruiter")])
+
+    assert first.name == "jobs_diff_00000001.csv"
+    assert second.name == "jobs_diff_00000002.csv"
+    assert (tmp_path / "jobs_diff_latest.csv").resolve() == second.resolve()
+
+
+def test_unchanged_rows_produce_no_diff(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    rows = [make_row("a", "Engineer"), make_row("b", "Designer")]
+    write_jobs_csv(jobs_csv, rows)
+
+    assert write_jobs_csv(jobs_csv, rows) is None
+    assert not list(tmp_path.glob("jobs_diff_*.csv"))
+    assert read_rows(jobs_csv) == rows
+
+
+def test_empty_diff_creates_no_file(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    rows = [make_row("a", "Engineer"), make_row("b", "Designer")]
+    write_jobs_csv(jobs_csv, rows)
+    # Without the fingerprint the rows are diffed, and the diff comes out empty
+    jobs_csv.with_suffix(".fingerprint").unlink()
+
+    assert write_jobs_csv(jobs_csv, rows) is None
+    assert not list(tmp_path.glob("jobs_diff_*.csv"))
+    assert not (tmp_path / "jobs.csv.counter").exists()
+
+
+def test_edited_csv_is_diffed_even_if_rows_are_unchanged(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    rows = [make_row("a", "Engineer"), make_row("b", "Designer")]
+    write_jobs_csv(jobs_csv, rows)
+    with open(jobs_csv, "w", encoding="utf-8", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerow(rows[0])
+
+    diff_path = write_jobs_csv(jobs_csv, rows)
+
+    assert diff_path is not None
+    assert [(row["ats_id"], row["status"]) for row in read_rows(diff_path)] == [("b", "new")]
+
+
+def test_duplicate_jobs_are_written_once(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    rows = [make_row("a", "Engineer"), make_row("b", "Designer"), make_row("a", "Engineer II")]
+
+    write_jobs_csv(jobs_csv, rows)
+
+    assert read_rows(jobs_csv) == rows[:2]
+
+
+def test_missing_ats_id_falls_back_to_url(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    with open(jobs_csv, "w", encoding="utf-8", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=["url", "title", "location", "company", "id"])
+        writer.writeheader()
+        row = make_row("a", "Engineer")
+        del row["ats_id"]
+        writer.writerow(row)
+
+    assert write_jobs_csv(jobs_csv, [make_row("a", "Engineer")]) is None
+
+
+def test_unsorted_previous_csv_is_diffed_by_index(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    with open(jobs_csv, "w", encoding="utf-8", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerow(make_row("c", "Recruiter"))
+        writer.writerow(make_row("a", "Engineer"))
+
+    diff_path = write_jobs_csv(
+        jobs_csv, [make_row("a", "Senior Engineer"), make_row("c", "Recruiter")]
+    )
+
+    assert diff_path is not None
+    assert [(row["ats_id"], row["status"]) for row in read_rows(diff_path)] == [
+        ("a", "updated")
+    ]
+    assert not list(tmp_path.glob("*.tmp"))
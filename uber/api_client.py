@@ -26,7 +26,7 @@ class TimeType(Enum):
     PART_TIME = "Part-Time"
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Represents a job location"""
     country: str
@@ -45,7 +45,7 @@ class Location:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents a job posting"""
     id: int
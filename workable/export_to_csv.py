@@ -2,7 +2,7 @@ import json
 import sys
 from pathlib import Path
 
-from pydantic import ValidationError
+import msgspec
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
@@ -101,8 +101,8 @@ def main():
 
             for job_data in job_list:
                 try:
-                    job = WorkableJob(**job_data)
-                except ValidationError:
+                    job = msgspec.convert(job_data, WorkableJob, strict=False)
+                except msgspec.ValidationError:
                     continue
 
                 url = job.url or job.shortlink or job.application_url or ""